@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class AuditTrailsConfig(AppConfig):
+    name = "openzaak.audittrails"
+    label = "openzaak_audittrails"
@@ -0,0 +1,104 @@
+"""
+Export the audit trails of a month, before its partition is dropped.
+
+The audit trails are written as gzip compressed JSON lines, one audit trail
+per line, with the full ``oud`` and ``nieuw`` - compact audit trails are
+expanded, so the export can be read without the audit trails it was based on.
+"""
+import gzip
+import json
+import os
+from datetime import date, datetime, time, timezone
+from itertools import islice
+
+from django.contrib.postgres.fields.jsonb import KeyTextTransform, KeyTransform
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import CharField, Subquery
+from django.db.models.functions import Cast
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from .compact import COMPACT_KEY, expand_audittrails
+from .partitions import add_months, get_partition_name
+
+
+def _start(month: date) -> datetime:
+    # the same (UTC) bounds as the partitions, see partitions._bound
+    return datetime.combine(month, time.min, tzinfo=timezone.utc)
+
+
+def get_month_audittrails(month: date):
+    # filtering on aanmaakdatum only scans the partition of the month
+    return AuditTrail.objects.filter(
+        aanmaakdatum__gte=_start(month), aanmaakdatum__lt=_start(add_months(month, 1))
+    )
+
+
+def iter_batches(queryset, batch_size: int):
+    iterator = queryset.iterator(chunk_size=batch_size)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def to_dict(trail: AuditTrail) -> dict:
+    return {
+        field.attname: getattr(trail, field.attname)
+        for field in AuditTrail._meta.concrete_fields
+    }
+
+
+def export_month(month: date, directory: str, batch_size: int = 1000) -> str:
+    """
+    Write the audit trails of ``month`` to ``<partition>.jsonl.gz``.
+
+    The file is only put in place once it's completely written.
+    """
+    filename = os.path.join(directory, f"{get_partition_name(month)}.jsonl.gz")
+    tmp_filename = f"{filename}.tmp"
+
+    queryset = get_month_audittrails(month).order_by("aanmaakdatum", "pk")
+    with open(tmp_filename, "wb") as file:
+        with gzip.GzipFile(fileobj=file, mode="wb") as archive:
+            for batch in iter_batches(queryset, batch_size):
+                for trail in expand_audittrails(batch):
+                    line = json.dumps(to_dict(trail), cls=DjangoJSONEncoder)
+                    archive.write(f"{line}\n".encode("utf-8"))
+        file.flush()
+        os.fsync(file.fileno())
+
+    os.replace(tmp_filename, filename)
+    return filename
+
+
+@transaction.atomic
+def rebase_audittrails(month: date, batch_size: int = 1000) -> int:
+    """
+    Store ``oud`` in full for compact audit trails based on ``month``.
+
+    Compact audit trails of later months can be based on an audit trail of
+    ``month``, they must not depend on it anymore once it's dropped.
+    """
+    bases = get_month_audittrails(month).annotate(uuid_text=Cast("uuid", CharField()))
+    queryset = (
+        AuditTrail.objects.annotate(
+            basis=KeyTextTransform("basis", KeyTransform(COMPACT_KEY, "oud"))
+        )
+        .filter(
+            aanmaakdatum__gte=_start(add_months(month, 1)),
+            basis__in=Subquery(bases.values("uuid_text")),
+        )
+        .order_by("pk")
+    )
+
+    count = 0
+    for batch in iter_batches(queryset, batch_size):
+        # nieuw is stored relative to oud, which doesn't change, so only the
+        # expanded oud is saved
+        for trail in expand_audittrails(batch):
+            AuditTrail.objects.filter(pk=trail.pk).update(oud=trail.oud)
+        count += len(batch)
+    return count
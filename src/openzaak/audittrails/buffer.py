@@ -0,0 +1,76 @@
+import threading
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from .compact import compact_audittrail, get_latest_audittrail
+
+_local = threading.local()
+
+
+class AuditTrailBuffer:
+    """
+    Collect the audit trails written in a block and insert them in bulk.
+
+    Use it in the transaction of the changes, so the audit trails are stored
+    if, and only if, the changes are:
+
+        with transaction.atomic(), AuditTrailBuffer():
+            ...
+
+    Buffers can't be nested, the audit trails are inserted by the outermost
+    buffer.
+    """
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self.trails: List[AuditTrail] = []
+        # the latest audit trail of each resource, the basis of compact ones
+        self.latest: Dict[str, AuditTrail] = {}
+
+    @classmethod
+    def get_current(cls) -> Optional["AuditTrailBuffer"]:
+        return getattr(_local, "buffer", None)
+
+    def __enter__(self):
+        if self.get_current() is None:
+            _local.buffer = self
+        return self.get_current()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if _local.buffer is not self:
+            return
+
+        _local.buffer = None
+        if exc_type is None:
+            self.flush()
+
+    def add(self, trail: AuditTrail) -> None:
+        self.trails.append(trail)
+        self.latest[trail.resource_url] = trail
+        if len(self.trails) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        AuditTrail.objects.bulk_create(self.trails)
+        self.trails = []
+
+
+def store_audittrail(trail: AuditTrail) -> None:
+    """
+    Save a new audit trail, compacting it and buffering the insert if enabled.
+    """
+    buffer = AuditTrailBuffer.get_current()
+
+    if settings.AUDITTRAIL_COMPACT:
+        previous = buffer.latest.get(trail.resource_url) if buffer else None
+        if previous is None:
+            previous = get_latest_audittrail(trail.resource_url)
+        compact_audittrail(trail, previous)
+
+    if buffer is not None:
+        buffer.add(trail)
+    else:
+        trail.save()
@@ -0,0 +1,147 @@
+"""
+Compact storage of the changes recorded in the audit trail.
+
+With ``settings.AUDITTRAIL_COMPACT`` enabled, ``oud`` and ``nieuw`` are not
+stored as full snapshots of the resource for every write. Instead:
+
+* ``oud`` is stored as the changes relative to ``nieuw`` of the previous
+  audit trail of the same resource (its ``basis``)
+* ``nieuw`` is stored as the changes relative to ``oud``
+
+Every ``settings.AUDITTRAIL_SNAPSHOT_INTERVAL`` audit trails of a resource,
+``oud`` is stored in full again, which limits the number of audit trails
+needed to reconstruct one. Compact values are recognized by the
+``COMPACT_KEY``, so audit trails stored in full keep working.
+"""
+import json
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from vng_api_common.audittrails.models import AuditTrail
+
+COMPACT_KEY = "_compact"
+
+
+def normalize(data: Optional[dict]) -> Optional[dict]:
+    """
+    Convert ``data`` to what it is when read back from the database.
+    """
+    if data is None:
+        return None
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def get_changes(old: dict, new: dict) -> dict:
+    return {
+        "set": {
+            key: value
+            for key, value in new.items()
+            if key not in old or old[key] != value
+        },
+        "unset": [key for key in old if key not in new],
+    }
+
+
+def apply_changes(base: dict, changes: dict) -> dict:
+    data = {key: value for key, value in base.items() if key not in changes["unset"]}
+    data.update(changes["set"])
+    return data
+
+
+def is_compact(value) -> bool:
+    return isinstance(value, dict) and COMPACT_KEY in value
+
+
+def get_latest_audittrail(resource_url: str) -> Optional[AuditTrail]:
+    """
+    Return the latest audit trail of a resource, with its full data.
+    """
+    # the latest audit trails contain everything needed to reconstruct the
+    # latest one
+    trails = list(
+        AuditTrail.objects.filter(resource_url=resource_url).order_by(
+            "-aanmaakdatum", "-pk"
+        )[: settings.AUDITTRAIL_SNAPSHOT_INTERVAL]
+    )
+    if not trails:
+        return None
+
+    expand_audittrails(trails)
+    return trails[0]
+
+
+def compact_audittrail(trail: AuditTrail, previous: Optional[AuditTrail]) -> None:
+    """
+    Replace the full ``oud`` and ``nieuw`` of the new ``trail`` by their changes.
+
+    :param previous: the latest audit trail of the same resource, with its full
+      data
+    """
+    oud, nieuw = normalize(trail.oud), normalize(trail.nieuw)
+    trail.diepte = 0
+
+    if oud is not None and previous is not None and previous.full_nieuw is not None:
+        depth = previous.diepte + 1
+        if depth < settings.AUDITTRAIL_SNAPSHOT_INTERVAL:
+            trail.diepte = depth
+            trail.oud = {
+                COMPACT_KEY: {
+                    "basis": str(previous.uuid),
+                    "diepte": depth,
+                    "wijzigingen": get_changes(previous.full_nieuw, oud),
+                }
+            }
+
+    if oud is not None and nieuw is not None:
+        trail.nieuw = {COMPACT_KEY: {"wijzigingen": get_changes(oud, nieuw)}}
+
+    trail.full_oud, trail.full_nieuw = oud, nieuw
+
+
+def _reconstruct(trail: AuditTrail, trails_by_uuid: dict) -> None:
+    if hasattr(trail, "full_oud"):
+        return
+
+    # the number of audit trails needed to reconstruct oud
+    trail.diepte = 0
+
+    oud = trail.oud
+    if is_compact(oud):
+        trail.diepte = oud[COMPACT_KEY]["diepte"]
+        basis = trails_by_uuid[oud[COMPACT_KEY]["basis"]]
+        _reconstruct(basis, trails_by_uuid)
+        oud = apply_changes(basis.full_nieuw, oud[COMPACT_KEY]["wijzigingen"])
+
+    nieuw = trail.nieuw
+    if is_compact(nieuw):
+        nieuw = apply_changes(oud, nieuw[COMPACT_KEY]["wijzigingen"])
+
+    trail.full_oud, trail.full_nieuw = oud, nieuw
+
+
+def expand_audittrails(trails: Iterable[AuditTrail]) -> List[AuditTrail]:
+    """
+    Replace compact ``oud`` and ``nieuw`` values by the full data, in place.
+
+    The audit trails that are needed for the reconstruction, but aren't part of
+    ``trails``, are fetched from the database.
+    """
+    trails = list(trails)
+    trails_by_uuid = {str(trail.uuid): trail for trail in trails}
+
+    missing = trails
+    while missing:
+        bases = {
+            trail.oud[COMPACT_KEY]["basis"]
+            for trail in missing
+            if is_compact(trail.oud)
+        } - set(trails_by_uuid)
+        missing = list(AuditTrail.objects.filter(uuid__in=bases)) if bases else []
+        trails_by_uuid.update({str(trail.uuid): trail for trail in missing})
+
+    for trail in trails:
+        _reconstruct(trail, trails_by_uuid)
+        trail.oud, trail.nieuw = trail.full_oud, trail.full_nieuw
+    return trails
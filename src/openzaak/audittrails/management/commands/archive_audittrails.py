@@ -0,0 +1,65 @@
+import os
+
+from django.core.management import BaseCommand, CommandError
+
+from openzaak.audittrails.archive import export_month, rebase_audittrails
+from openzaak.audittrails.partitions import (
+    add_months,
+    drop_partition,
+    get_current_month,
+    get_partitions,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the audit trails of the months older than the retention period "
+        "to compressed JSON lines, and drop their partitions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention",
+            type=int,
+            required=True,
+            help="Number of complete months to keep, besides the current month",
+        )
+        parser.add_argument(
+            "--export-dir",
+            required=True,
+            help="Directory to write the exports (<partition>.jsonl.gz) to",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show which partitions would be archived",
+        )
+
+    def handle(self, retention, export_dir, dry_run, **options):
+        if not is_partitioned():
+            raise CommandError(
+                "The audit trail table is not partitioned, "
+                "run partition_audittrails --convert first"
+            )
+        if not os.path.isdir(export_dir):
+            raise CommandError(f"{export_dir} is not a directory")
+
+        cutoff = add_months(get_current_month(), -retention)
+        months = [month for month in get_partitions() if month < cutoff]
+        if not months:
+            self.stdout.write(f"No partitions before {cutoff:%Y-%m}")
+            return
+
+        for month in months:
+            if dry_run:
+                self.stdout.write(f"Would archive {month:%Y-%m}")
+                continue
+
+            filename = export_month(month, export_dir)
+            rebased = rebase_audittrails(month)
+            drop_partition(month)
+            self.stdout.write(
+                f"Archived {month:%Y-%m} to {filename}, "
+                f"{rebased} later audit trails no longer depend on it"
+            )
@@ -0,0 +1,52 @@
+from django.core.management import BaseCommand, CommandError
+
+from openzaak.audittrails.partitions import (
+    MINIMUM_SERVER_VERSION,
+    convert_table,
+    create_partitions,
+    is_partitioned,
+    supports_partitioning,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the monthly partitions of the audit trail table for the coming "
+        "months. Run this periodically, e.g. daily."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="Number of months after the current month to create partitions for",
+        )
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help=(
+                "Convert the (unpartitioned) audit trail table to a partitioned "
+                "table first. This copies all audit trails and locks the table."
+            ),
+        )
+
+    def handle(self, months_ahead, convert, **options):
+        if not supports_partitioning():
+            raise CommandError(
+                f"Partitioning requires PostgreSQL {MINIMUM_SERVER_VERSION // 10000} "
+                f"or later"
+            )
+
+        if convert:
+            if is_partitioned():
+                raise CommandError("The audit trail table is already partitioned")
+            convert_table(months_ahead)
+            self.stdout.write("Converted the audit trail table")
+        elif not is_partitioned():
+            raise CommandError(
+                "The audit trail table is not partitioned, use --convert first"
+            )
+
+        for month in create_partitions(months_ahead):
+            self.stdout.write(f"Created the partition for {month:%Y-%m}")
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are created concurrently, which can't be done in a transaction
+    atomic = False
+
+    dependencies = [("audittrails", "0010_audittrail_request_id")]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS audittrail_hoofd_object_idx "
+            "ON audittrails_audittrail (hoofd_object, aanmaakdatum)",
+            reverse_sql="DROP INDEX IF EXISTS audittrail_hoofd_object_idx",
+        ),
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS audittrail_hoofd_object_uuid_idx "
+            "ON audittrails_audittrail ((right(hoofd_object, 36)), aanmaakdatum)",
+            reverse_sql="DROP INDEX IF EXISTS audittrail_hoofd_object_uuid_idx",
+        ),
+    ]
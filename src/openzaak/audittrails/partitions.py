@@ -0,0 +1,204 @@
+"""
+Partition the audit trail table by month.
+
+The audit trails of all components are stored in the single table of
+:class:`vng_api_common.audittrails.models.AuditTrail`, which only grows. With
+the table partitioned on ``aanmaakdatum``, every month is a separate table
+with its own (small) indexes, and old months can be exported and dropped
+without a massive ``DELETE``.
+
+Declarative partitioning with primary keys, indexes and a default partition
+requires PostgreSQL 11. The conversion is done once with
+``manage.py partition_audittrails --convert``, since it copies all the audit
+trails. Because unique constraints of a partitioned table must contain the
+partition key, the primary key becomes ``(id, aanmaakdatum)`` and the unique
+constraint on ``uuid`` becomes ``(uuid, aanmaakdatum)``.
+
+The partition of a month must exist before the audit trails of that month are
+written, otherwise they end up in the default partition. Run
+``manage.py partition_audittrails`` periodically to create the partitions of
+the coming months - audit trails already in the default partition are moved.
+"""
+import re
+from datetime import date
+from typing import List, Optional
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from vng_api_common.audittrails.models import AuditTrail
+
+MINIMUM_SERVER_VERSION = 110000
+
+PARTITION_RE = re.compile(r"_p(?P<year>\d{4})(?P<month>\d{2})$")
+
+INDEXES = {
+    "audittrail_hoofd_object_idx": "(hoofd_object, aanmaakdatum)",
+    # the nested audittrails endpoints look up the audit trails by the UUID of
+    # the main object, which is the end of its URL
+    "audittrail_hoofd_object_uuid_idx": "((right(hoofd_object, 36)), aanmaakdatum)",
+}
+
+
+def get_table() -> str:
+    return AuditTrail._meta.db_table
+
+
+def get_default_partition() -> str:
+    return f"{get_table()}_default"
+
+
+def get_partition_name(month: date) -> str:
+    return f"{get_table()}_p{month:%Y%m}"
+
+
+def get_partition_month(name: str) -> Optional[date]:
+    match = PARTITION_RE.search(name)
+    if not match:
+        return None
+    return date(int(match.group("year")), int(match.group("month")), 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def get_current_month() -> date:
+    return timezone.now().date().replace(day=1)
+
+
+def _bound(month: date) -> str:
+    # partition bounds must be literals in PostgreSQL 11
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def supports_partitioning() -> bool:
+    return connection.pg_version >= MINIMUM_SERVER_VERSION
+
+
+def is_partitioned() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [get_table()]
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def get_partitions() -> List[date]:
+    """
+    Return the months that have a partition, in order.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "INNER JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s)",
+            [get_table()],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    months = (get_partition_month(name) for name in names)
+    return sorted(month for month in months if month is not None)
+
+
+@transaction.atomic
+def create_partition(month: date) -> bool:
+    """
+    Create the partition of ``month``, unless it exists.
+
+    The audit trails of the month that were stored in the default partition
+    are moved to the new partition.
+    """
+    table = get_table()
+    partition = get_partition_name(month)
+    start, end = _bound(month), _bound(add_months(month, 1))
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [partition])
+        if cursor.fetchone()[0] is not None:
+            return False
+
+        cursor.execute(
+            f"CREATE TABLE {partition} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING STORAGE)"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {get_default_partition()} "
+            f"WHERE aanmaakdatum >= {start} AND aanmaakdatum < {end} RETURNING *) "
+            f"INSERT INTO {partition} SELECT * FROM moved"
+        )
+        # the indexes and constraints of the parent are created on attaching
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+    return True
+
+
+def create_partitions(months_ahead: int) -> List[date]:
+    """
+    Create the partitions of the current month and ``months_ahead`` next ones.
+    """
+    current = get_current_month()
+    months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+    return [month for month in months if create_partition(month)]
+
+
+@transaction.atomic
+def convert_table(months_ahead: int) -> None:
+    """
+    Replace the audit trail table by a table partitioned by month.
+
+    All audit trails are copied, with a partition for every month since the
+    first audit trail. The table is locked during the conversion.
+    """
+    table = get_table()
+    old_table = f"{table}_unpartitioned"
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+        cursor.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {old_table} INCLUDING DEFAULTS INCLUDING STORAGE) "
+            f"PARTITION BY RANGE (aanmaakdatum)"
+        )
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [old_table])
+        (sequence,) = cursor.fetchone()
+        cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+        cursor.execute(
+            f"CREATE TABLE {get_default_partition()} PARTITION OF {table} DEFAULT"
+        )
+        cursor.execute(f"SELECT min(aanmaakdatum) FROM {old_table}")
+        (first,) = cursor.fetchone()
+
+    current = get_current_month()
+    month = first.date().replace(day=1) if first else current
+    while month <= add_months(current, months_ahead):
+        create_partition(month)
+        month = add_months(month, 1)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")
+        cursor.execute(f"DROP TABLE {old_table}")
+
+        # building the indexes after copying the data is a lot faster
+        cursor.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, aanmaakdatum)")
+        cursor.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_uuid_key "
+            f"UNIQUE (uuid, aanmaakdatum)"
+        )
+        for name, columns in INDEXES.items():
+            cursor.execute(f"CREATE INDEX {name} ON {table} {columns}")
+
+
+@transaction.atomic
+def drop_partition(month: date) -> None:
+    table = get_table()
+    partition = get_partition_name(month)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+        cursor.execute(f"DROP TABLE {partition}")
@@ -0,0 +1,175 @@
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..buffer import AuditTrailBuffer, store_audittrail
+from ..compact import (
+    COMPACT_KEY,
+    apply_changes,
+    expand_audittrails,
+    get_changes,
+    is_compact,
+)
+
+
+class ChangesTests(SimpleTestCase):
+    def test_round_trip(self):
+        old = {"url": "https://zaak/1", "toelichting": "", "einddatum": None}
+        new = {"url": "https://zaak/1", "toelichting": "aangepast", "status": "s"}
+
+        changes = get_changes(old, new)
+
+        self.assertEqual(
+            changes,
+            {
+                "set": {"toelichting": "aangepast", "status": "s"},
+                "unset": ["einddatum"],
+            },
+        )
+        self.assertEqual(apply_changes(old, changes), new)
+
+
+@override_settings(AUDITTRAIL_COMPACT=True, AUDITTRAIL_SNAPSHOT_INTERVAL=3)
+class CompactAuditTrailTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def _create_zaak(self) -> dict:
+        zaaktype = ZaakTypeFactory.create()
+        response = self.client.post(
+            reverse(Zaak),
+            {
+                "zaaktype": reverse(zaaktype),
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                "bronorganisatie": "517439943",
+                "verantwoordelijkeOrganisatie": "517439943",
+                "registratiedatum": "2018-12-24",
+                "startdatum": "2018-12-24",
+            },
+            **ZAAK_WRITE_KWARGS,
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data
+
+    def _update_zaak(self, url: str, toelichting: str) -> dict:
+        response = self.client.patch(
+            url, {"toelichting": toelichting}, **ZAAK_WRITE_KWARGS
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_changes_stored_compact(self):
+        zaak_data = self._create_zaak()
+        versions = [zaak_data]
+        for i in range(4):
+            versions.append(self._update_zaak(zaak_data["url"], f"versie {i}"))
+
+        trails = list(AuditTrail.objects.order_by("pk"))
+        # create: full nieuw
+        self.assertFalse(is_compact(trails[0].nieuw))
+        # updates: compact nieuw, and oud based on the previous audit trail,
+        # with a full oud every AUDITTRAIL_SNAPSHOT_INTERVAL audit trails
+        self.assertEqual(
+            [is_compact(trail.oud) for trail in trails[1:]], [True, True, False, True]
+        )
+        self.assertTrue(all(is_compact(trail.nieuw) for trail in trails[1:]))
+        self.assertEqual(
+            trails[1].nieuw[COMPACT_KEY]["wijzigingen"],
+            {"set": {"toelichting": "versie 0"}, "unset": []},
+        )
+
+        expand_audittrails(trails)
+        for trail, oud, nieuw in zip(trails[1:], versions, versions[1:]):
+            with self.subTest(trail=trail):
+                self.assertEqual(trail.oud, oud)
+                self.assertEqual(trail.nieuw, nieuw)
+
+    def test_read_full_changes(self):
+        zaak_data = self._create_zaak()
+        self._update_zaak(zaak_data["url"], "versie 1")
+        self._update_zaak(zaak_data["url"], "versie 2")
+        last = AuditTrail.objects.order_by("pk").last()
+
+        list_response = self.client.get(f"{zaak_data['url']}/audittrail")
+        detail_response = self.client.get(f"{zaak_data['url']}/audittrail/{last.uuid}")
+
+        self.assertEqual(list_response.status_code, status.HTTP_200_OK)
+        changes = [item["wijzigingen"] for item in list_response.json()]
+        self.assertEqual(changes[2]["oud"]["toelichting"], "versie 1")
+        self.assertEqual(changes[2]["nieuw"]["toelichting"], "versie 2")
+        self.assertEqual(changes[2]["nieuw"]["url"], zaak_data["url"])
+
+        self.assertEqual(detail_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(detail_response.json()["wijzigingen"], changes[2])
+
+    @override_settings(AUDITTRAIL_COMPACT=False)
+    def test_full_changes_stored_by_default(self):
+        zaak_data = self._create_zaak()
+        updated = self._update_zaak(zaak_data["url"], "aangepast")
+
+        trail = AuditTrail.objects.order_by("pk").last()
+        self.assertEqual(trail.oud, zaak_data)
+        self.assertEqual(trail.nieuw, updated)
+
+
+@override_settings(AUDITTRAIL_COMPACT=True)
+class AuditTrailBufferTests(TestCase):
+    def _get_trail(self, **kwargs) -> AuditTrail:
+        return AuditTrail(
+            bron="ZRC",
+            actie="partial_update",
+            resultaat=200,
+            hoofd_object="https://zaak/1",
+            resource="zaak",
+            resource_url="https://zaak/1",
+            resource_weergave="zaak 1",
+            **kwargs,
+        )
+
+    def test_inserted_in_bulk(self):
+        store_audittrail(self._get_trail(nieuw={"url": "https://zaak/1", "a": 1}))
+
+        with CaptureQueriesContext(connection) as queries:
+            with AuditTrailBuffer():
+                store_audittrail(
+                    self._get_trail(
+                        oud={"url": "https://zaak/1", "a": 1},
+                        nieuw={"url": "https://zaak/1", "a": 2},
+                    )
+                )
+                store_audittrail(
+                    self._get_trail(
+                        oud={"url": "https://zaak/1", "a": 2},
+                        nieuw={"url": "https://zaak/1", "a": 3},
+                    )
+                )
+                self.assertEqual(AuditTrail.objects.count(), 1)
+
+        inserts = [
+            query for query in queries.captured_queries if "INSERT" in query["sql"]
+        ]
+        self.assertEqual(len(inserts), 1)
+
+        trails = expand_audittrails(AuditTrail.objects.order_by("pk"))
+        self.assertEqual(len(trails), 3)
+        self.assertEqual(trails[2].oud, {"url": "https://zaak/1", "a": 2})
+        self.assertEqual(trails[2].nieuw, {"url": "https://zaak/1", "a": 3})
+
+    def test_discarded_on_error(self):
+        with self.assertRaises(ValueError):
+            with AuditTrailBuffer():
+                store_audittrail(self._get_trail(nieuw={"url": "https://zaak/1"}))
+                raise ValueError
+
+        self.assertFalse(AuditTrail.objects.exists())
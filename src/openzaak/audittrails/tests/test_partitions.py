@@ -0,0 +1,156 @@
+import gzip
+import json
+import tempfile
+import uuid
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.models.tests.factories import ZaakFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..buffer import store_audittrail
+from ..compact import COMPACT_KEY
+from ..partitions import (
+    MINIMUM_SERVER_VERSION,
+    add_months,
+    get_partition_month,
+    get_partition_name,
+    get_partitions,
+    is_partitioned,
+)
+
+
+class MonthTests(SimpleTestCase):
+    def test_add_months(self):
+        self.assertEqual(add_months(date(2019, 11, 1), 2), date(2020, 1, 1))
+        self.assertEqual(add_months(date(2019, 1, 1), -1), date(2018, 12, 1))
+
+    def test_partition_name(self):
+        name = get_partition_name(date(2019, 8, 1))
+
+        self.assertEqual(name, "audittrails_audittrail_p201908")
+        self.assertEqual(get_partition_month(name), date(2019, 8, 1))
+        self.assertIsNone(get_partition_month("audittrails_audittrail_default"))
+
+
+class NestedLookupTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_only_audittrails_of_main_object(self):
+        zaak1, zaak2 = ZaakFactory.create(), ZaakFactory.create()
+        for zaak in (zaak1, zaak2):
+            url = f"http://testserver{reverse(zaak)}"
+            AuditTrail.objects.create(
+                bron="ZRC",
+                actie="create",
+                resultaat=201,
+                hoofd_object=url,
+                resource="zaak",
+                resource_url=url,
+            )
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak1.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(
+            response.json()[0]["hoofdObject"], f"http://testserver{reverse(zaak1)}"
+        )
+
+    def test_unknown_main_object(self):
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": uuid.uuid4()})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(AUDITTRAIL_COMPACT=True)
+class PartitionTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        if connection.pg_version < MINIMUM_SERVER_VERSION:
+            self.skipTest("Partitioning requires PostgreSQL 11")
+
+    def _store_trail(self, **kwargs):
+        store_audittrail(
+            AuditTrail(
+                bron="ZRC",
+                actie="partial_update",
+                resultaat=200,
+                hoofd_object="https://zaak/1",
+                resource="zaak",
+                resource_url="https://zaak/1",
+                **kwargs,
+            )
+        )
+
+    def test_convert_and_archive(self):
+        with freeze_time("2019-06-15"):
+            self._store_trail(oud={"a": 1}, nieuw={"a": 2})
+        with freeze_time("2019-08-15"):
+            self._store_trail(oud={"a": 2}, nieuw={"a": 3})
+
+            call_command(
+                "partition_audittrails", convert=True, months_ahead=1, stdout=StringIO()
+            )
+
+        self.assertTrue(is_partitioned())
+        self.assertEqual(
+            get_partitions(),
+            [date(2019, 6, 1), date(2019, 7, 1), date(2019, 8, 1), date(2019, 9, 1)],
+        )
+        self.assertEqual(AuditTrail.objects.count(), 2)
+        later = AuditTrail.objects.get(aanmaakdatum__month=8)
+        self.assertIn(COMPACT_KEY, later.oud)
+
+        export_dir = tempfile.mkdtemp()
+        with freeze_time("2019-09-01"):
+            call_command(
+                "archive_audittrails",
+                retention=2,
+                export_dir=export_dir,
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(
+            get_partitions(), [date(2019, 7, 1), date(2019, 8, 1), date(2019, 9, 1)]
+        )
+        with gzip.open(f"{export_dir}/audittrails_audittrail_p201906.jsonl.gz") as f:
+            exported = [json.loads(line) for line in f]
+        self.assertEqual(len(exported), 1)
+        self.assertEqual(exported[0]["nieuw"], {"a": 2})
+
+        # the remaining audit trail no longer depends on the dropped one
+        later = AuditTrail.objects.get()
+        self.assertEqual(later.oud, {"a": 2})
+        self.assertIn(COMPACT_KEY, later.nieuw)
+
+    def test_default_partition_moved(self):
+        with freeze_time("2019-08-15"):
+            call_command(
+                "partition_audittrails", convert=True, months_ahead=0, stdout=StringIO()
+            )
+            self.assertEqual(get_partitions(), [date(2019, 8, 1)])
+
+        with freeze_time("2019-09-15"):
+            self._store_trail(oud={"a": 1}, nieuw={"a": 2})
+            call_command("partition_audittrails", months_ahead=0, stdout=StringIO())
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM audittrails_audittrail_p201909")
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute("SELECT count(*) FROM audittrails_audittrail_default")
+            self.assertEqual(cursor.fetchone()[0], 0)
@@ -0,0 +1,135 @@
+"""
+Audit trail mixins with compact and buffered storage.
+
+Drop-in replacements for the mixins and viewset of
+:mod:`vng_api_common.audittrails.viewsets`, storing the audit trails with
+:func:`openzaak.audittrails.buffer.store_audittrail` and reconstructing the
+full ``oud`` and ``nieuw`` of compact audit trails when they are read.
+"""
+import logging
+
+from django.db.models.functions import Right
+from django.http import Http404
+
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.audittrails.viewsets import (
+    AuditTrailCreateMixin as _AuditTrailCreateMixin,
+    AuditTrailDestroyMixin as _AuditTrailDestroyMixin,
+    AuditTrailMixin as _AuditTrailMixin,
+    AuditTrailUpdateMixin as _AuditTrailUpdateMixin,
+    AuditTrailViewSet as _AuditTrailViewSet,
+)
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+
+from .buffer import store_audittrail
+from .compact import expand_audittrails
+
+logger = logging.getLogger(__name__)
+
+
+class AuditTrailMixin(_AuditTrailMixin):
+    def create_audittrail(
+        self,
+        status_code,
+        action,
+        version_before_edit,
+        version_after_edit,
+        unique_representation,
+    ):
+        """
+        Create the audittrail for the action that has been carried out.
+        """
+        data = version_after_edit if version_after_edit else version_before_edit
+        if self.basename == self.audit.main_resource:
+            main_object = data["url"]
+        else:
+            main_object = self.get_audittrail_main_object_url(
+                data, self.audit.main_resource
+            )
+
+        applications = self.request.jwt_auth.applicaties
+        if len(applications) > 1:
+            logger.warning(
+                "Unexpectedly found %d applications, expected at most one",
+                len(applications),
+            )
+
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id  # we don't have any extra information...
+
+        user_id = self.request.jwt_auth.payload.get("user_id", "")
+        if not user_id:
+            user_id = get_header(self.request, "X-NLX-Request-User-Id") or ""
+
+        request_id = get_header(self.request, "X-NLX-Request-Id") or ""
+
+        toelichting = get_header(self.request, "X-Audit-Toelichting") or ""
+
+        trail = AuditTrail(
+            bron=self.audit.component_name,
+            request_id=request_id,
+            applicatie_id=app_id,
+            applicatie_weergave=app_presentation,
+            actie=action,
+            actie_weergave=CommonResourceAction.labels.get(action, ""),
+            gebruikers_id=user_id,
+            gebruikers_weergave=self.request.jwt_auth.payload.get(
+                "user_representation", ""
+            ),
+            resultaat=status_code,
+            hoofd_object=main_object,
+            resource=self.basename,
+            resource_url=data["url"],
+            toelichting=toelichting,
+            resource_weergave=unique_representation,
+            oud=version_before_edit,
+            nieuw=version_after_edit,
+        )
+        store_audittrail(trail)
+
+
+class AuditTrailCreateMixin(AuditTrailMixin, _AuditTrailCreateMixin):
+    pass
+
+
+class AuditTrailUpdateMixin(AuditTrailMixin, _AuditTrailUpdateMixin):
+    pass
+
+
+class AuditTrailDestroyMixin(AuditTrailMixin, _AuditTrailDestroyMixin):
+    pass
+
+
+class AuditTrailViewsetMixin(
+    AuditTrailCreateMixin, AuditTrailUpdateMixin, AuditTrailDestroyMixin
+):
+    pass
+
+
+class AuditTrailViewSet(_AuditTrailViewSet):
+    def get_queryset(self):
+        # skip the ``hoofd_object__contains`` filter of vng-api-common, which
+        # can't use an index
+        qs = super(_AuditTrailViewSet, self).get_queryset()
+        identifier = self.kwargs.get(self.main_resource_lookup_field)
+        if not identifier:
+            return qs
+
+        # the main object URL ends with its UUID, matching the expression of
+        # the ``audittrail_hoofd_object_uuid_idx`` index
+        filtered = qs.annotate(hoofd_object_uuid=Right("hoofd_object", 36)).filter(
+            hoofd_object_uuid=identifier
+        )
+        if not filtered.exists():
+            raise Http404
+        return filtered
+
+    def get_serializer(self, instance=None, *args, **kwargs):
+        if instance is not None:
+            expand_audittrails(instance if kwargs.get("many") else [instance])
+        return super().get_serializer(instance, *args, **kwargs)
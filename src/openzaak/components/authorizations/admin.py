@@ -1,5 +1,67 @@
 from django.contrib import admin
+from django.db import transaction
 
-from vng_api_common.authorizations.models import AuthorizationsConfig
+from vng_api_common.authorizations.admin import (
+    ApplicatieAdmin as _ApplicatieAdmin,
+    AutorisatieAdmin as _AutorisatieAdmin,
+)
+from vng_api_common.authorizations.models import (
+    Applicatie,
+    AuthorizationsConfig,
+    Autorisatie,
+)
+
+from .cache import invalidate_authorizations
 
 admin.site.unregister(AuthorizationsConfig)
+admin.site.unregister(Applicatie)
+admin.site.unregister(Autorisatie)
+
+
+@admin.register(Applicatie)
+class ApplicatieAdmin(_ApplicatieAdmin):
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        client_ids = list(form.instance.client_ids)
+        if "client_ids" in form.initial:
+            client_ids += form.initial["client_ids"] or []
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def delete_model(self, request, obj):
+        client_ids = list(obj.client_ids)
+        super().delete_model(request, obj)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def delete_queryset(self, request, queryset):
+        client_ids = [
+            client_id
+            for client_ids in queryset.values_list("client_ids", flat=True)
+            for client_id in client_ids
+        ]
+        super().delete_queryset(request, queryset)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+
+@admin.register(Autorisatie)
+class AutorisatieAdmin(_AutorisatieAdmin):
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        client_ids = list(obj.applicatie.client_ids)
+        if "applicatie" in form.changed_data and form.initial.get("applicatie"):
+            previous = Applicatie.objects.get(pk=form.initial["applicatie"])
+            client_ids += previous.client_ids
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def delete_model(self, request, obj):
+        client_ids = list(obj.applicatie.client_ids)
+        super().delete_model(request, obj)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def delete_queryset(self, request, queryset):
+        client_ids = [
+            client_id
+            for client_ids in queryset.values_list("applicatie__client_ids", flat=True)
+            for client_id in client_ids
+        ]
+        super().delete_queryset(request, queryset)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
@@ -1,16 +1,19 @@
 import logging
 
+from django.db import transaction
+
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.authorizations.models import Applicatie
 from vng_api_common.authorizations.serializers import ApplicatieSerializer
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
+from ..cache import invalidate_authorizations
 from ._schema_overrides import ApplicatieConsumerAutoSchema
 from .filters import ApplicatieFilter, ApplicatieRetrieveFilter
 from .kanalen import KANAAL_AUTORISATIES
@@ -94,7 +97,7 @@ class ApplicatieViewSet(NotificationViewSetMixin, viewsets.ModelViewSet):
     queryset = Applicatie.objects.prefetch_related("autorisaties").order_by("-pk")
     serializer_class = ApplicatieSerializer
     _filterset_class = ApplicatieFilter
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     lookup_field = "uuid"
     permission_classes = (AuthRequired,)
     required_scopes = {
@@ -132,6 +135,23 @@ class ApplicatieViewSet(NotificationViewSetMixin, viewsets.ModelViewSet):
             return None
         return super().paginator
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        client_ids = list(serializer.instance.client_ids)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def perform_update(self, serializer):
+        # the client_ids may change, invalidate the old and the new ones
+        client_ids = list(serializer.instance.client_ids)
+        super().perform_update(serializer)
+        client_ids += serializer.instance.client_ids
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
+    def perform_destroy(self, instance):
+        client_ids = list(instance.client_ids)
+        super().perform_destroy(instance)
+        transaction.on_commit(lambda: invalidate_authorizations(client_ids))
+
     @swagger_auto_schema(auto_schema=ApplicatieConsumerAutoSchema)
     @action(methods=("get",), detail=False)
     def consumer(self, request, *args, **kwargs):
@@ -0,0 +1,97 @@
+"""
+Shared (cross-request) cache of the authorizations of a client.
+
+The applicaties and autorisaties of a ``client_id`` are read on every API
+request, but they rarely change. They are cached per ``client_id`` in the
+``settings.AUTORISATIES_CACHE`` cache, and invalidated explicitly whenever an
+applicatie or autorisatie is written through the API or the admin. The
+invalidation must run once the write is committed, otherwise a concurrent
+request can cache the old rows again. The cache must therefore be shared by
+the processes, which is verified by a system check.
+``settings.AUTORISATIES_CACHE_TIMEOUT`` is a safety net for missed writes; it
+is ``0`` (the cache is disabled) by default.
+"""
+import logging
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "openzaak:autorisaties"
+
+STATS_KEYS = {
+    "hits": f"{KEY_PREFIX}:stats:hits",
+    "misses": f"{KEY_PREFIX}:stats:misses",
+}
+
+Authorizations = Tuple[List[Applicatie], List[Autorisatie]]
+
+
+def _get_cache():
+    return caches[settings.AUTORISATIES_CACHE]
+
+
+def get_cache_key(client_id: str) -> str:
+    return f"{KEY_PREFIX}:client:{client_id}"
+
+
+def _incr(stat: str) -> None:
+    cache = _get_cache()
+    key = STATS_KEYS[stat]
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the counter does not exist (yet)
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_authorizations(
+    client_id: str, loader: Callable[[], Authorizations]
+) -> Authorizations:
+    """
+    Retrieve the (applicaties, autorisaties) of a client, from the cache if possible.
+
+    :param client_id: the client_id from the JWT
+    :param loader: callable to load the authorizations from the database on a
+      cache miss
+    """
+    timeout = settings.AUTORISATIES_CACHE_TIMEOUT
+    if not timeout:
+        return loader()
+
+    cache = _get_cache()
+    key = get_cache_key(client_id)
+
+    cached = cache.get(key)
+    if cached is not None:
+        _incr("hits")
+        return cached
+
+    _incr("misses")
+    authorizations = loader()
+    cache.set(key, authorizations, timeout)
+    return authorizations
+
+
+def invalidate_authorizations(client_ids: Iterable[str]) -> None:
+    keys = [get_cache_key(client_id) for client_id in set(client_ids)]
+    if not keys:
+        return
+
+    logger.debug("Invalidating cached authorizations for %d client(s)", len(keys))
+    _get_cache().delete_many(keys)
+
+
+def get_stats() -> Dict[str, int]:
+    cache = _get_cache()
+    values = cache.get_many(STATS_KEYS.values())
+    return {stat: values.get(key, 0) for stat, key in STATS_KEYS.items()}
+
+
+def reset_stats() -> None:
+    _get_cache().delete_many(STATS_KEYS.values())
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from ...cache import get_stats, reset_stats
+
+
+class Command(BaseCommand):
+    help = "Show the hit/miss statistics of the authorizations cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the statistics afterwards"
+        )
+
+    def handle(self, **options):
+        if not settings.AUTORISATIES_CACHE_TIMEOUT:
+            self.stdout.write("The authorizations cache is disabled")
+
+        stats = get_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0
+
+        self.stdout.write(f"hits: {stats['hits']}")
+        self.stdout.write(f"misses: {stats['misses']}")
+        self.stdout.write(f"hit ratio: {ratio:.2%}")
+
+        if options["reset"]:
+            reset_stats()
@@ -1,15 +1,17 @@
-from typing import List, Union
-
-from django.db import models
-from django.db.models import Subquery
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
 
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
-from vng_api_common.constants import ComponentTypes
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
 
+from openzaak.utils.data_filtering import get_resource_pks
+
+from .cache import get_authorizations
+
 COMPONENT_MAPPING = {
     "authorizations": ComponentTypes.ac,
     "zaken": ComponentTypes.zrc,
@@ -18,22 +20,120 @@ COMPONENT_MAPPING = {
     "besluiten": ComponentTypes.brc,
 }
 
+# the Autorisatie fields that scope an authorization to a particular catalogi
+# resource, used to index the authorizations
+TYPE_FIELDS = ("zaaktype", "informatieobjecttype", "besluittype")
+
 
 class JWTAuth(_JWTAuth):
+    """
+    Resolve the authorizations of the client once per request.
+
+    The applicaties and autorisaties of the client are loaded on first use and
+    kept in an in-memory index, keyed by component and by (component, type
+    field, type URL). Subsequent ``has_auth`` and ``get_autorisaties`` calls
+    within the same request don't hit the database.
+
+    Across requests, the applicaties and autorisaties of a client are kept in
+    the shared authorizations cache, see :mod:`.cache`.
+    """
+
     component = None
 
+    def __init__(self, encoded: str = None):
+        super().__init__(encoded)
+        self._authorizations = None
+        self._autorisaties_index = None
+        self._resource_pks = {}
+
     def _request_auth(self) -> list:
         return []
 
-    def get_autorisaties(self, init_component: str) -> models.QuerySet:
+    def _load_authorizations(self) -> Tuple[List[Applicatie], List[Autorisatie]]:
+        applicaties = list(super().applicaties)
+        autorisaties = list(
+            Autorisatie.objects.filter(
+                applicatie_id__in=[app.id for app in applicaties]
+            )
+        )
+        return applicaties, autorisaties
+
+    @property
+    def authorizations(self) -> Tuple[List[Applicatie], List[Autorisatie]]:
+        if self._authorizations is None:
+            if self.client_id is None:
+                self._authorizations = ([], [])
+            else:
+                self._authorizations = get_authorizations(
+                    self.client_id, self._load_authorizations
+                )
+        return self._authorizations
+
+    @property
+    def applicaties(self) -> List[Applicatie]:
+        return self.authorizations[0]
+
+    @property
+    def autorisaties_index(self) -> Dict[Tuple, List[Autorisatie]]:
+        if self._autorisaties_index is None:
+            index = defaultdict(list)
+            for autorisatie in self.authorizations[1]:
+                index[(autorisatie.component,)].append(autorisatie)
+                for field_name in TYPE_FIELDS:
+                    value = getattr(autorisatie, field_name)
+                    if value:
+                        key = (autorisatie.component, field_name, value)
+                        index[key].append(autorisatie)
+            self._autorisaties_index = dict(index)
+        return self._autorisaties_index
+
+    def get_autorisaties(self, init_component: str) -> List[Autorisatie]:
         """
         Retrieve all authorizations relevant to this component.
         """
         component = COMPONENT_MAPPING.get(init_component, init_component)
-        app_ids = self.applicaties.values("id")
-        return Autorisatie.objects.filter(
-            applicatie_id__in=Subquery(app_ids), component=component
-        )
+        return self.autorisaties_index.get((component,), [])
+
+    def get_resource_pks(self, urls: Iterable[str]) -> Dict[str, int]:
+        """
+        Resolve (catalogi) resource URLs to primary keys, once per request.
+        """
+        urls = set(urls)
+        missing = urls - set(self._resource_pks)
+        if missing:
+            resolved = get_resource_pks(missing)
+            self._resource_pks.update({url: resolved.get(url) for url in missing})
+        return {
+            url: self._resource_pks[url]
+            for url in urls
+            if self._resource_pks[url] is not None
+        }
+
+    def filter_vertrouwelijkheidaanduiding(
+        self, base: List[Autorisatie], value
+    ) -> List[Autorisatie]:
+        if value is None:
+            return base
+
+        order_provided = VertrouwelijkheidsAanduiding.get_choice(value).order
+        choices = VertrouwelijkheidsAanduiding.values
+        return [
+            autorisatie
+            for autorisatie in base
+            if autorisatie.max_vertrouwelijkheidaanduiding in choices
+            and VertrouwelijkheidsAanduiding.get_choice(
+                autorisatie.max_vertrouwelijkheidaanduiding
+            ).order
+            >= order_provided
+        ]
+
+    def filter_default(self, base: List[Autorisatie], name, value) -> List[Autorisatie]:
+        if value is None:
+            return base
+
+        return [
+            autorisatie for autorisatie in base if getattr(autorisatie, name) == value
+        ]
 
     def has_auth(self, scopes: List[str], init_component: str = None, **fields) -> bool:
         if scopes is None:
@@ -43,14 +143,21 @@ class JWTAuth(_JWTAuth):
             return False
 
         # allow everything
-        if self.applicaties.filter(heeft_alle_autorisaties=True).exists():
+        if any(app.heeft_alle_autorisaties for app in self.applicaties):
             return True
 
         if not init_component:
             return False
 
-        autorisaties = self.get_autorisaties(init_component)
-        scopes_provided = set()
+        component = COMPONENT_MAPPING.get(init_component, init_component)
+        autorisaties = self.get_autorisaties(component)
+
+        # narrow down on the index first, if a catalogi resource is given
+        for field_name in TYPE_FIELDS:
+            if fields.get(field_name) is not None:
+                key = (component, field_name, fields[field_name])
+                autorisaties = self.autorisaties_index.get(key, [])
+                break
 
         # filter on all additional components
         for field_name, field_value in fields.items():
@@ -63,6 +170,7 @@ class JWTAuth(_JWTAuth):
                     autorisaties, field_name, field_value
                 )
 
+        scopes_provided = set()
         for autorisatie in autorisaties:
             scopes_provided.update(autorisatie.scopes)
 
@@ -0,0 +1,159 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth
+
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_AUTORISATIES_BIJWERKEN
+from ..api.tests.utils import get_operation_url
+from ..cache import get_stats
+from ..middleware import JWTAuth
+from ..models.tests.factories import ApplicatieFactory, AutorisatieFactory
+
+ZAAKTYPE = "https://example.com/zaaktypen/1"
+
+
+def get_jwt_auth(client_id: str) -> JWTAuth:
+    token = generate_jwt_auth(client_id=client_id, secret="letmein")
+    return JWTAuth(token[len("Bearer ") :])
+
+
+def run_on_commit(func):
+    # the transactions of the test cases are never committed
+    func()
+
+
+@override_settings(AUTORISATIES_CACHE_TIMEOUT=60)
+@patch("django.db.transaction.on_commit", run_on_commit)
+class AuthorizationsCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [str(SCOPE_AUTORISATIES_BIJWERKEN)]
+    component = ComponentTypes.ac
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="cached", secret="letmein")
+        cls.applicatie = ApplicatieFactory.create(client_ids=["cached"])
+        cls.autorisatie = AutorisatieFactory.create(
+            applicatie=cls.applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=ZAAKTYPE,
+            scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+    def setUp(self):
+        caches["default"].clear()
+        super().setUp()
+
+    def test_authorizations_cached_across_requests(self):
+        # JWT secret, applicaties and autorisaties
+        with self.assertNumQueries(3):
+            self.assertTrue(
+                get_jwt_auth("cached").has_auth(
+                    SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=ZAAKTYPE
+                )
+            )
+
+        # only the JWT secret to validate the token
+        with self.assertNumQueries(1):
+            self.assertTrue(
+                get_jwt_auth("cached").has_auth(
+                    SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=ZAAKTYPE
+                )
+            )
+
+        self.assertEqual(get_stats(), {"hits": 1, "misses": 1})
+
+    def test_invalidated_on_api_update(self):
+        self.assertFalse(
+            get_jwt_auth("cached").has_auth(
+                SCOPE_ZAKEN_BIJWERKEN, "zaken", zaaktype=ZAAKTYPE
+            )
+        )
+        url = get_operation_url("applicatie_partial_update", uuid=self.applicatie.uuid)
+
+        response = self.client.patch(
+            url,
+            {
+                "autorisaties": [
+                    {
+                        "component": ComponentTypes.zrc,
+                        "scopes": [str(SCOPE_ZAKEN_BIJWERKEN)],
+                        "zaaktype": ZAAKTYPE,
+                        "maxVertrouwelijkheidaanduiding": (
+                            VertrouwelijkheidsAanduiding.geheim
+                        ),
+                    }
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertTrue(
+            get_jwt_auth("cached").has_auth(
+                SCOPE_ZAKEN_BIJWERKEN, "zaken", zaaktype=ZAAKTYPE
+            )
+        )
+
+    def test_invalidated_on_client_id_change(self):
+        self.assertTrue(get_jwt_auth("cached").applicaties)
+        url = get_operation_url("applicatie_partial_update", uuid=self.applicatie.uuid)
+
+        response = self.client.patch(url, {"client_ids": ["other"]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(get_jwt_auth("cached").applicaties, [])
+
+    def test_invalidated_on_api_delete(self):
+        self.assertTrue(get_jwt_auth("cached").applicaties)
+        url = get_operation_url("applicatie_delete", uuid=self.applicatie.uuid)
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(get_jwt_auth("cached").applicaties, [])
+
+    def test_invalidated_after_commit(self):
+        self.assertTrue(get_jwt_auth("cached").applicaties)
+        url = get_operation_url("applicatie_delete", uuid=self.applicatie.uuid)
+        callbacks = []
+
+        with patch("django.db.transaction.on_commit", callbacks.append):
+            response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        # a request before the commit must not cache the deleted applicatie again
+        self.assertTrue(get_jwt_auth("cached").applicaties)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(get_jwt_auth("cached").applicaties, [])
+
+    def test_stats_command(self):
+        get_jwt_auth("cached").applicaties
+        get_jwt_auth("cached").applicaties
+        get_jwt_auth("cached").applicaties
+        out = StringIO()
+
+        call_command("autorisaties_cache_stats", reset=True, stdout=out)
+
+        self.assertIn("hits: 2", out.getvalue())
+        self.assertIn("misses: 1", out.getvalue())
+        self.assertIn("hit ratio: 66.67%", out.getvalue())
+        self.assertEqual(get_stats(), {"hits": 0, "misses": 0})
@@ -0,0 +1,107 @@
+from django.test import TestCase
+
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.models import JWTSecret
+from vng_api_common.tests import generate_jwt_auth, reverse
+
+from openzaak.components.catalogi.models.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.scopes import (
+    SCOPE_ZAKEN_ALLES_LEZEN,
+    SCOPE_ZAKEN_BIJWERKEN,
+)
+
+from ..middleware import JWTAuth
+from ..models.tests.factories import ApplicatieFactory, AutorisatieFactory
+
+ZAAKTYPE = "https://example.com/zaaktypen/1"
+
+
+class JWTAuthTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        JWTSecret.objects.create(identifier="testsuite", secret="letmein")
+        applicatie = ApplicatieFactory.create(client_ids=["testsuite"])
+        AutorisatieFactory.create(
+            applicatie=applicatie,
+            component=ComponentTypes.zrc,
+            zaaktype=ZAAKTYPE,
+            scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern,
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        token = generate_jwt_auth(client_id="testsuite", secret="letmein")
+        self.jwt_auth = JWTAuth(token[len("Bearer ") :])
+
+    def test_has_auth(self):
+        cases = (
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, VertrouwelijkheidsAanduiding.intern),
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, VertrouwelijkheidsAanduiding.openbaar),
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, None),
+        )
+        for scopes, zaaktype, va in cases:
+            with self.subTest(scopes=scopes, zaaktype=zaaktype, va=va):
+                self.assertTrue(
+                    self.jwt_auth.has_auth(
+                        scopes,
+                        "zaken",
+                        zaaktype=zaaktype,
+                        vertrouwelijkheidaanduiding=va,
+                    )
+                )
+
+    def test_has_no_auth(self):
+        cases = (
+            (SCOPE_ZAKEN_BIJWERKEN, ZAAKTYPE, VertrouwelijkheidsAanduiding.intern),
+            (
+                SCOPE_ZAKEN_ALLES_LEZEN,
+                "https://example.com/zaaktypen/2",
+                VertrouwelijkheidsAanduiding.openbaar,
+            ),
+            (SCOPE_ZAKEN_ALLES_LEZEN, ZAAKTYPE, VertrouwelijkheidsAanduiding.geheim),
+        )
+        for scopes, zaaktype, va in cases:
+            with self.subTest(scopes=scopes, zaaktype=zaaktype, va=va):
+                self.assertFalse(
+                    self.jwt_auth.has_auth(
+                        scopes,
+                        "zaken",
+                        zaaktype=zaaktype,
+                        vertrouwelijkheidaanduiding=va,
+                    )
+                )
+
+        self.assertFalse(self.jwt_auth.has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "documenten"))
+
+    def test_authorizations_loaded_once_per_request(self):
+        # JWT secret, applicaties and autorisaties
+        with self.assertNumQueries(3):
+            self.jwt_auth.has_auth(SCOPE_ZAKEN_ALLES_LEZEN, "zaken", zaaktype=ZAAKTYPE)
+
+        with self.assertNumQueries(0):
+            self.jwt_auth.has_auth(
+                SCOPE_ZAKEN_BIJWERKEN,
+                "zaken",
+                zaaktype=ZAAKTYPE,
+                vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+            )
+            self.jwt_auth.get_autorisaties("zaken")
+            self.jwt_auth.get_autorisaties("documenten")
+
+    def test_resource_pks_resolved_once_per_request(self):
+        zaaktype = ZaakTypeFactory.create()
+        zaaktype_url = f"http://testserver{reverse(zaaktype)}"
+
+        with self.assertNumQueries(1):
+            pks = self.jwt_auth.get_resource_pks([zaaktype_url, ZAAKTYPE])
+
+        self.assertEqual(pks, {zaaktype_url: zaaktype.pk})
+
+        with self.assertNumQueries(0):
+            pks = self.jwt_auth.get_resource_pks([zaaktype_url, ZAAKTYPE])
+
+        self.assertEqual(pks, {zaaktype_url: zaaktype.pk})
@@ -15,7 +15,7 @@ from ..models.tests.factories import AutorisatieFactory
 
 
 @freeze_time("2012-01-14")
-@override_settings(NOTIFICATIONS_DISABLED=False)
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=False)
 class SendNotifTestCase(JWTAuthMixin, APITestCase):
     scopes = [str(SCOPE_AUTORISATIES_BIJWERKEN)]
     component = ComponentTypes.ac
@@ -12,6 +12,7 @@ from openzaak.components.besluiten.models.constants import VervalRedenen
 from openzaak.components.catalogi.models import BesluitType
 from openzaak.components.documenten.api.serializers import (
     EnkelvoudigInformatieObjectHyperlinkedRelatedField,
+    InformatieObjectRelationListSerializer,
 )
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
 from openzaak.components.zaken.models import Zaak
@@ -95,6 +96,7 @@ class BesluitInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = BesluitInformatieObject
+        list_serializer_class = InformatieObjectRelationListSerializer
         fields = ("url", "informatieobject", "besluit")
         validators = [
             UniqueTogetherValidator(
@@ -0,0 +1,49 @@
+"""
+Query-count benchmarks for the permission field projection.
+"""
+from unittest.mock import Mock
+
+from rest_framework.test import APITestCase
+
+from openzaak.components.besluiten.models import Besluit, BesluitInformatieObject
+from openzaak.components.besluiten.models.tests.factories import (
+    BesluitFactory,
+    BesluitInformatieObjectFactory,
+)
+from openzaak.utils.tests import get_versioned_request
+
+from ..permissions import BesluitAuthRequired
+from ..serializers import BesluitSerializer
+from ..viewsets import BesluitInformatieObjectViewSet
+
+
+class BesluitAuthRequiredQueryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = get_versioned_request()
+
+    def test_format_data_matches_serializer(self):
+        besluit = Besluit.objects.get(pk=BesluitFactory.create().pk)
+
+        with self.assertNumQueries(1):
+            data = BesluitAuthRequired().format_data(besluit, self.request)
+
+        serializer_data = BesluitSerializer(
+            besluit, context={"request": self.request}
+        ).data
+        self.assertEqual(data, {"besluittype": serializer_data["besluittype"]})
+
+    def test_object_permission_related_resource_num_queries(self):
+        bio = BesluitInformatieObject.objects.get(
+            pk=BesluitInformatieObjectFactory.create().pk
+        )
+        self.request.jwt_auth = Mock(**{"has_auth.return_value": True})
+        view = BesluitInformatieObjectViewSet(action="retrieve", request=self.request)
+
+        # besluit + besluittype
+        with self.assertNumQueries(2):
+            has_permission = BesluitAuthRequired().has_object_permission(
+                self.request, view, bio
+            )
+
+        self.assertTrue(has_permission)
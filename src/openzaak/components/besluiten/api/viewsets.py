@@ -1,14 +1,11 @@
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailViewSet,
-    AuditTrailViewsetMixin,
-)
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.audittrails.viewsets import AuditTrailViewSet, AuditTrailViewsetMixin
 from openzaak.components.besluiten.models import Besluit, BesluitInformatieObject
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import OptionalCursorPagination
 
 from .audits import AUDIT_BRC
 from .filters import BesluitFilter, BesluitInformatieObjectFilter
@@ -89,7 +86,7 @@ class BesluitViewSet(
     serializer_class = BesluitSerializer
     filter_class = BesluitFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (BesluitAuthRequired,)
     required_scopes = {
         "list": SCOPE_BESLUITEN_ALLES_LEZEN,
@@ -164,7 +161,9 @@ class BesluitInformatieObjectViewSet(
     Verwijder een BESLUIT-INFORMATIEOBJECT relatie.
     """
 
-    queryset = BesluitInformatieObject.objects.all()
+    queryset = BesluitInformatieObject.objects.select_related(
+        "besluit", "informatieobject__latest_version"
+    )
     serializer_class = BesluitInformatieObjectSerializer
     filterset_class = BesluitInformatieObjectFilter
     lookup_field = "uuid"
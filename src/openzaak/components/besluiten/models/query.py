@@ -1,16 +1,23 @@
-from urllib.parse import urlparse
-
 from django.db import models
 
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
+
+from openzaak.utils.data_filtering import (
+    UrlResolver,
+    filter_by_authorized_types,
+    get_authorized_pks,
+    get_resource_pks,
+)
 
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        resolve_urls: UrlResolver = get_resource_pks,
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -28,6 +35,8 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param resolve_urls: callable resolving the ``besluittype`` URLs to
+          primary keys, in bulk
 
         :return: a queryset of filtered results according to the
           authorizations provided
@@ -36,18 +45,20 @@ class AuthorizationsFilterMixin:
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-        # keep a list of allowed besluittypen
-        besluittypen = []
-        for authorization in authorizations:
-            if scope.is_contained_in(authorization.scopes):
-                besluittype_path = urlparse(authorization.besluittype).path
-                besluittype = get_resource_for_path(besluittype_path)
-                besluittypen.append(besluittype)
+        # the allowed besluittypen (PKs)
+        besluittypen = get_authorized_pks(
+            scope, authorizations, "besluittype", resolve_urls
+        )
 
         # filtering:
         # * only allow the white-listed besluittypen, explicitly
-        queryset = self.filter(**{f"{prefix}besluittype__in": besluittypen})
-        return queryset
+        return filter_by_authorized_types(
+            self,
+            besluittypen,
+            "besluittype",
+            prefix=prefix,
+            with_vertrouwelijkheidaanduiding=False,
+        )
 
 
 class BesluitQuerySet(AuthorizationsFilterMixin, models.QuerySet):
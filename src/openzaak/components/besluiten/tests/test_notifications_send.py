@@ -18,7 +18,7 @@ from openzaak.utils.tests import JWTAuthMixin
 
 
 @freeze_time("2018-09-07T00:00:00Z")
-@override_settings(NOTIFICATIONS_DISABLED=False)
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=False)
 class SendNotifTestCase(JWTAuthMixin, APITestCase):
 
     heeft_alle_autorisaties = True
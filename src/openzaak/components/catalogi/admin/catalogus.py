@@ -6,7 +6,7 @@ from openzaak.utils.admin import EditInlineAdminMixin, ListObjectActionsAdminMix
 from ..models import BesluitType, Catalogus, InformatieObjectType, ZaakType
 from .besluittype import BesluitTypeAdmin
 from .informatieobjecttype import InformatieObjectTypeAdmin
-from .mixins import FilterSearchOrderingAdminMixin
+from .mixins import FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin
 from .zaken import ZaakTypeAdmin
 
 
@@ -29,7 +29,10 @@ class InformatieObjectTypeInline(EditInlineAdminMixin, admin.TabularInline):
 
 @admin.register(Catalogus)
 class CatalogusAdmin(
-    ListObjectActionsAdminMixin, FilterSearchOrderingAdminMixin, admin.ModelAdmin
+    ListObjectActionsAdminMixin,
+    FilterSearchOrderingAdminMixin,
+    InvalidateSnapshotAdminMixin,
+    admin.ModelAdmin,
 ):
     model = Catalogus
 
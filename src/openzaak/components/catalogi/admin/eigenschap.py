@@ -2,11 +2,13 @@ from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
 
 from ..models import Eigenschap, EigenschapReferentie, EigenschapSpecificatie
-from .mixins import FilterSearchOrderingAdminMixin
+from .mixins import FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin
 
 
 @admin.register(Eigenschap)
-class EigenschapAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
+class EigenschapAdmin(
+    FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin, admin.ModelAdmin
+):
     model = Eigenschap
 
     # List
@@ -29,7 +31,7 @@ class EigenschapAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
 
 
 @admin.register(EigenschapReferentie)
-class EigenschapReferentieAdmin(admin.ModelAdmin):
+class EigenschapReferentieAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     # List
     list_display = ("objecttype", "informatiemodel")  # Add is_van
     # list_filter = ('rsin', )  # Add is_van
@@ -61,7 +63,7 @@ class EigenschapReferentieAdmin(admin.ModelAdmin):
 
 
 @admin.register(EigenschapSpecificatie)
-class EigenschapSpecificatieAdmin(admin.ModelAdmin):
+class EigenschapSpecificatieAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     # List
     list_display = ("groep", "formaat", "lengte", "kardinaliteit")  # Add is_van
     # list_filter = ('rsin', )  # Add is_van
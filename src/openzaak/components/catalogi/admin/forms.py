@@ -8,7 +8,9 @@ from rest_framework.exceptions import ValidationError
 from vng_api_common.constants import (
     BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
 )
-from vng_api_common.validators import ResourceValidator
+
+from openzaak.referentielijsten.client import fetch
+from openzaak.referentielijsten.validators import CachedResourceValidator
 
 from ..models import ResultaatType, ZaakType
 from ..models.constants import SelectielijstKlasseProcestermijn as Procestermijn
@@ -76,10 +78,9 @@ class ResultaatTypeForm(forms.ModelForm):
             # nothing to do
             return
 
-        response = requests.get(selectielijstklasse)
         try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
+            resultaat = fetch(selectielijstklasse)
+        except (requests.RequestException, ValueError) as exc:
             msg = (
                 _("URL %s for selectielijstklasse did not resolve")
                 % selectielijstklasse
@@ -89,12 +90,12 @@ class ResultaatTypeForm(forms.ModelForm):
 
         try:
             # Check whether the url points to a Resultaat
-            ResourceValidator("Resultaat", API_SPEC)(selectielijstklasse)
+            CachedResourceValidator("Resultaat", API_SPEC)(selectielijstklasse)
         except ValidationError as exc:
             err = forms.ValidationError(exc.detail[0], code=exc.detail[0].code)
             raise forms.ValidationError({"selectielijstklasse": err}) from exc
 
-        procestype = response.json()["procesType"]
+        procestype = resultaat["procesType"]
         if procestype != zaaktype.selectielijst_procestype:
             msg = _(
                 "De selectielijstklasse hoort niet bij het selectielijst procestype van het zaaktype"
@@ -130,8 +131,7 @@ class ResultaatTypeForm(forms.ModelForm):
         if not selectielijstklasse or not afleidingswijze:
             return
 
-        response = requests.get(selectielijstklasse)
-        procestermijn = response.json()["procestermijn"]
+        procestermijn = fetch(selectielijstklasse)["procestermijn"]
 
         # mapping selectielijst -> ZTC
         forward_not_ok = (
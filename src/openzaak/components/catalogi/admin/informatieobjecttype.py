@@ -6,7 +6,11 @@ from ..models import (
     InformatieObjectTypeOmschrijvingGeneriek,
     ZaakInformatieobjectType,
 )
-from .mixins import ConceptAdminMixin, GeldigheidAdminMixin
+from .mixins import (
+    ConceptAdminMixin,
+    GeldigheidAdminMixin,
+    InvalidateSnapshotAdminMixin,
+)
 
 
 class ZaakInformatieobjectTypeInline(admin.TabularInline):
@@ -17,7 +21,7 @@ class ZaakInformatieobjectTypeInline(admin.TabularInline):
 
 @admin.register(InformatieObjectTypeOmschrijvingGeneriek)
 class InformatieObjectTypeOmschrijvingGeneriekAdmin(
-    GeldigheidAdminMixin, admin.ModelAdmin
+    GeldigheidAdminMixin, InvalidateSnapshotAdminMixin, admin.ModelAdmin
 ):
     # List
     list_display = ("informatieobjecttype_omschrijving_generiek",)
@@ -48,7 +52,10 @@ class InformatieObjectTypeOmschrijvingGeneriekAdmin(
 
 @admin.register(InformatieObjectType)
 class InformatieObjectTypeAdmin(
-    GeldigheidAdminMixin, ConceptAdminMixin, admin.ModelAdmin
+    GeldigheidAdminMixin,
+    ConceptAdminMixin,
+    InvalidateSnapshotAdminMixin,
+    admin.ModelAdmin,
 ):
     list_display = ("catalogus", "omschrijving", "informatieobjectcategorie")
     list_filter = ("catalogus", "informatieobjectcategorie")
@@ -1,6 +1,8 @@
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.translation import ugettext_lazy as _
 
+from ..snapshot import invalidate_snapshots
+
 
 class GeldigheidAdminMixin(object):
     def get_fieldsets(self, request, obj=None):
@@ -57,3 +59,22 @@ class ConceptAdminMixin(object):
     def get_fieldsets(self, request, obj=None):
         fieldsets = super().get_fieldsets(request, obj)
         return tuple(fieldsets) + ((_("Concept"), {"fields": ("concept",)}),)
+
+
+class InvalidateSnapshotAdminMixin(object):
+    """
+    Bump the catalogi generation when objects are changed in the admin, which
+    reloads the catalogi snapshots and changes the ETags of the Catalogi API.
+    """
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        invalidate_snapshots()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_snapshots()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        invalidate_snapshots()
@@ -5,6 +5,7 @@ from relativedeltafield import RelativeDeltaField
 
 from ..models import ResultaatType, ZaakInformatieobjectTypeArchiefregime
 from .forms import RelativeDeltaField as RelativeDeltaFormField, ResultaatTypeForm
+from .mixins import InvalidateSnapshotAdminMixin
 
 
 class ZaakInformatieobjectTypeArchiefregimeInline(admin.TabularInline):
@@ -13,7 +14,7 @@ class ZaakInformatieobjectTypeArchiefregimeInline(admin.TabularInline):
 
 
 @admin.register(ResultaatType)
-class ResultaatTypeAdmin(admin.ModelAdmin):
+class ResultaatTypeAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     model = ResultaatType
     form = ResultaatTypeForm
 
@@ -2,11 +2,13 @@ from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
 
 from ..models import RolType
-from .mixins import FilterSearchOrderingAdminMixin
+from .mixins import FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin
 
 
 @admin.register(RolType)
-class RolTypeAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
+class RolTypeAdmin(
+    FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin, admin.ModelAdmin
+):
     model = RolType
 
     # List
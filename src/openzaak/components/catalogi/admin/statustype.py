@@ -2,17 +2,19 @@ from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
 
 from ..models import CheckListItem, StatusType
-from .mixins import FilterSearchOrderingAdminMixin
+from .mixins import FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin
 
 
 @admin.register(CheckListItem)
-class CheckListItemAdmin(admin.ModelAdmin):
+class CheckListItemAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     list_display = ("itemnaam",)
     fields = ("itemnaam", "vraagstelling", "verplicht", "toelichting")
 
 
 @admin.register(StatusType)
-class StatusTypeAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
+class StatusTypeAdmin(
+    FilterSearchOrderingAdminMixin, InvalidateSnapshotAdminMixin, admin.ModelAdmin
+):
     model = StatusType
 
     # List
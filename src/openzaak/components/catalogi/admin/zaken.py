@@ -23,6 +23,7 @@ from .mixins import (
     ConceptAdminMixin,
     FilterSearchOrderingAdminMixin,
     GeldigheidAdminMixin,
+    InvalidateSnapshotAdminMixin,
 )
 from .resultaattype import ResultaatTypeAdmin
 from .roltype import RolTypeAdmin
@@ -31,7 +32,10 @@ from .statustype import StatusTypeAdmin
 
 @admin.register(ZaakObjectType)
 class ZaakObjectTypeAdmin(
-    GeldigheidAdminMixin, FilterSearchOrderingAdminMixin, admin.ModelAdmin
+    GeldigheidAdminMixin,
+    FilterSearchOrderingAdminMixin,
+    InvalidateSnapshotAdminMixin,
+    admin.ModelAdmin,
 ):
     model = ZaakObjectType
 
@@ -96,6 +100,7 @@ class ZaakTypeAdmin(
     FilterSearchOrderingAdminMixin,
     GeldigheidAdminMixin,
     ConceptAdminMixin,
+    InvalidateSnapshotAdminMixin,
     DynamicArrayMixin,
     admin.ModelAdmin,
 ):
@@ -210,18 +215,18 @@ class ZaakTypeAdmin(
 
 
 @admin.register(Formulier)
-class FormulierAdmin(admin.ModelAdmin):
+class FormulierAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     list_display = ["naam"]
     fields = ("naam", "link")
 
 
 @admin.register(BronCatalogus)
-class BronCatalogusAdmin(admin.ModelAdmin):
+class BronCatalogusAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     list_display = ["domein", "rsin"]
     fields = ("domein", "rsin")
 
 
 @admin.register(BronZaakType)
-class BronZaakTypeAdmin(admin.ModelAdmin):
+class BronZaakTypeAdmin(InvalidateSnapshotAdminMixin, admin.ModelAdmin):
     list_display = ["zaaktype_identificatie", "zaaktype_omschrijving"]
     fields = ("zaaktype_identificatie", "zaaktype_omschrijving")
@@ -0,0 +1,17 @@
+from openzaak.utils.serializer_fields import LengthHyperlinkedRelatedField
+
+from ..snapshot import get_object
+
+
+class SnapshotHyperlinkedRelatedField(LengthHyperlinkedRelatedField):
+    """
+    Resolve the URLs of published catalogi objects from the catalogi snapshot.
+
+    Objects that are not in the snapshot are looked up in the database.
+    """
+
+    def get_object(self, view_name, view_args, view_kwargs):
+        obj = get_object(self.queryset.model, view_kwargs[self.lookup_url_kwarg])
+        if obj is not None:
+            return obj
+        return super().get_object(view_name, view_args, view_kwargs)
@@ -13,7 +13,8 @@ from vng_api_common.serializers import (
     NestedGegevensGroepMixin,
     add_choice_values_help_text,
 )
-from vng_api_common.validators import ResourceValidator
+
+from openzaak.referentielijsten.validators import CachedResourceValidator
 
 from ...models import ResultaatType
 from ..utils.validators import (
@@ -70,7 +71,7 @@ class ResultaatTypeSerializer(
             "url": {"lookup_field": "uuid"},
             "resultaattypeomschrijving": {
                 "validators": [
-                    ResourceValidator(
+                    CachedResourceValidator(
                         "ResultaattypeOmschrijvingGeneriek",
                         settings.REFERENTIELIJSTEN_API_SPEC,
                     )
@@ -85,7 +86,9 @@ class ResultaatTypeSerializer(
             "zaaktype": {"lookup_field": "uuid", "label": _("is van")},
             "selectielijstklasse": {
                 "validators": [
-                    ResourceValidator("Resultaat", settings.REFERENTIELIJSTEN_API_SPEC)
+                    CachedResourceValidator(
+                        "Resultaat", settings.REFERENTIELIJSTEN_API_SPEC
+                    )
                 ]
             },
         }
@@ -15,7 +15,8 @@ from vng_api_common.serializers import (
     NestedGegevensGroepMixin,
     add_choice_values_help_text,
 )
-from vng_api_common.validators import ResourceValidator
+
+from openzaak.referentielijsten.validators import CachedResourceValidator
 
 from ...models import (
     BesluitType,
@@ -280,7 +281,9 @@ class ZaakTypeSerializer(
             "concept": {"read_only": True},
             "selectielijst_procestype": {
                 "validators": [
-                    ResourceValidator("ProcesType", settings.REFERENTIELIJSTEN_API_SPEC)
+                    CachedResourceValidator(
+                        "ProcesType", settings.REFERENTIELIJSTEN_API_SPEC
+                    )
                 ]
             },
         }
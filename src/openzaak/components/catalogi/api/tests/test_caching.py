@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from rest_framework import status
+
+from ... import snapshot
+from ...models import ZaakType
+from ...models.tests.factories import ZaakTypeFactory
+from .base import APITestCase
+from .utils import get_operation_url
+
+IS_SHARED_CACHE = "openzaak.components.catalogi.api.views.mixins.is_shared_cache"
+
+
+def run_on_commit(func):
+    # the transactions of the test cases are never committed
+    func()
+
+
+@patch(IS_SHARED_CACHE, lambda alias: True)
+class ConditionalGetTests(APITestCase):
+    heeft_alle_autorisaties = True
+
+    @patch(IS_SHARED_CACHE, lambda alias: False)
+    def test_no_etag_without_shared_cache(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+
+        response = self.client.get(
+            get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+
+    def test_not_modified(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        url = get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("s-maxage=0", response["Cache-Control"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_concept_not_public(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+
+        response = self.client.get(
+            get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    @patch("django.db.transaction.on_commit", run_on_commit)
+    def test_publish_changes_etag(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        url = get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+        etag = self.client.get(url)["ETag"]
+
+        self.client.post(get_operation_url("zaaktype_publish", uuid=zaaktype.uuid))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    @patch("django.db.transaction.on_commit", run_on_commit)
+    def test_delete_changes_list_etag(self):
+        zaaktype = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+        list_url = get_operation_url("zaaktype_list")
+        etag = self.client.get(list_url, {"status": "alles"})["ETag"]
+
+        self.client.delete(get_operation_url("zaaktype_read", uuid=zaaktype.uuid))
+        response = self.client.get(
+            list_url, {"status": "alles"}, HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 0)
+
+
+@override_settings(CATALOGI_SNAPSHOT_TIMEOUT=60)
+@patch(IS_SHARED_CACHE, lambda alias: True)
+class ConditionalGetSnapshotTests(APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        snapshot.clear()
+        self.addCleanup(snapshot.clear)
+
+    @patch("django.db.transaction.on_commit", run_on_commit)
+    def test_publish_invalidates_snapshot_and_etag(self):
+        zaaktype = ZaakTypeFactory.create(concept=True, catalogus=self.catalogus)
+        url = get_operation_url("zaaktype_read", uuid=zaaktype.uuid)
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIsNone(snapshot.get_object(ZaakType, zaaktype.uuid))
+
+        self.client.post(get_operation_url("zaaktype_publish", uuid=zaaktype.uuid))
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(snapshot.get_object(ZaakType, zaaktype.uuid), zaaktype)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -11,14 +11,22 @@ from vng_api_common.models import APICredential
 from openzaak.components.catalogi.models.constants import (
     SelectielijstKlasseProcestermijn as Procestermijn,
 )
+from openzaak.referentielijsten import cache
 
 
 def fetch_object(resource: str, url: str) -> dict:
-    Client = import_string(settings.ZDS_CLIENT_CLASS)
-    client = Client.from_url(url)
-    client.auth = APICredential.get_auth(url)
-    obj = client.retrieve(resource, url=url)
-    return obj
+    """
+    Fetch a resource of the Referentielijsten API, from the local cache if
+    possible.
+    """
+
+    def load(url: str) -> dict:
+        Client = import_string(settings.ZDS_CLIENT_CLASS)
+        client = Client.from_url(url)
+        client.auth = APICredential.get_auth(url)
+        return client.retrieve(resource, url=url)
+
+    return cache.get(url, load)
 
 
 class RelationCatalogValidator:
@@ -1,16 +1,17 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import BesluitType
 from ..filters import BesluitTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import BesluitTypeSerializer
-from .mixins import ConceptMixin, M2MConceptCreateMixin
+from .mixins import ConceptMixin, ConditionalGetMixin, M2MConceptCreateMixin
 
 
 class BesluitTypeViewSet(
+    ConditionalGetMixin,
     ConceptMixin,
     M2MConceptCreateMixin,
     mixins.CreateModelMixin,
@@ -60,7 +61,7 @@ class BesluitTypeViewSet(
     serializer_class = BesluitTypeSerializer
     filterset_class = BesluitTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
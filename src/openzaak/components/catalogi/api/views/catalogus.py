@@ -1,15 +1,18 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
 from openzaak.components.catalogi.models import Catalogus
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ..filters import CatalogusFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import CatalogusSerializer
+from .mixins import ConditionalGetMixin
 
 
-class CatalogusViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+class CatalogusViewSet(
+    ConditionalGetMixin, mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     Opvragen en bewerken van CATALOGUSsen.
 
@@ -52,7 +55,7 @@ class CatalogusViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CatalogusSerializer
     filter_class = CatalogusFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
@@ -1,16 +1,17 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
 from openzaak.components.catalogi.models import Eigenschap
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ..filters import EigenschapFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import EigenschapSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ConditionalGetMixin, ZaakTypeConceptMixin
 
 
 class EigenschapViewSet(
+    ConditionalGetMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -61,7 +62,7 @@ class EigenschapViewSet(
     serializer_class = EigenschapSerializer
     filterset_class = EigenschapFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
@@ -1,16 +1,17 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import InformatieObjectType
 from ..filters import InformatieObjectTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import InformatieObjectTypeSerializer
-from .mixins import ConceptMixin
+from .mixins import ConceptMixin, ConditionalGetMixin
 
 
 class InformatieObjectTypeViewSet(
+    ConditionalGetMixin,
     ConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -61,7 +62,7 @@ class InformatieObjectTypeViewSet(
     serializer_class = InformatieObjectTypeSerializer
     filterset_class = InformatieObjectTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
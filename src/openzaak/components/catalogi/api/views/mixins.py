@@ -1,3 +1,9 @@
+import hashlib
+from typing import Optional
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 from django.utils.translation import ugettext_lazy as _
 
 from drf_yasg.utils import no_body, swagger_auto_schema
@@ -5,6 +11,88 @@ from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 
+from openzaak.utils.cache import is_shared_cache
+
+from ...snapshot import get_generation, invalidate_snapshots
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support for the catalogi resources.
+
+    The responses are versioned by the catalogi generation, which changes on
+    every change of the catalogi through the API or the admin - also of the
+    related objects that are part of a representation. A request with the
+    ``ETag`` of the current version in ``If-None-Match`` gets a ``304 Not
+    Modified``, without the resource being loaded or serialized.
+
+    Published objects may be stored by shared caches, which have to revalidate
+    them on every request - so the authorization is still checked.
+
+    The generation is only the same in all processes if
+    ``settings.CATALOGI_SNAPSHOT_CACHE`` is shared, otherwise no ``ETag`` is
+    sent.
+    """
+
+    def get_etag(self, request) -> Optional[str]:
+        if not is_shared_cache(settings.CATALOGI_SNAPSHOT_CACHE):
+            return None
+
+        generation = get_generation()
+        if generation is None:
+            return None
+        version = (
+            f"{generation}:{request.accepted_media_type}:"
+            f"{request.build_absolute_uri()}"
+        )
+        return quote_etag(hashlib.sha1(version.encode()).hexdigest())
+
+    def get_conditional_response(self, request, handler, *args, **kwargs):
+        etag = self.get_etag(request)
+        if etag is None:
+            return handler(request, *args, **kwargs)
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+        return response
+
+    def list(self, request, *args, **kwargs):
+        response = self.get_conditional_response(request, super().list, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(
+            request, self.get_retrieve_response, *args, **kwargs
+        )
+
+    def get_retrieve_response(self, request, *args, **kwargs):
+        instance = self.get_object()
+        response = Response(self.get_serializer(instance).data)
+
+        concept = self.get_concept(instance) if hasattr(self, "get_concept") else False
+        if concept:
+            patch_cache_control(response, private=True, no_cache=True)
+        else:
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=settings.CATALOGI_CACHE_MAX_AGE,
+                s_maxage=0,
+            )
+        return response
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        invalidate_snapshots()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        invalidate_snapshots()
+
 
 class ConceptPublishMixin:
     @swagger_auto_schema(request_body=no_body)
@@ -13,6 +101,7 @@ class ConceptPublishMixin:
         instance = self.get_object()
         instance.concept = False
         instance.save()
+        invalidate_snapshots()
 
         serializer = self.get_serializer(instance)
 
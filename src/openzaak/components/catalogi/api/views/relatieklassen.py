@@ -2,18 +2,19 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import mixins, viewsets
 from rest_framework.exceptions import PermissionDenied
-from rest_framework.pagination import PageNumberPagination
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import ZaakInformatieobjectType
 from ..filters import ZaakInformatieobjectTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import ZaakTypeInformatieObjectTypeSerializer
-from .mixins import ConceptDestroyMixin, ConceptFilterMixin
+from .mixins import ConceptDestroyMixin, ConceptFilterMixin, ConditionalGetMixin
 
 
 class ZaakTypeInformatieObjectTypeViewSet(
+    ConditionalGetMixin,
     ConceptFilterMixin,
     ConceptDestroyMixin,
     mixins.CreateModelMixin,
@@ -65,7 +66,7 @@ class ZaakTypeInformatieObjectTypeViewSet(
     serializer_class = ZaakTypeInformatieObjectTypeSerializer
     filterset_class = ZaakInformatieobjectTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
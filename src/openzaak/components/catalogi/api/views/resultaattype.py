@@ -1,16 +1,17 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import ResultaatType
 from ..filters import ResultaatTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import ResultaatTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ConditionalGetMixin, ZaakTypeConceptMixin
 
 
 class ResultaatTypeViewSet(
+    ConditionalGetMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -61,7 +62,7 @@ class ResultaatTypeViewSet(
     serializer_class = ResultaatTypeSerializer
     filter_class = ResultaatTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
@@ -1,17 +1,18 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import RolType
 from ..filters import RolTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import RolTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ConditionalGetMixin, ZaakTypeConceptMixin
 
 
 class RolTypeViewSet(
+    ConditionalGetMixin,
     CheckQueryParamsMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
@@ -63,7 +64,7 @@ class RolTypeViewSet(
     serializer_class = RolTypeSerializer
     filterset_class = RolTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
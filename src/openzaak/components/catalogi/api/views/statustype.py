@@ -1,16 +1,17 @@
 from rest_framework import mixins, viewsets
-from rest_framework.pagination import PageNumberPagination
 
+from openzaak.utils.pagination import OptionalCursorPagination
 from openzaak.utils.permissions import AuthRequired
 
 from ...models import StatusType
 from ..filters import StatusTypeFilter
 from ..scopes import SCOPE_ZAAKTYPES_READ, SCOPE_ZAAKTYPES_WRITE
 from ..serializers import StatusTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import ConditionalGetMixin, ZaakTypeConceptMixin
 
 
 class StatusTypeViewSet(
+    ConditionalGetMixin,
     ZaakTypeConceptMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
@@ -60,7 +61,7 @@ class StatusTypeViewSet(
     serializer_class = StatusTypeSerializer
     filterset_class = StatusTypeFilter
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
     permission_classes = (AuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAAKTYPES_READ,
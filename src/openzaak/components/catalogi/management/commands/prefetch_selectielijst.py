@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from openzaak.referentielijsten.client import prefetch
+
+from ...models import ResultaatType, ZaakType
+
+
+class Command(BaseCommand):
+    help = (
+        "Fetch the selectielijst procestypen, selectielijstklassen and "
+        "resultaattypeomschrijvingen the catalogi refer to concurrently, and "
+        "cache them - for example before saving many resultaattypen."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of concurrent requests, defaults to the connection pool size",
+        )
+
+    def handle(self, workers, **options):
+        if not settings.REFERENTIELIJSTEN_CACHE_TTL:
+            raise CommandError("The cache of the Referentielijsten API is disabled")
+
+        urls = set(
+            ZaakType.objects.exclude(selectielijst_procestype="").values_list(
+                "selectielijst_procestype", flat=True
+            )
+        )
+        for field in ("selectielijstklasse", "resultaattypeomschrijving"):
+            urls.update(
+                ResultaatType.objects.exclude(**{field: ""}).values_list(
+                    field, flat=True
+                )
+            )
+
+        errors = prefetch(urls, workers=workers)
+        for url, error in errors.items():
+            self.stderr.write(f"Could not fetch {url}: {error}")
+
+        self.stdout.write(
+            f"Cached {len(urls) - len(errors)} resource(s), "
+            f"{len(errors)} could not be fetched"
+        )
@@ -3,7 +3,6 @@ import uuid
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
-import requests
 from relativedeltafield import RelativeDeltaField
 from vng_api_common.constants import (
     Archiefnominatie,
@@ -12,6 +11,8 @@ from vng_api_common.constants import (
 )
 from vng_api_common.descriptors import GegevensGroepType
 
+from openzaak.referentielijsten.client import fetch
+
 
 class ResultaatType(models.Model):
     """
@@ -257,7 +258,7 @@ class ResultaatType(models.Model):
         Save some derived fields into local object as a means of caching.
         """
         if not self.omschrijving_generiek and self.resultaattypeomschrijving:
-            response = requests.get(self.resultaattypeomschrijving).json()
+            response = fetch(self.resultaattypeomschrijving)
             self.omschrijving_generiek = response["omschrijving"]
 
         # derive the default archiefnominatie
@@ -278,7 +279,5 @@ class ResultaatType(models.Model):
         if not hasattr(self, "_selectielijstklasse"):
             # selectielijstklasse should've been validated at this point by either
             # forms or serializers
-            response = requests.get(self.selectielijstklasse)
-            response.raise_for_status()
-            self._selectielijstklasse = response.json()
+            self._selectielijstklasse = fetch(self.selectielijstklasse)
         return self._selectielijstklasse
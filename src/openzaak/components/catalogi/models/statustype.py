@@ -177,7 +177,8 @@ class StatusType(models.Model):
         Een `StatusType` betreft een eindstatus als het volgnummer van het
         `StatusType` de hoogste is binnen het `ZaakType`.
 
-        # TODO: Can be cached on the model.
+        The API uses the catalogi snapshot instead, see
+        :func:`openzaak.components.catalogi.snapshot.is_eindstatus`.
         """
         max_statustypevolgnummer = self.zaaktype.statustypen.aggregate(
             result=Max("statustypevolgnummer")
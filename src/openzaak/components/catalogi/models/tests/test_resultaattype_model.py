@@ -1,11 +1,15 @@
 import uuid
+from io import StringIO
 
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 
 import requests_mock
 from dateutil.relativedelta import relativedelta
 from vng_api_common.constants import Archiefnominatie
 
+from openzaak.referentielijsten.cache import memory_cache
+
 from .factories import ResultaatTypeFactory, ZaakTypeFactory
 
 RESULTAAT_URL = "https://ref.tst.vng.cloud/referentielijsten/api/v1/resultaten/{uuid}"
@@ -118,3 +122,43 @@ class ResultaattypeTests(TestCase):
 
         resultaat.refresh_from_db()
         self.assertEqual(resultaat.archiefactietermijn, relativedelta(years=5))
+
+
+@override_settings(REFERENTIELIJSTEN_CACHE_TTL=60)
+class PrefetchSelectielijstTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        memory_cache.clear()
+        self.addCleanup(memory_cache.clear)
+
+    def test_derived_fields_from_prefetched(self):
+        resultaat_url = RESULTAAT_URL.format(uuid=str(uuid.uuid4()))
+        omschrijving_url = "https://ref.tst.vng.cloud/referentielijsten/api/v1/resultaattypeomschrijvingen/1"
+        resultaattypen = ResultaatTypeFactory.create_batch(
+            2,
+            zaaktype__selectielijst_procestype="",
+            selectielijstklasse=resultaat_url,
+            resultaattypeomschrijving=omschrijving_url,
+        )
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                resultaat_url,
+                json={"url": resultaat_url, "waardering": "vernietigen"},
+            )
+            m.get(omschrijving_url, json={"omschrijving": "Verleend"})
+            call_command("prefetch_selectielijst", stdout=StringIO())
+
+        self.assertEqual(m.call_count, 2)
+
+        # derived from the cache, without requests
+        with requests_mock.Mocker() as m:
+            for resultaattype in resultaattypen:
+                resultaattype.omschrijving_generiek = ""
+                resultaattype.archiefnominatie = ""
+                resultaattype.save()
+
+        self.assertFalse(m.called)
+        resultaattypen[0].refresh_from_db()
+        self.assertEqual(resultaattypen[0].omschrijving_generiek, "Verleend")
+        self.assertEqual(resultaattypen[0].archiefnominatie, "vernietigen")
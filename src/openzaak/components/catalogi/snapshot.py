@@ -0,0 +1,219 @@
+"""
+In-process snapshot of the published zaaktypen.
+
+Every status, rol, resultaat, zaakeigenschap and zaakinformatieobject that is
+written looks up catalogi objects: the statustype (or roltype, ...) of the URL,
+whether it's the eindstatus of the zaaktype, whether the informatieobjecttype
+is relevant for the zaaktype. Published (non-concept) zaaktypen can't be
+changed through the API, so their graphs are loaded once and kept in memory in
+each process.
+
+The snapshot is versioned with the catalogi generation, a counter in the
+``settings.CATALOGI_SNAPSHOT_CACHE`` cache which is shared by the processes.
+The generation is bumped when a catalogi object is published or changed in the
+admin, after which every process loads a new snapshot - so the cache must be
+shared, which is verified by a system check.
+``settings.CATALOGI_SNAPSHOT_TIMEOUT`` is a safety net for missed changes; it
+is ``0`` (the snapshot is disabled) by default.
+
+The generation also versions the responses of the Catalogi API, see
+:class:`openzaak.components.catalogi.api.views.mixins.ConditionalGetMixin`,
+so it's bumped on every change through the API as well.
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional, Set, Type
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import Max
+
+from .models import (
+    Eigenschap,
+    ResultaatType,
+    RolType,
+    StatusType,
+    ZaakInformatieobjectType,
+    ZaakType,
+)
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "openzaak:catalogi:generation"
+
+# the models of the graph of a zaaktype, which are looked up by uuid
+MODELS = (ZaakType, StatusType, RolType, ResultaatType, Eigenschap)
+
+
+def _get_cache():
+    return caches[settings.CATALOGI_SNAPSHOT_CACHE]
+
+
+class Rows:
+    """
+    The rows of a model by uuid.
+
+    The rows are stored rather than the instances, so every lookup returns a
+    new instance which can't leak changes (or cached relations) to other
+    requests.
+    """
+
+    def __init__(self, model: Type[models.Model], queryset: models.QuerySet):
+        self.model = model
+        self.field_names = [field.attname for field in model._meta.concrete_fields]
+        uuid_index = self.field_names.index("uuid")
+        self.rows = {
+            row[uuid_index]: row for row in queryset.values_list(*self.field_names)
+        }
+
+    def get_pks(self) -> Set[int]:
+        pk_index = self.field_names.index(self.model._meta.pk.attname)
+        return {row[pk_index] for row in self.rows.values()}
+
+    def get(self, uuid: UUID) -> Optional[models.Model]:
+        row = self.rows.get(uuid)
+        if row is None:
+            return None
+        return self.model.from_db(DEFAULT_DB_ALIAS, self.field_names, row)
+
+
+class CatalogSnapshot:
+    def __init__(self, generation: Optional[int]):
+        self.generation = generation
+        self.loaded = time.monotonic()
+
+        self.rows: Dict[Type[models.Model], Rows] = {
+            model: Rows(model, self.get_queryset(model)) for model in MODELS
+        }
+        self.zaaktype_ids: Set[int] = self.rows[ZaakType].get_pks()
+        self.eindstatus_volgnummers: Dict[int, int] = dict(
+            StatusType.objects.filter(zaaktype__concept=False)
+            .values("zaaktype")
+            .annotate(volgnummer=Max("statustypevolgnummer"))
+            .values_list("zaaktype", "volgnummer")
+        )
+        self.informatieobjecttypen = set(
+            ZaakInformatieobjectType.objects.filter(
+                zaaktype__concept=False, informatieobjecttype__concept=False
+            ).values_list("zaaktype_id", "informatieobjecttype_id")
+        )
+
+    @staticmethod
+    def get_queryset(model: Type[models.Model]) -> models.QuerySet:
+        if model is ZaakType:
+            return ZaakType.objects.filter(concept=False)
+        return model.objects.filter(zaaktype__concept=False)
+
+    def is_current(self, generation: Optional[int]) -> bool:
+        return (
+            self.generation == generation
+            and time.monotonic() - self.loaded < settings.CATALOGI_SNAPSHOT_TIMEOUT
+        )
+
+
+_snapshot: Optional[CatalogSnapshot] = None
+_lock = threading.Lock()
+
+
+def get_snapshot() -> Optional[CatalogSnapshot]:
+    """
+    Return the snapshot of the current generation, or ``None`` if disabled.
+    """
+    global _snapshot
+
+    if not settings.CATALOGI_SNAPSHOT_TIMEOUT:
+        return None
+
+    # read before loading, so changes made while loading cause another load
+    generation = get_generation()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.is_current(generation):
+        return snapshot
+
+    with _lock:
+        if _snapshot is None or not _snapshot.is_current(generation):
+            logger.debug("Loading the catalogi snapshot of generation %s", generation)
+            _snapshot = CatalogSnapshot(generation)
+        return _snapshot
+
+
+def clear() -> None:
+    """
+    Drop the snapshot of this process.
+    """
+    global _snapshot
+    with _lock:
+        _snapshot = None
+
+
+def get_generation() -> Optional[int]:
+    """
+    Return the current catalogi generation, or ``None`` if the cache is down.
+    """
+    cache = _get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        _start_generation(cache)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _start_generation(cache) -> bool:
+    # start from the current time rather than 1, so the generations (and the
+    # ETags) of before the counter was evicted are not repeated
+    return cache.add(GENERATION_KEY, int(time.time() * 1000), timeout=None)
+
+
+def _bump_generation() -> None:
+    cache = _get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # the counter does not exist (yet)
+        if not _start_generation(cache):
+            cache.incr(GENERATION_KEY)
+
+
+def invalidate_snapshots() -> None:
+    """
+    Make all processes load a new snapshot, once the transaction is committed.
+    """
+    transaction.on_commit(_bump_generation)
+
+
+def get_object(model: Type[models.Model], uuid: str) -> Optional[models.Model]:
+    """
+    Return the published object of ``model`` with ``uuid`` from the snapshot.
+    """
+    snapshot = get_snapshot()
+    if snapshot is None or model not in snapshot.rows:
+        return None
+    try:
+        uuid = UUID(str(uuid))
+    except ValueError:
+        return None
+    return snapshot.rows[model].get(uuid)
+
+
+def is_eindstatus(statustype: StatusType) -> bool:
+    snapshot = get_snapshot()
+    if snapshot is None or statustype.zaaktype_id not in snapshot.zaaktype_ids:
+        return statustype.is_eindstatus()
+    volgnummer = snapshot.eindstatus_volgnummers.get(statustype.zaaktype_id)
+    return statustype.statustypevolgnummer == volgnummer
+
+
+def is_relevant_informatieobjecttype(
+    zaaktype_id: int, informatieobjecttype_id: int
+) -> Optional[bool]:
+    """
+    Return whether the published informatieobjecttype is relevant for the
+    published zaaktype, or ``None`` if the zaaktype is not in the snapshot.
+    """
+    snapshot = get_snapshot()
+    if snapshot is None or zaaktype_id not in snapshot.zaaktype_ids:
+        return None
+    return (zaaktype_id, informatieobjecttype_id) in snapshot.informatieobjecttypen
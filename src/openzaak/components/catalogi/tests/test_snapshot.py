@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openzaak.components.catalogi import snapshot
+from openzaak.components.catalogi.api.tests.base import ClientAPITestMixin
+from openzaak.components.catalogi.api.tests.utils import get_operation_url
+from openzaak.components.catalogi.models import StatusType, ZaakType
+from openzaak.components.catalogi.models.tests.factories import (
+    StatusTypeFactory,
+    ZaakInformatieobjectTypeFactory,
+    ZaakTypeFactory,
+)
+
+
+def run_on_commit(func):
+    # the transactions of the test cases are never committed
+    func()
+
+
+@override_settings(CATALOGI_SNAPSHOT_TIMEOUT=60)
+class CatalogSnapshotTests(ClientAPITestMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        snapshot.clear()
+        self.addCleanup(snapshot.clear)
+
+    def test_lookups_without_queries(self):
+        relation = ZaakInformatieobjectTypeFactory.create(
+            zaaktype__concept=False, informatieobjecttype__concept=False
+        )
+        zaaktype = relation.zaaktype
+        statustype1 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=1
+        )
+        statustype2 = StatusTypeFactory.create(
+            zaaktype=zaaktype, statustypevolgnummer=2
+        )
+        snapshot.get_snapshot()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(snapshot.get_object(ZaakType, zaaktype.uuid), zaaktype)
+            self.assertEqual(
+                snapshot.get_object(StatusType, str(statustype1.uuid)), statustype1
+            )
+            self.assertFalse(snapshot.is_eindstatus(statustype1))
+            self.assertTrue(snapshot.is_eindstatus(statustype2))
+            self.assertTrue(
+                snapshot.is_relevant_informatieobjecttype(
+                    zaaktype.id, relation.informatieobjecttype_id
+                )
+            )
+
+    def test_concept_not_in_snapshot(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=True)
+
+        self.assertIsNone(snapshot.get_object(StatusType, statustype.uuid))
+        self.assertIsNone(
+            snapshot.is_relevant_informatieobjecttype(statustype.zaaktype_id, 1)
+        )
+        self.assertTrue(snapshot.is_eindstatus(statustype))
+
+    @patch("django.db.transaction.on_commit", run_on_commit)
+    def test_publish_loads_new_snapshot(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        self.assertIsNone(snapshot.get_object(ZaakType, zaaktype.uuid))
+
+        response = self.client.post(
+            get_operation_url("zaaktype_publish", uuid=zaaktype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(snapshot.get_object(ZaakType, zaaktype.uuid), zaaktype)
+
+    @patch("django.db.transaction.on_commit", run_on_commit)
+    def test_destroy_loads_new_snapshot(self):
+        statustype = StatusTypeFactory.create(zaaktype__concept=True)
+        loaded = snapshot.get_snapshot()
+        generation = snapshot.get_generation()
+
+        response = self.client.delete(
+            get_operation_url("statustype_read", uuid=statustype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotEqual(snapshot.get_generation(), generation)
+        self.assertIsNot(snapshot.get_snapshot(), loaded)
@@ -3,9 +3,11 @@ from django.contrib import admin
 from privates.admin import PrivateMediaMixin
 
 from .models import (
+    BestandsDeel,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
+    UploadSessie,
 )
 
 
@@ -51,3 +53,26 @@ class GebruiksrechtenAdmin(admin.ModelAdmin):
     list_display = ("uuid", "informatieobject")
     list_filter = ("informatieobject",)
     raw_id_fields = ("informatieobject",)
+
+
+class BestandsDeelInline(admin.TabularInline):
+    model = BestandsDeel
+    fields = ("volgnummer", "omvang")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+@admin.register(UploadSessie)
+class UploadSessieAdmin(admin.ModelAdmin):
+    list_display = (
+        "uuid",
+        "informatieobject",
+        "bestandsomvang",
+        "verloopt_op",
+        "voltooid",
+    )
+    list_filter = ("voltooid",)
+    search_fields = ("uuid",)
+    raw_id_fields = ("informatieobject",)
+    inlines = [BestandsDeelInline]
@@ -0,0 +1,90 @@
+"""
+Parsers for streaming uploads of the document content.
+
+The default JSON parser requires the ``inhoud`` to be base64 encoded in the
+request body, which means the full content is held in memory several times.
+The multipart parser streams the uploaded files to temporary files instead,
+computing their checksum along the way, so the memory usage doesn't depend on
+the file size.
+"""
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.http.multipartparser import (
+    MultiPartParser as DjangoMultiPartParser,
+    MultiPartParserError,
+)
+from django.http.request import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+from djangorestframework_camel_case.util import camel_to_underscore
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+from openzaak.components.documenten.checksums import get_algoritme, new_checksum
+
+
+class ChecksumFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Stream uploaded files to disk and compute their checksum on the fly.
+
+    The hex digest is set as the ``checksum`` attribute of the uploaded file,
+    and the algorithm used as ``checksum_algoritme``.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.checksum_algoritme = get_algoritme()
+        self.checksum = new_checksum(self.checksum_algoritme)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.checksum.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        uploaded_file.checksum = self.checksum.hexdigest()
+        uploaded_file.checksum_algoritme = self.checksum_algoritme
+        return uploaded_file
+
+
+def underscoreize_form_data(data: MultiValueDict, into: MultiValueDict):
+    """
+    Convert the camelCase form field names to snake_case.
+
+    Nested fields keep their dotted names, e.g. ``integriteit.algoritme``, which
+    are handled by the nested serializers.
+    """
+    for key, values in data.lists():
+        name = ".".join(camel_to_underscore(part) for part in key.split("."))
+        into.setlist(name, values)
+    return into
+
+
+class MultiPartParser(parsers.MultiPartParser):
+    """
+    Parse ``multipart/form-data`` with camelCase field names.
+
+    Files are always streamed to temporary files with
+    :class:`ChecksumFileUploadHandler`, regardless of their size. The other
+    form fields are converted to snake_case, like the JSON body.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        request = parser_context["request"]
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        meta = request.META.copy()
+        meta["CONTENT_TYPE"] = media_type
+        upload_handlers = [ChecksumFileUploadHandler(request._request)]
+
+        try:
+            parser = DjangoMultiPartParser(meta, stream, upload_handlers, encoding)
+            data, files = parser.parse()
+        except MultiPartParserError as exc:
+            raise ParseError("Multipart form parse error - %s" % str(exc))
+
+        return parsers.DataAndFiles(
+            underscoreize_form_data(data, QueryDict(mutable=True)),
+            underscoreize_form_data(files, MultiValueDict()),
+        )
@@ -1,3 +1,6 @@
+from django.db.models import F
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
 from openzaak.utils.permissions import AuthRequired
 
 
@@ -13,4 +16,9 @@ class InformationObjectAuthRequired(AuthRequired):
     )
 
     def get_main_object(self, obj, permission_main_object):
-        return getattr(obj, permission_main_object).latest_version
+        # the latest version of the canonical is resolved in the same query
+        # as the permission fields, see ``format_data``
+        canonical_id = getattr(obj, f"{permission_main_object}_id")
+        return EnkelvoudigInformatieObject.objects.filter(
+            canonical_id=canonical_id, canonical__latest_version=F("pk")
+        )
@@ -4,7 +4,8 @@ Serializers of the Document Registratie Component REST API
 import uuid
 
 from django.conf import settings
-from django.db import transaction
+from django.core.files.uploadedfile import UploadedFile
+from django.db import models, transaction
 from django.utils.http import urlencode
 from django.utils.translation import ugettext_lazy as _
 
@@ -23,9 +24,11 @@ from vng_api_common.validators import IsImmutableValidator
 
 from openzaak.components.catalogi.models import InformatieObjectType
 from openzaak.components.documenten.models import (
+    BestandsDeel,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
+    UploadSessie,
 )
 from openzaak.components.documenten.models.constants import (
     ChecksumAlgoritmes,
@@ -52,6 +55,14 @@ class AnyBase64File(Base64FileField):
     def get_file_extension(self, filename, decoded_file):
         return "bin"
 
+    def to_internal_value(self, data):
+        # streamed (multipart) uploads are already written to a file
+        if isinstance(data, UploadedFile):
+            extension = self.get_file_extension(data.name, data)
+            data.name = f"{self.get_file_name(data)}.{extension}"
+            return serializers.FileField.to_internal_value(self, data)
+        return super().to_internal_value(data)
+
     def to_representation(self, file):
         is_private_storage = isinstance(file.storage, PrivateMediaFileSystemStorage)
 
@@ -85,6 +96,21 @@ class AnyBase64File(Base64FileField):
         return f"{url}?{query_string}"
 
 
+class BestandsomvangField(serializers.IntegerField):
+    """
+    Represent the stored size of the inhoud.
+
+    The size is stored when the inhoud is written. Only for versions that are
+    not backfilled yet (see the ``backfill_inhoud_metadata`` management
+    command), the size is read from the storage.
+    """
+
+    def get_attribute(self, instance):
+        if instance.bestandsomvang is not None:
+            return instance.bestandsomvang
+        return instance.inhoud.size
+
+
 class IntegriteitSerializer(GegevensGroepSerializer):
     class Meta:
         model = EnkelvoudigInformatieObject
@@ -138,6 +164,30 @@ class EnkelvoudigInformatieObjectHyperlinkedRelatedField(LengthHyperlinkedRelate
             self.fail("does_not_exist")
 
 
+class InformatieObjectRelationListSerializer(serializers.ListSerializer):
+    """
+    Resolve the latest versions of the related informatieobjecten in bulk.
+
+    Without this, :class:`EnkelvoudigInformatieObjectHyperlinkedRelatedField`
+    looks up the latest version of the canonical for every serialized object.
+    Use it as ``Meta.list_serializer_class`` of serializers with such a field.
+    """
+
+    def to_representation(self, data):
+        iterable = list(data.all() if isinstance(data, models.Manager) else data)
+
+        for field in self.child.fields.values():
+            if field.write_only or not isinstance(
+                field, EnkelvoudigInformatieObjectHyperlinkedRelatedField
+            ):
+                continue
+            EnkelvoudigInformatieObjectCanonical.prefetch_latest_versions(
+                field.get_attribute(instance) for instance in iterable
+            )
+
+        return super().to_representation(iterable)
+
+
 class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     """
     Serializer for the EnkelvoudigInformatieObject model
@@ -163,8 +213,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             f"(or {naturalsize(settings.MIN_UPLOAD_SIZE, binary=True)})"
         ),
     )
-    bestandsomvang = serializers.IntegerField(
-        source="inhoud.size",
+    bestandsomvang = BestandsomvangField(
         read_only=True,
         min_value=0,
         help_text=_("Aantal bytes dat de inhoud van INFORMATIEOBJECT in beslag neemt."),
@@ -292,12 +341,22 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         eio.save()
         return eio
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Instead of updating an existing EnkelvoudigInformatieObject,
         create a new EnkelvoudigInformatieObject with the same
         EnkelvoudigInformatieObjectCanonical
         """
+        # serialize concurrent updates of the same document, so they get
+        # consecutive version numbers
+        canonical = (
+            EnkelvoudigInformatieObjectCanonical.objects.select_for_update().get(
+                pk=instance.canonical_id
+            )
+        )
+        instance.canonical = canonical
+
         instance.integriteit = validated_data.pop("integriteit", None)
         instance.ondertekening = validated_data.pop("ondertekening", None)
 
@@ -307,7 +366,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
                 validated_data[field.name] = getattr(instance, field.name)
 
         validated_data["pk"] = None
-        validated_data["versie"] += 1
+        validated_data["versie"] = (canonical.latest_versie or instance.versie) + 1
 
         # Remove the lock from the data from which a new
         # EnkelvoudigInformatieObject will be created, because lock is not a
@@ -381,7 +440,7 @@ class LockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
 
     def save(self, **kwargs):
         self.instance.lock = uuid.uuid4().hex
-        self.instance.save()
+        self.instance.save(update_fields=["lock"])
 
         return self.instance
 
@@ -413,7 +472,7 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
 
     def save(self, **kwargs):
         self.instance.lock = ""
-        self.instance.save()
+        self.instance.save(update_fields=["lock"])
         return self.instance
 
 
@@ -427,6 +486,7 @@ class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = Gebruiksrechten
+        list_serializer_class = InformatieObjectRelationListSerializer
         fields = (
             "url",
             "informatieobject",
@@ -438,3 +498,142 @@ class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
             "url": {"lookup_field": "uuid"},
             "informatieobject": {"validators": [IsImmutableValidator()]},
         }
+
+
+class BestandsDeelStatusSerializer(serializers.Serializer):
+    volgnummer = serializers.IntegerField(
+        read_only=True, help_text=_("Het volgnummer van het deel, beginnend bij 1.")
+    )
+    omvang = serializers.IntegerField(
+        read_only=True, help_text=_("Het verwachte aantal bytes van het deel.")
+    )
+    ontvangen = serializers.BooleanField(
+        read_only=True, help_text=_("Geeft aan of het deel ontvangen is.")
+    )
+
+
+class UploadSessieSerializer(serializers.HyperlinkedModelSerializer):
+    informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
+        view_name="enkelvoudiginformatieobject-detail",
+        lookup_field="uuid",
+        queryset=EnkelvoudigInformatieObject.objects,
+        help_text=get_help_text("documenten.UploadSessie", "informatieobject"),
+    )
+    delen = BestandsDeelStatusSerializer(
+        source="get_delen",
+        many=True,
+        read_only=True,
+        help_text=_(
+            "De delen van de inhoud. Elk deel wordt geupload met een `PUT` naar "
+            "`<url>/delen/<volgnummer>`."
+        ),
+    )
+
+    class Meta:
+        model = UploadSessie
+        fields = (
+            "url",
+            "informatieobject",
+            "lock",
+            "bestandsnaam",
+            "bestandsomvang",
+            "deel_omvang",
+            "verloopt_op",
+            "voltooid",
+            "delen",
+        )
+        extra_kwargs = {
+            "url": {"lookup_field": "uuid"},
+            "lock": {"write_only": True},
+            "deel_omvang": {"read_only": True},
+            "verloopt_op": {"read_only": True},
+            "voltooid": {"read_only": True},
+        }
+
+    def validate(self, attrs):
+        valid_attrs = super().validate(attrs)
+
+        canonical = valid_attrs["informatieobject"]
+        if not canonical.lock or valid_attrs["lock"] != canonical.lock:
+            raise serializers.ValidationError(
+                _("Lock id is not correct"), code="incorrect-lock-id"
+            )
+        return valid_attrs
+
+    def create(self, validated_data):
+        validated_data["deel_omvang"] = settings.UPLOAD_DEEL_OMVANG
+        return super().create(validated_data)
+
+
+class BestandsDeelSerializer(serializers.ModelSerializer):
+    """
+    Upload a part of the content of an upload sessie.
+
+    The ``upload_sessie`` and the ``volgnummer`` of the part are passed in the
+    serializer context.
+    """
+
+    inhoud = serializers.FileField(
+        write_only=True, help_text=_("De binaire inhoud van het deel.")
+    )
+
+    class Meta:
+        model = BestandsDeel
+        fields = ("volgnummer", "omvang", "inhoud")
+        read_only_fields = ("volgnummer", "omvang")
+
+    def validate(self, attrs):
+        valid_attrs = super().validate(attrs)
+        upload_sessie = self.context["upload_sessie"]
+        volgnummer = self.context["volgnummer"]
+
+        if upload_sessie.voltooid:
+            raise serializers.ValidationError(
+                _("The upload is already completed"), code="upload-completed"
+            )
+        if upload_sessie.is_verlopen:
+            raise serializers.ValidationError(
+                _("The upload has expired"), code="upload-expired"
+            )
+        if upload_sessie.lock != upload_sessie.informatieobject.lock:
+            raise serializers.ValidationError(
+                _("The document is no longer locked for this upload"),
+                code="incorrect-lock-id",
+            )
+        if not 1 <= volgnummer <= upload_sessie.aantal_delen:
+            raise serializers.ValidationError(
+                _("The upload consists of {aantal} parts").format(
+                    aantal=upload_sessie.aantal_delen
+                ),
+                code="invalid-volgnummer",
+            )
+
+        omvang = upload_sessie.get_deel_omvang(volgnummer)
+        if valid_attrs["inhoud"].size != omvang:
+            raise serializers.ValidationError(
+                {
+                    "inhoud": _("The part must be exactly {omvang} bytes").format(
+                        omvang=omvang
+                    )
+                },
+                code="invalid-omvang",
+            )
+        return valid_attrs
+
+    def create(self, validated_data):
+        validated_data.update(
+            {
+                "upload_sessie": self.context["upload_sessie"],
+                "volgnummer": self.context["volgnummer"],
+                "omvang": validated_data["inhoud"].size,
+            }
+        )
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        # a part is uploaded again, e.g. after a failed request
+        storage, old_name = instance.inhoud.storage, instance.inhoud.name
+        validated_data["omvang"] = validated_data["inhoud"].size
+        instance = super().update(instance, validated_data)
+        transaction.on_commit(lambda: storage.delete(old_name))
+        return instance
@@ -0,0 +1,130 @@
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from sendfile import _get_sendfile
+
+from openzaak.components.documenten.api.tests.utils import get_operation_url
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.utils.downloads import RangeNotSatisfiable, parse_range
+from openzaak.utils.tests import JWTAuthMixin
+
+
+@temp_private_root()
+class DownloadTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        self.eio = EnkelvoudigInformatieObjectFactory.create()
+        self.file_url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=self.eio.uuid
+        )
+
+    def test_validators(self):
+        response = self.client.get(self.file_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], f'"{self.eio.checksum}"')
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Length"], "9")
+        self.assertEqual(response.getvalue(), b"some data")
+
+    def test_if_none_match(self):
+        response = self.client.get(
+            self.file_url, HTTP_IF_NONE_MATCH=f'"{self.eio.checksum}"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], f'"{self.eio.checksum}"')
+
+    def test_if_none_match_changed(self):
+        response = self.client.get(self.file_url, HTTP_IF_NONE_MATCH='"other"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_range(self):
+        response = self.client.get(self.file_url, HTTP_RANGE="bytes=0-3")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response["Content-Range"], "bytes 0-3/9")
+        self.assertEqual(response["Content-Length"], "4")
+        self.assertEqual(response.getvalue(), b"some")
+
+    def test_suffix_range(self):
+        response = self.client.get(self.file_url, HTTP_RANGE="bytes=-4")
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response["Content-Range"], "bytes 5-8/9")
+        self.assertEqual(response.getvalue(), b"data")
+
+    def test_range_not_satisfiable(self):
+        response = self.client.get(self.file_url, HTTP_RANGE="bytes=20-")
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */9")
+
+    def test_if_range_changed(self):
+        response = self.client.get(
+            self.file_url, HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE='"other"'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"some data")
+
+    def test_if_range_current(self):
+        response = self.client.get(
+            self.file_url,
+            HTTP_RANGE="bytes=0-3",
+            HTTP_IF_RANGE=f'"{self.eio.checksum}"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+
+    def test_offloaded_to_nginx(self):
+        _get_sendfile.clear()
+        self.addCleanup(_get_sendfile.clear)
+
+        with self.settings(
+            SENDFILE_BACKEND="sendfile.backends.nginx",
+            SENDFILE_ROOT=settings.PRIVATE_MEDIA_ROOT,
+        ):
+            response = self.client.get(self.file_url, HTTP_RANGE="bytes=0-3")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["X-Accel-Redirect"], f"/private-media/{self.eio.inhoud.name}"
+        )
+        self.assertEqual(response["ETag"], f'"{self.eio.checksum}"')
+        self.assertEqual(response.content, b"")
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = (
+            ("bytes=0-3", (0, 3)),
+            ("bytes=5-", (5, 9)),
+            ("bytes=-3", (7, 9)),
+            ("bytes=-20", (0, 9)),
+            ("bytes=5-100", (5, 9)),
+            ("bytes=5-3", None),
+            ("bytes=0-1,4-5", None),
+            ("items=0-3", None),
+        )
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 10), expected)
+
+    def test_not_satisfiable(self):
+        for header in ("bytes=10-", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(RangeNotSatisfiable):
+                    parse_range(header, 10)
@@ -522,7 +522,7 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         response = self.client.get(eio_url, {"versie": "1"})
 
         response = self.client.get(response.data["inhoud"])
-        self.assertEqual(response._container[0], b"inhoud1")
+        self.assertEqual(response.getvalue(), b"inhoud1")
 
     def test_eio_download_content_filter_by_registratie(self):
         with freeze_time("2019-01-01 12:00:00"):
@@ -547,7 +547,7 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         response = self.client.get(eio_url, {"registratieOp": "2019-01-01T12:00:00"})
 
         response = self.client.get(response.data["inhoud"])
-        self.assertEqual(response._container[0], b"inhoud1")
+        self.assertEqual(response.getvalue(), b"inhoud1")
 
 
 class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APITestCase):
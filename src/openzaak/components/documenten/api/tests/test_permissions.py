@@ -0,0 +1,72 @@
+"""
+Query-count benchmarks for the permission field projection.
+"""
+from unittest.mock import Mock
+
+from rest_framework.test import APITestCase
+
+from openzaak.components.documenten.models import (
+    EnkelvoudigInformatieObject,
+    Gebruiksrechten,
+)
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+)
+from openzaak.utils.tests import get_versioned_request
+
+from ..permissions import InformationObjectAuthRequired
+from ..serializers import EnkelvoudigInformatieObjectSerializer
+from ..viewsets import GebruiksrechtenViewSet
+
+
+class InformationObjectAuthRequiredQueryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = get_versioned_request()
+
+    def test_format_data_matches_serializer(self):
+        eio = EnkelvoudigInformatieObject.objects.get(
+            pk=EnkelvoudigInformatieObjectFactory.create().pk
+        )
+
+        with self.assertNumQueries(1):
+            data = InformationObjectAuthRequired().format_data(eio, self.request)
+
+        serializer_data = EnkelvoudigInformatieObjectSerializer(
+            eio, context={"request": self.request}
+        ).data
+        self.assertEqual(
+            data,
+            {
+                "informatieobjecttype": serializer_data["informatieobjecttype"],
+                "vertrouwelijkheidaanduiding": serializer_data[
+                    "vertrouwelijkheidaanduiding"
+                ],
+            },
+        )
+
+    def test_object_permission_latest_version_num_queries(self):
+        gebruiksrechten = GebruiksrechtenFactory.create()
+        canonical = gebruiksrechten.informatieobject
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=canonical,
+            versie=2,
+            vertrouwelijkheidaanduiding="geheim",
+            informatieobjecttype=canonical.latest_version.informatieobjecttype,
+        )
+        gebruiksrechten = Gebruiksrechten.objects.get(pk=gebruiksrechten.pk)
+        self.request.jwt_auth = Mock(**{"has_auth.return_value": True})
+        view = GebruiksrechtenViewSet(action="retrieve", request=self.request)
+
+        # latest version + informatieobjecttype, in one query
+        with self.assertNumQueries(1):
+            has_permission = InformationObjectAuthRequired().has_object_permission(
+                self.request, view, gebruiksrechten
+            )
+
+        self.assertTrue(has_permission)
+        self.assertEqual(
+            self.request.jwt_auth.has_auth.call_args[1]["vertrouwelijkheidaanduiding"],
+            "geheim",
+        )
@@ -0,0 +1,79 @@
+"""
+Guard the number of queries of the list endpoints.
+
+The number of queries must not depend on the number of rendered objects.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObjectCanonical
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+
+def create_gebruiksrechten():
+    gebruiksrechten = GebruiksrechtenFactory.create()
+    EnkelvoudigInformatieObjectFactory.create(
+        canonical=gebruiksrechten.informatieobject, versie=2
+    )
+    return gebruiksrechten
+
+
+class GebruiksrechtenListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("gebruiksrechten-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_num_queries_independent_of_page_size(self):
+        gebruiksrechten = create_gebruiksrechten()
+        num_queries = self.get_num_queries()
+
+        for _ in range(5):
+            create_gebruiksrechten()
+
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+        response = self.client.get(reverse(gebruiksrechten))
+
+        latest_version = gebruiksrechten.informatieobject.latest_version
+        self.assertEqual(latest_version.versie, 2)
+        self.assertEqual(
+            response.json()["informatieobject"],
+            f"http://testserver{reverse(latest_version)}",
+        )
+
+
+class PrefetchLatestVersionsTests(APITestCase):
+    def test_prefetch_latest_versions(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        latest = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, versie=3
+        )
+        EnkelvoudigInformatieObjectFactory.create(canonical=eio.canonical, versie=2)
+        other = EnkelvoudigInformatieObjectFactory.create()
+        canonicals = list(EnkelvoudigInformatieObjectCanonical.objects.all())
+
+        with self.assertNumQueries(1):
+            EnkelvoudigInformatieObjectCanonical.prefetch_latest_versions(canonicals)
+
+        with self.assertNumQueries(0):
+            latest_versions = {
+                canonical.pk: canonical.latest_version.uuid for canonical in canonicals
+            }
+
+        self.assertEqual(
+            latest_versions,
+            {eio.canonical.pk: latest.uuid, other.canonical.pk: other.uuid},
+        )
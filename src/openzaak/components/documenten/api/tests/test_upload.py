@@ -0,0 +1,105 @@
+import hashlib
+import uuid
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import (
+    InformatieObjectTypeFactory,
+)
+from openzaak.components.documenten.api.parsers import ChecksumFileUploadHandler
+from openzaak.components.documenten.api.tests.utils import get_operation_url
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+
+@temp_private_root()
+class MultipartUploadTests(JWTAuthMixin, APITestCase):
+
+    list_url = reverse(EnkelvoudigInformatieObject)
+    heeft_alle_autorisaties = True
+
+    def test_create_multipart(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create()
+        content = {
+            "identificatie": uuid.uuid4().hex,
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "detailed summary",
+            "auteur": "test_auteur",
+            "formaat": "txt",
+            "taal": "eng",
+            "bestandsnaam": "dummy.txt",
+            "inhoud": SimpleUploadedFile("dummy.txt", b"some file content"),
+            "informatieobjecttype": f"http://testserver{reverse(informatieobjecttype)}",
+            "vertrouwelijkheidaanduiding": "openbaar",
+            "integriteit.algoritme": "md5",
+            "integriteit.waarde": "abcd",
+            "integriteit.datum": "2018-06-27",
+        }
+
+        response = self.client.post(self.list_url, content, format="multipart")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        stored_object = EnkelvoudigInformatieObject.objects.get()
+        self.assertEqual(stored_object.inhoud.read(), b"some file content")
+        self.assertTrue(stored_object.inhoud.name.endswith(".bin"))
+        self.assertEqual(stored_object.bestandsnaam, "dummy.txt")
+        self.assertEqual(stored_object.integriteit_algoritme, "md5")
+        self.assertEqual(stored_object.integriteit_waarde, "abcd")
+
+        data = response.json()
+        self.assertEqual(data["bestandsomvang"], 17)
+        self.assertEqual(data["integriteit"]["algoritme"], "md5")
+        self.assertEqual(
+            data["inhoud"],
+            "http://testserver{}?versie=1".format(
+                get_operation_url(
+                    "enkelvoudiginformatieobject_download", uuid=stored_object.uuid
+                )
+            ),
+        )
+
+    def test_update_multipart(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(
+            eio_url,
+            {
+                "inhoud": SimpleUploadedFile("new.txt", b"new content"),
+                "lock": lock,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        latest_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(latest_version.inhoud.read(), b"new content")
+
+
+class ChecksumFileUploadHandlerTests(SimpleTestCase):
+    def test_checksum_is_computed_per_chunk(self):
+        handler = ChecksumFileUploadHandler()
+        handler.new_file("inhoud", "dummy.txt", "text/plain", None)
+        handler.receive_data_chunk(b"some file ", 0)
+        handler.receive_data_chunk(b"content", 10)
+
+        uploaded_file = handler.file_complete(17)
+
+        self.addCleanup(uploaded_file.close)
+        self.assertEqual(uploaded_file.size, 17)
+        self.assertEqual(
+            uploaded_file.checksum, hashlib.sha256(b"some file content").hexdigest()
+        )
+        uploaded_file.seek(0)
+        self.assertEqual(uploaded_file.read(), b"some file content")
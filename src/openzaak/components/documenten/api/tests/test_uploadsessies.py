@@ -0,0 +1,217 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.components.documenten.models import (
+    BestandsDeel,
+    EnkelvoudigInformatieObjectCanonical,
+    UploadSessie,
+)
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.notifications.models import OutboxNotification
+from openzaak.utils.tests import JWTAuthMixin
+
+
+@temp_private_root()
+@override_settings(UPLOAD_DEEL_OMVANG=4)
+class UploadSessieTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.eio = EnkelvoudigInformatieObjectFactory.create(
+            bestandsnaam="oud.txt", inhoud__data=b"old content"
+        )
+        self.eio_url = f"http://testserver{reverse(self.eio)}"
+        self.lock = self.client.post(f"{reverse(self.eio)}/lock").data["lock"]
+
+    def create_upload_sessie(self, **kwargs) -> dict:
+        data = {
+            "informatieobject": self.eio_url,
+            "lock": self.lock,
+            "bestandsnaam": "nieuw.txt",
+            "bestandsomvang": 10,
+            **kwargs,
+        }
+        response = self.client.post(reverse(UploadSessie), data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.json()
+
+    def upload_deel(self, upload_sessie: dict, volgnummer: int, content: bytes):
+        return self.client.put(
+            f"{upload_sessie['url']}/delen/{volgnummer}",
+            {"inhoud": SimpleUploadedFile("deel.bin", content)},
+            format="multipart",
+        )
+
+    def test_create(self):
+        upload_sessie = self.create_upload_sessie()
+
+        self.assertEqual(upload_sessie["deelOmvang"], 4)
+        self.assertFalse(upload_sessie["voltooid"])
+        self.assertEqual(
+            upload_sessie["delen"],
+            [
+                {"volgnummer": 1, "omvang": 4, "ontvangen": False},
+                {"volgnummer": 2, "omvang": 4, "ontvangen": False},
+                {"volgnummer": 3, "omvang": 2, "ontvangen": False},
+            ],
+        )
+
+    def test_create_incorrect_lock(self):
+        response = self.client.post(
+            reverse(UploadSessie),
+            {"informatieobject": self.eio_url, "lock": "foo", "bestandsomvang": 10},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "incorrect-lock-id")
+
+    def test_upload_in_any_order(self):
+        upload_sessie = self.create_upload_sessie()
+
+        response = self.upload_deel(upload_sessie, 3, b"ud")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            [deel["ontvangen"] for deel in response.json()["delen"]],
+            [False, False, True],
+        )
+        self.upload_deel(upload_sessie, 1, b"new ")
+        response = self.upload_deel(upload_sessie, 2, b"conten")
+
+        # the part is rejected, it has the wrong size
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "inhoud")
+        self.assertEqual(error["code"], "invalid-omvang")
+
+        response = self.upload_deel(upload_sessie, 2, b"cont")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertTrue(response.json()["voltooid"])
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get()
+        latest_version = canonical.latest_version
+        self.assertEqual(latest_version.versie, 2)
+        self.assertEqual(latest_version.bestandsnaam, "nieuw.txt")
+        self.assertEqual(latest_version.inhoud.read(), b"new contud")
+        self.assertEqual(latest_version.titel, self.eio.titel)
+        # the document is still locked, until the client unlocks it
+        self.assertEqual(canonical.lock, self.lock)
+        self.assertFalse(BestandsDeel.objects.exists())
+
+    @override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=True)
+    def test_complete_audited_and_notified(self):
+        upload_sessie = self.create_upload_sessie(bestandsomvang=4)
+
+        response = self.upload_deel(upload_sessie, 1, b"abcd")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertTrue(response.json()["voltooid"])
+
+        audittrail = AuditTrail.objects.get(hoofd_object=self.eio_url)
+        self.assertEqual(audittrail.actie, CommonResourceAction.update)
+        self.assertEqual(audittrail.resource, "enkelvoudiginformatieobject")
+        self.assertEqual(audittrail.oud["bestandsnaam"], "oud.txt")
+        self.assertEqual(audittrail.nieuw["bestandsnaam"], "nieuw.txt")
+
+        notification = OutboxNotification.objects.get()
+        self.assertEqual(notification.kanaal, "documenten")
+        self.assertEqual(notification.hoofd_object, self.eio_url)
+        self.assertEqual(notification.bericht["actie"], "update")
+
+    def test_failed_assembly_released(self):
+        upload_sessie = self.create_upload_sessie(bestandsomvang=4)
+
+        with patch.object(UploadSessie, "assemble", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self.upload_deel(upload_sessie, 1, b"abcd")
+
+        self.assertIsNone(UploadSessie.objects.get().samenvoegen_gestart)
+
+        # the part is uploaded again
+        response = self.upload_deel(upload_sessie, 1, b"abcd")
+
+        self.assertTrue(response.json()["voltooid"])
+        self.assertEqual(
+            EnkelvoudigInformatieObjectCanonical.objects.get().latest_version.versie, 2
+        )
+
+    def test_upload_part_again(self):
+        upload_sessie = self.create_upload_sessie(bestandsomvang=8)
+
+        self.upload_deel(upload_sessie, 1, b"abcd")
+        self.upload_deel(upload_sessie, 1, b"efgh")
+        self.upload_deel(upload_sessie, 2, b"ijkl")
+
+        latest_version = (
+            EnkelvoudigInformatieObjectCanonical.objects.get().latest_version
+        )
+        self.assertEqual(latest_version.inhoud.read(), b"efghijkl")
+
+    def test_upload_invalid_volgnummer(self):
+        upload_sessie = self.create_upload_sessie()
+
+        response = self.upload_deel(upload_sessie, 4, b"ab")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-volgnummer")
+
+    def test_upload_after_unlock(self):
+        upload_sessie = self.create_upload_sessie()
+        self.client.post(f"{reverse(self.eio)}/unlock", {"lock": self.lock})
+
+        response = self.upload_deel(upload_sessie, 1, b"new ")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "incorrect-lock-id")
+
+    def test_upload_expired(self):
+        upload_sessie = self.create_upload_sessie()
+        UploadSessie.objects.update(verloopt_op=timezone.now() - timedelta(minutes=1))
+
+        response = self.upload_deel(upload_sessie, 1, b"new ")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "upload-expired")
+
+    def test_destroy(self):
+        upload_sessie = self.create_upload_sessie()
+        self.upload_deel(upload_sessie, 1, b"new ")
+
+        response = self.client.delete(upload_sessie["url"])
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(UploadSessie.objects.exists())
+        self.assertFalse(BestandsDeel.objects.exists())
+
+    def test_clean_expired_upload_sessies(self):
+        expired = self.create_upload_sessie()
+        self.upload_deel(expired, 1, b"new ")
+        UploadSessie.objects.update(verloopt_op=timezone.now() - timedelta(minutes=1))
+        active = self.create_upload_sessie()
+
+        call_command("clean_upload_sessies", stdout=StringIO())
+
+        upload_sessie = UploadSessie.objects.get()
+        self.assertEqual(f"http://testserver{reverse(upload_sessie)}", active["url"])
+        self.assertFalse(BestandsDeel.objects.exists())
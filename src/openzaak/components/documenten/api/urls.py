@@ -9,6 +9,7 @@ from .viewsets import (
     EnkelvoudigInformatieObjectAuditTrailViewSet,
     EnkelvoudigInformatieObjectViewSet,
     GebruiksrechtenViewSet,
+    UploadSessieViewSet,
 )
 
 router = routers.DefaultRouter()
@@ -19,6 +20,7 @@ router.register(
     basename="enkelvoudiginformatieobject",
 )
 router.register("gebruiksrechten", GebruiksrechtenViewSet)
+router.register("uploadsessies", UploadSessieViewSet)
 
 
 # set the path to schema file
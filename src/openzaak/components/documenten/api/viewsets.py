@@ -1,27 +1,28 @@
 from django.db import transaction
+from django.db.models import F
 from django.utils.translation import ugettext_lazy as _
 
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import status, viewsets
+from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
-from sendfile import sendfile
-from vng_api_common.audittrails.viewsets import (
-    AuditTrailViewSet,
-    AuditTrailViewsetMixin,
-)
-from vng_api_common.notifications.viewsets import NotificationViewSetMixin
+from vng_api_common.constants import CommonResourceAction
 from vng_api_common.serializers import FoutSerializer
 
+from openzaak.audittrails.viewsets import AuditTrailViewSet, AuditTrailViewsetMixin
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
+    UploadSessie,
 )
+from openzaak.notifications.viewsets import NotificationViewSetMixin
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.downloads import serve_file
+from openzaak.utils.pagination import OptionalCursorPagination
 
 from .audits import AUDIT_DRC
 from .filters import (
@@ -30,6 +31,7 @@ from .filters import (
     GebruiksrechtenFilter,
 )
 from .kanalen import KANAAL_DOCUMENTEN
+from .parsers import MultiPartParser
 from .permissions import InformationObjectAuthRequired
 from .scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
@@ -40,11 +42,13 @@ from .scopes import (
     SCOPE_DOCUMENTEN_LOCK,
 )
 from .serializers import (
+    BestandsDeelSerializer,
     EnkelvoudigInformatieObjectSerializer,
     EnkelvoudigInformatieObjectWithLockSerializer,
     GebruiksrechtenSerializer,
     LockEnkelvoudigInformatieObjectSerializer,
     UnlockEnkelvoudigInformatieObjectSerializer,
+    UploadSessieSerializer,
 )
 
 # Openapi query parameters for version querying
@@ -62,6 +66,8 @@ REGISTRATIE_QUERY_PARAM = openapi.Parameter(
     type=openapi.TYPE_STRING,
 )
 
+VERSION_QUERY_PARAMS = (VERSIE_QUERY_PARAM.name, REGISTRATIE_QUERY_PARAM.name)
+
 
 class EnkelvoudigInformatieObjectViewSet(
     NotificationViewSetMixin,
@@ -151,12 +157,13 @@ class EnkelvoudigInformatieObjectViewSet(
     ontgrendeld wordt.
     """
 
-    queryset = EnkelvoudigInformatieObject.objects.order_by(
-        "canonical", "-versie"
-    ).distinct("canonical")
+    queryset = EnkelvoudigInformatieObject.objects.filter(
+        canonical__latest_version=F("pk")
+    ).order_by("canonical")
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
+    parser_classes = (*api_settings.DEFAULT_PARSER_CLASSES, MultiPartParser)
     permission_classes = (InformationObjectAuthRequired,)
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -189,6 +196,18 @@ class EnkelvoudigInformatieObjectViewSet(
 
         super().perform_destroy(instance.canonical)
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # an older version is requested, look it up among all versions
+        if self.detail and any(
+            param in self.request.query_params for param in VERSION_QUERY_PARAMS
+        ):
+            queryset = EnkelvoudigInformatieObject.objects.order_by(
+                "canonical", "-versie"
+            ).distinct("canonical")
+        return queryset
+
     @property
     def filterset_class(self):
         """
@@ -223,6 +242,13 @@ class EnkelvoudigInformatieObjectViewSet(
                 "De binaire bestandsinhoud",
                 schema=openapi.Schema(type=openapi.TYPE_FILE),
             ),
+            status.HTTP_206_PARTIAL_CONTENT: openapi.Response(
+                "Het gevraagde deel (`Range` header) van de binaire bestandsinhoud",
+                schema=openapi.Schema(type=openapi.TYPE_FILE),
+            ),
+            status.HTTP_304_NOT_MODIFIED: openapi.Response(
+                "De bestandsinhoud is niet gewijzigd (`If-None-Match` header)"
+            ),
             status.HTTP_401_UNAUTHORIZED: openapi.Response(
                 "Unauthorized", schema=FoutSerializer
             ),
@@ -251,11 +277,10 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(methods=["get"], detail=True, name="enkelvoudiginformatieobject_download")
     def download(self, request, *args, **kwargs):
         eio = self.get_object()
-        return sendfile(
-            request,
-            eio.inhoud.path,
-            attachment=True,
-            mimetype="application/octet-stream",
+        # the content of a version never changes
+        etag = eio.checksum or f"{eio.uuid.hex}-{eio.versie}"
+        return serve_file(
+            request, eio.inhoud.path, etag, last_modified=eio.begin_registratie
         )
 
     @swagger_auto_schema(
@@ -334,7 +359,7 @@ class EnkelvoudigInformatieObjectViewSet(
     @action(detail=True, methods=["post"])
     def unlock(self, request, *args, **kwargs):
         eio = self.get_object()
-        eio_data = self.get_serializer(eio).data
+        eio_data = InformationObjectAuthRequired().format_data(eio, request)
         canonical = eio.canonical
 
         # check if it's a force unlock by administrator
@@ -402,7 +427,9 @@ class GebruiksrechtenViewSet(
       `null` gezet.
     """
 
-    queryset = Gebruiksrechten.objects.all()
+    queryset = Gebruiksrechten.objects.select_related(
+        "informatieobject__latest_version"
+    )
     serializer_class = GebruiksrechtenSerializer
     filterset_class = GebruiksrechtenFilter
     lookup_field = "uuid"
@@ -422,6 +449,131 @@ class GebruiksrechtenViewSet(
     audittrail_main_resource_key = "informatieobject"
 
 
+class UploadSessieViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    Upload de inhoud van een (ENKELVOUDIG) INFORMATIEOBJECT in delen.
+
+    create:
+    Start het uploaden van de inhoud in delen.
+
+    Het (ENKELVOUDIG) INFORMATIEOBJECT moet vergrendeld zijn, en de `lock`
+    waarde moet meegegeven worden. De inhoud wordt opgedeeld in delen van
+    `deelOmvang` bytes, die in willekeurige volgorde en parallel geupload
+    kunnen worden.
+
+    retrieve:
+    Een specifieke UPLOADSESSIE opvragen.
+
+    Geeft aan welke delen ontvangen zijn, zodat een onderbroken upload
+    hervat kan worden.
+
+    destroy:
+    Breek het uploaden af.
+
+    De ontvangen delen worden verwijderd.
+
+    deel:
+    Upload een deel van de inhoud.
+
+    Het deel wordt als `inhoud` in een `multipart/form-data` request
+    meegestuurd. Zodra alle delen ontvangen zijn, worden ze samengevoegd tot
+    de inhoud van een nieuwe versie van het (ENKELVOUDIG) INFORMATIEOBJECT.
+    """
+
+    queryset = UploadSessie.objects.select_related("informatieobject")
+    serializer_class = UploadSessieSerializer
+    lookup_field = "uuid"
+    permission_classes = (InformationObjectAuthRequired,)
+    permission_main_object = "informatieobject"
+    required_scopes = {
+        "retrieve": SCOPE_DOCUMENTEN_BIJWERKEN,
+        "create": SCOPE_DOCUMENTEN_BIJWERKEN,
+        "destroy": SCOPE_DOCUMENTEN_BIJWERKEN,
+        "deel": SCOPE_DOCUMENTEN_BIJWERKEN,
+    }
+
+    @swagger_auto_schema(
+        request_body=BestandsDeelSerializer, responses={200: UploadSessieSerializer}
+    )
+    @action(
+        detail=True,
+        methods=["put"],
+        url_path=r"delen/(?P<volgnummer>\d+)",
+        parser_classes=(MultiPartParser,),
+    )
+    def deel(self, request, volgnummer, *args, **kwargs):
+        upload_sessie = self.get_object()
+        volgnummer = int(volgnummer)
+
+        serializer = BestandsDeelSerializer(
+            upload_sessie.delen.filter(volgnummer=volgnummer).first(),
+            data=request.data,
+            context={
+                "request": request,
+                "upload_sessie": upload_sessie,
+                "volgnummer": volgnummer,
+            },
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        if upload_sessie.claim():
+            self.complete(upload_sessie)
+
+        output = self.get_serializer(upload_sessie)
+        return Response(output.data)
+
+    def complete(self, upload_sessie: UploadSessie) -> EnkelvoudigInformatieObject:
+        """
+        Assemble the parts into a new version of the document.
+
+        The new version gets the audit trail and the notification of an update
+        of the document.
+        """
+        viewset = EnkelvoudigInformatieObjectViewSet(
+            request=self.request,
+            format_kwarg=self.format_kwarg,
+            basename="enkelvoudiginformatieobject",
+            action="update",
+            kwargs={},
+        )
+
+        try:
+            inhoud = upload_sessie.assemble()
+
+            with transaction.atomic():
+                canonicals = EnkelvoudigInformatieObjectCanonical.objects.all()
+                canonical = canonicals.select_for_update().get(
+                    pk=upload_sessie.informatieobject_id
+                )
+                version_before_edit = viewset.get_serializer(
+                    canonical.latest_version
+                ).data
+
+                version = upload_sessie.create_version(inhoud)
+
+                data = viewset.get_serializer(version).data
+                viewset.create_audittrail(
+                    status.HTTP_200_OK,
+                    CommonResourceAction.update,
+                    version_before_edit=version_before_edit,
+                    version_after_edit=data,
+                    unique_representation=version.unique_representation(),
+                )
+                viewset.notify(status.HTTP_200_OK, data, instance=version)
+        except Exception:
+            # let the next upload of a part assemble the content again
+            upload_sessie.release()
+            raise
+
+        return version
+
+
 class EnkelvoudigInformatieObjectAuditTrailViewSet(AuditTrailViewSet):
     """
     Opvragen van de audit trail regels.
@@ -0,0 +1,38 @@
+"""
+Server side checksums of the document content.
+
+The checksum of the ``inhoud`` is computed once, when the content is written,
+with the ``settings.INHOUD_CHECKSUM_ALGORITME`` algorithm.
+"""
+import hashlib
+
+from django.conf import settings
+
+from .models.constants import ChecksumAlgoritmes
+
+# the ChecksumAlgoritmes that can be computed, mapped to the hashlib name
+HASHLIB_ALGORITHMS = {
+    ChecksumAlgoritmes.md5: "md5",
+    ChecksumAlgoritmes.sha_1: "sha1",
+    ChecksumAlgoritmes.sha_256: "sha256",
+    ChecksumAlgoritmes.sha_512: "sha512",
+    ChecksumAlgoritmes.sha_3: "sha3_256",
+}
+
+
+def get_algoritme() -> str:
+    return settings.INHOUD_CHECKSUM_ALGORITME
+
+
+def new_checksum(algoritme: str = None):
+    return hashlib.new(HASHLIB_ALGORITHMS[algoritme or get_algoritme()])
+
+
+def compute_checksum(file, algoritme: str = None) -> str:
+    """
+    Compute the checksum of a (Django) ``File``, reading it in chunks.
+    """
+    checksum = new_checksum(algoritme)
+    for chunk in file.chunks():
+        checksum.update(chunk)
+    return checksum.hexdigest()
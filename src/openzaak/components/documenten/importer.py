@@ -0,0 +1,466 @@
+"""
+Bulk import of documents from a local directory.
+
+The documents are described in a manifest: a CSV file, or a file with a JSON
+object per line (``.jsonl``). Every row has the fields of the Documenten API,
+minus the ``inhoud``, plus:
+
+* ``bestand``: the path of the file with the content, relative to the
+  directory of the manifest
+* ``zaak`` (optional): the URL of a zaak to relate the document to
+
+The columns of a CSV manifest are named like the camelCase attributes, with
+the attributes of gegevensgroepen separated by a dot, e.g.
+``integriteit.algoritme``. Empty values are left out.
+
+The checksums of the files are computed in a pool of worker processes. The
+files are hardlinked (or copied, or moved) into the private media root - with
+``settings.INHOUD_DEDUPLICATION`` enabled as the content-addressed blob - and
+the documents are inserted per batch with ``bulk_create``. Audit trails and
+notifications are stored like the zaken import does.
+
+Every row gets a UUID derived from its line number and its content, so an
+interrupted import is resumed by running it again with the same manifest: the
+rows that were imported before are skipped.
+"""
+import csv
+import errno
+import json
+import os
+import shutil
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4, uuid5
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework import serializers
+from vng_api_common.constants import RelatieAarden
+
+from openzaak.audittrails.buffer import AuditTrailBuffer
+from openzaak.components.zaken.api.audits import AUDIT_ZRC
+from openzaak.components.zaken.api.kanalen import KANAAL_ZAKEN
+from openzaak.components.zaken.api.serializers import (
+    ZaakInformatieObjectSerializer,
+    ZaakSerializer,
+)
+from openzaak.components.zaken.api.validators import (
+    ZaaktypeInformatieobjecttypeRelationValidator,
+)
+from openzaak.components.zaken.models import Zaak, ZaakInformatieObject
+from openzaak.notifications.models import OutboxNotification
+from openzaak.utils.data_filtering import get_va_order
+from openzaak.utils.imports import IdentificatieGenerator, get_request, record_create
+
+from .api.audits import AUDIT_DRC
+from .api.kanalen import KANAAL_DOCUMENTEN
+from .api.serializers import EnkelvoudigInformatieObjectSerializer
+from .checksums import get_algoritme, new_checksum
+from .models import EnkelvoudigInformatieObject, EnkelvoudigInformatieObjectCanonical
+from .models.constants import ChecksumAlgoritmes
+from .storage import ContentAddressedStorage, get_blob_name
+
+# the namespace of the UUIDs of imported documents
+IMPORT_NAMESPACE = UUID("0b8f7c4e-5a2d-4a0e-9d0c-3c6f1f9a8e21")
+
+CHUNK_SIZE = 64 * 2 ** 10
+
+
+class Modes:
+    link = "link"
+    copy = "copy"
+    move = "move"
+
+    choices = (link, copy, move)
+
+
+def read_manifest(path: str) -> Iterator[Tuple[int, dict]]:
+    """
+    Yield the line number and the data of the rows of a CSV or JSONL manifest.
+
+    Raises ``ValueError`` if a line of a JSONL manifest is not valid JSON.
+    """
+    with open(path, newline="") as manifest:
+        if path.endswith(".csv"):
+            reader = csv.DictReader(manifest)
+            for row in reader:
+                yield reader.line_num, parse_csv_row(row)
+        else:
+            for line, content in enumerate(manifest, start=1):
+                if not content.strip():
+                    continue
+                try:
+                    data = json.loads(content)
+                except ValueError as exc:
+                    raise ValueError(f"line {line}: {exc}") from exc
+                yield line, data
+
+
+def parse_csv_row(row: Dict[str, str]) -> dict:
+    data = {}
+    for column, value in row.items():
+        if not column or not value:
+            continue
+        *groups, attribute = column.split(".")
+        target = data
+        for group in groups:
+            target = target.setdefault(group, {})
+        target[attribute] = value
+    return data
+
+
+def get_import_uuid(line: int, data: dict) -> UUID:
+    return uuid5(IMPORT_NAMESPACE, f"{line}:{json.dumps(data, sort_keys=True)}")
+
+
+def hash_file(path: str, algoritmes: List[str]) -> Tuple[int, Dict[str, str]]:
+    """
+    Return the size and the checksums of a file - run in the worker processes.
+    """
+    checksums = {algoritme: new_checksum(algoritme) for algoritme in algoritmes}
+    size = 0
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            size += len(chunk)
+            for checksum in checksums.values():
+                checksum.update(chunk)
+    return size, {
+        algoritme: checksum.hexdigest() for algoritme, checksum in checksums.items()
+    }
+
+
+class DocumentImportSerializer(EnkelvoudigInformatieObjectSerializer):
+    """
+    Validate a row of the manifest.
+    """
+
+    bestand = serializers.CharField(write_only=True)
+    zaak = serializers.HyperlinkedRelatedField(
+        view_name="zaak-detail",
+        lookup_field="uuid",
+        queryset=Zaak.objects.all(),
+        required=False,
+        write_only=True,
+    )
+
+    class Meta(EnkelvoudigInformatieObjectSerializer.Meta):
+        fields = tuple(
+            name
+            for name in EnkelvoudigInformatieObjectSerializer.Meta.fields
+            if name != "inhoud"
+        ) + ("bestand", "zaak")
+
+    def validate_bestand(self, bestand: str) -> str:
+        path = os.path.join(self.context["directory"], bestand)
+        if not os.path.isfile(path):
+            raise serializers.ValidationError("The file does not exist")
+        return path
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+
+        zaak = attrs.get("zaak")
+        if (
+            zaak
+            and not zaak.zaaktype.heeft_relevant_informatieobjecttype.filter(
+                id=attrs["informatieobjecttype"].id, concept=False
+            ).exists()
+        ):
+            validator = ZaaktypeInformatieobjecttypeRelationValidator
+            raise serializers.ValidationError(
+                {"zaak": validator.message}, code=validator.code
+            )
+        return attrs
+
+
+class Document:
+    """
+    A validated row of the manifest, ready to be inserted.
+    """
+
+    def __init__(self, line: int, uuid: UUID, data: dict, hashing: Future):
+        self.line = line
+        self.uuid = uuid
+        self.data = data
+        self.path = data.pop("bestand")
+        self.zaak: Optional[Zaak] = data.pop("zaak", None)
+        self.hashing = hashing
+
+    def build(
+        self, canonical: EnkelvoudigInformatieObjectCanonical
+    ) -> EnkelvoudigInformatieObject:
+        data = self.data.copy()
+        integriteit = data.pop("integriteit", None)
+        ondertekening = data.pop("ondertekening", None)
+        data.setdefault(
+            "vertrouwelijkheidaanduiding",
+            data["informatieobjecttype"].vertrouwelijkheidaanduiding,
+        )
+        data.setdefault("bestandsnaam", os.path.basename(self.path))
+
+        eio = EnkelvoudigInformatieObject(uuid=self.uuid, canonical=canonical, **data)
+        eio.integriteit = integriteit
+        eio.ondertekening = ondertekening
+
+        algoritme = get_algoritme()
+        eio.bestandsomvang, checksums = self.hashing.result()
+        eio.checksum, eio.checksum_algoritme = checksums[algoritme], algoritme
+        self.checksums = checksums
+
+        # bulk_create doesn't call save()
+        eio.va_order = get_va_order(eio.vertrouwelijkheidaanduiding)
+        return eio
+
+
+class DocumentImporter:
+    """
+    Validate and insert documents in batches.
+
+    :param directory: the directory the paths of the files are relative to
+    :param workers: the number of processes computing the checksums
+    :param mode: how the files are transferred to the private media root,
+      one of :class:`Modes`. Moved files are only removed once their document
+      is committed.
+    :param notify: store the notifications of the created resources in the
+      outbox
+    :param toelichting: the ``toelichting`` of the audit trails
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        workers: Optional[int] = None,
+        batch_size: int = 100,
+        mode: str = Modes.link,
+        notify: bool = True,
+        toelichting: str = "Import",
+    ):
+        self.directory = directory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.mode = mode
+        self.notify = notify and not settings.NOTIFICATIONS_DISABLED
+        self.toelichting = toelichting
+        self.request = get_request()
+        self.context = {"request": self.request, "directory": directory}
+        self.identificaties = IdentificatieGenerator("creatiedatum")
+
+        self.field = EnkelvoudigInformatieObject._meta.get_field("inhoud")
+        self.storage = self.field.storage
+        self.algoritmes = {get_algoritme()}
+        if isinstance(self.storage, ContentAddressedStorage):
+            self.algoritmes.add(ContentAddressedStorage.algoritme)
+
+        self.count = 0
+        self.skipped = 0
+
+    def run(self, rows: Iterable[Tuple[int, dict]]) -> Iterator[Tuple[int, dict]]:
+        """
+        Import the (line number, data) ``rows``.
+
+        Yields the line number and the errors of every row that is not
+        imported.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            self.executor = executor
+            chunk: List[Tuple[int, dict]] = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= self.batch_size:
+                    yield from self.import_chunk(chunk)
+                    chunk = []
+
+            if chunk:
+                yield from self.import_chunk(chunk)
+
+    def import_chunk(self, rows: List[Tuple[int, dict]]) -> Iterator[Tuple[int, dict]]:
+        rows = [(line, get_import_uuid(line, data), data) for line, data in rows]
+        imported = set(
+            EnkelvoudigInformatieObject.objects.filter(
+                uuid__in=[uuid for _line, uuid, _data in rows]
+            ).values_list("uuid", flat=True)
+        )
+
+        batch: List[Document] = []
+        for line, uuid, data in rows:
+            if uuid in imported:
+                self.skipped += 1
+                continue
+            try:
+                batch.append(self.validate(line, uuid, data))
+            except serializers.ValidationError as exc:
+                yield line, exc.detail
+
+        if batch:
+            yield from self.save(batch)
+
+    def validate(self, line: int, uuid: UUID, data: dict) -> Document:
+        serializer = DocumentImportSerializer(
+            data=underscoreize(data), context=self.context
+        )
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        # the checksums are computed while the rest of the batch is validated
+        hashing = self.executor.submit(
+            hash_file, data["bestand"], list(self.algoritmes)
+        )
+        return Document(line, uuid, data, hashing)
+
+    def save(self, batch: List[Document]) -> Iterator[Tuple[int, dict]]:
+        placed: List[str] = []
+        try:
+            self._save(batch, placed)
+        except (IntegrityError, OSError) as exc:
+            for name in placed:
+                self.storage.delete(name)
+            # the generated identificaties may have been taken in the meantime
+            self.identificaties.reset()
+            if len(batch) == 1:
+                yield batch[0].line, {"non_field_errors": [str(exc)]}
+                return
+            # find out which documents are the problem, and import the others
+            for document in batch:
+                yield from self.save([document])
+
+    @transaction.atomic
+    def _save(self, batch: List[Document], placed: List[str]) -> None:
+        with AuditTrailBuffer(batch_size=self.batch_size * 4):
+            canonicals = [EnkelvoudigInformatieObjectCanonical() for _ in batch]
+            EnkelvoudigInformatieObjectCanonical.objects.bulk_create(canonicals)
+
+            eios = []
+            for document, canonical in zip(batch, canonicals):
+                eio = document.build(canonical)
+                self.identificaties.set_identificatie(eio)
+                eio.inhoud = self.place_file(document, eio, placed)
+                eios.append(eio)
+            EnkelvoudigInformatieObject.objects.bulk_create(eios)
+
+            for canonical, eio in zip(canonicals, eios):
+                canonical.latest_version = eio
+                canonical.latest_versie = eio.versie
+            EnkelvoudigInformatieObjectCanonical.objects.bulk_update(
+                canonicals, ["latest_version", "latest_versie"]
+            )
+
+            zios = [
+                ZaakInformatieObject(
+                    zaak=document.zaak,
+                    informatieobject=canonical,
+                    aard_relatie=RelatieAarden.from_object_type("zaak"),
+                )
+                for document, canonical in zip(batch, canonicals)
+                if document.zaak
+            ]
+            ZaakInformatieObject.objects.bulk_create(zios)
+
+            notifications = []
+            for eio in eios:
+                data = EnkelvoudigInformatieObjectSerializer(
+                    eio, context=self.context
+                ).data
+                notifications.append(
+                    record_create(
+                        AUDIT_DRC,
+                        KANAAL_DOCUMENTEN,
+                        eio,
+                        data,
+                        eio,
+                        data,
+                        toelichting=self.toelichting,
+                    )
+                )
+
+            zaak_data = {}
+            for zio in zios:
+                if zio.zaak.pk not in zaak_data:
+                    zaak_data[zio.zaak.pk] = ZaakSerializer(
+                        zio.zaak, context=self.context
+                    ).data
+                data = ZaakInformatieObjectSerializer(zio, context=self.context).data
+                notifications.append(
+                    record_create(
+                        AUDIT_ZRC,
+                        KANAAL_ZAKEN,
+                        zio,
+                        data,
+                        zio.zaak,
+                        zaak_data[zio.zaak.pk],
+                        toelichting=self.toelichting,
+                    )
+                )
+
+            if self.notify:
+                OutboxNotification.objects.bulk_create(notifications)
+
+        if self.mode == Modes.move:
+            paths = [document.path for document in batch]
+            transaction.on_commit(lambda: self.remove_sources(paths))
+
+        self.count += len(batch)
+
+    def place_file(
+        self, document: Document, eio: EnkelvoudigInformatieObject, placed: List[str]
+    ) -> str:
+        """
+        Transfer the file of ``document`` to the storage and return its name.
+        """
+        if isinstance(self.storage, ContentAddressedStorage):
+            name = get_blob_name(document.checksums[ChecksumAlgoritmes.sha_256])
+            try:
+                self.transfer(document.path, self.storage.path(name))
+            except FileExistsError:
+                pass
+            # mark the blob as in use, so it isn't garbage collected before
+            # the document is committed
+            os.utime(self.storage.path(name))
+            return name
+
+        while True:
+            filename = os.path.basename(document.path)
+            name = self.field.generate_filename(eio, filename)
+            name = self.storage.get_available_name(name)
+            try:
+                self.transfer(document.path, self.storage.path(name))
+            except FileExistsError:
+                # the name was taken in the meantime
+                continue
+            placed.append(name)
+            return name
+
+    def transfer(self, source: str, target: str) -> None:
+        """
+        Create ``target`` with the content of ``source``.
+
+        Raises ``FileExistsError`` if the target exists.
+        """
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if self.mode != Modes.copy:
+            try:
+                os.link(source, target)
+                return
+            except OSError as exc:
+                # the source is on another file system
+                if exc.errno not in (errno.EXDEV, errno.EPERM):
+                    raise
+
+        # copy to a temporary file first, a blob must never be incomplete
+        temporary = f"{target}.{uuid4().hex}.tmp"
+        try:
+            with open(source, "rb") as source_file, open(temporary, "xb") as file:
+                shutil.copyfileobj(source_file, file, CHUNK_SIZE)
+            if self.storage.file_permissions_mode is not None:
+                os.chmod(temporary, self.storage.file_permissions_mode)
+            os.link(temporary, target)
+        finally:
+            os.remove(temporary)
+
+    @staticmethod
+    def remove_sources(paths: List[str]) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
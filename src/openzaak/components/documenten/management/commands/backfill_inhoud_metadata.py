@@ -0,0 +1,79 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.core.management import BaseCommand
+from django.db.models import Q
+
+from ...checksums import compute_checksum, get_algoritme
+from ...models import EnkelvoudigInformatieObject
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the size and checksum of the inhoud of documents that were "
+        "written before these were determined on write"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of files to read in parallel",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of files to handle per batch",
+        )
+
+    def handle(self, workers, batch_size, **options):
+        algoritme = get_algoritme()
+        self.storage = EnkelvoudigInformatieObject._meta.get_field("inhoud").storage
+
+        todo = EnkelvoudigInformatieObject.objects.filter(
+            Q(bestandsomvang__isnull=True) | ~Q(checksum_algoritme=algoritme)
+        ).exclude(inhoud="")
+        # versions without new content share the file of the previous version
+        names = (
+            todo.order_by("inhoud")
+            .values_list("inhoud", flat=True)
+            .distinct()
+            .iterator()
+        )
+
+        count = 0
+        # only the files are read in the worker threads, the database is
+        # updated from the main thread
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = list(islice(names, batch_size))
+                if not batch:
+                    break
+
+                for name, metadata in executor.map(self.get_metadata, batch):
+                    if metadata is None:
+                        continue
+
+                    bestandsomvang, checksum = metadata
+                    count += EnkelvoudigInformatieObject.objects.filter(
+                        inhoud=name
+                    ).update(
+                        bestandsomvang=bestandsomvang,
+                        checksum=checksum,
+                        checksum_algoritme=algoritme,
+                    )
+
+        self.stdout.write(f"Updated {count} document version(s)")
+
+    def get_metadata(self, name: str):
+        try:
+            with self.storage.open(name, "rb") as file:
+                return name, (file.size, compute_checksum(file))
+        except OSError:
+            logger.warning("Could not read the inhoud %s", name, exc_info=True)
+            return name, None
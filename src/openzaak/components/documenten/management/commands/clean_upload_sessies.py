@@ -0,0 +1,31 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from ...models import UploadSessie
+
+
+class Command(BaseCommand):
+    help = "Delete expired upload sessies and the parts they received"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of expired upload sessies",
+        )
+
+    def handle(self, **options):
+        expired = UploadSessie.objects.filter(verloopt_op__lte=timezone.now())
+
+        if options["dry_run"]:
+            self.stdout.write(f"{expired.count()} expired upload sessie(s)")
+            return
+
+        count = 0
+        for upload_sessie in expired.iterator():
+            with transaction.atomic():
+                upload_sessie.delete()
+            count += 1
+
+        self.stdout.write(f"Deleted {count} expired upload sessie(s)")
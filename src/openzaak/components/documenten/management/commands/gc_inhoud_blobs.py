@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from ...models import EnkelvoudigInformatieObject
+from ...storage import BLOB_PREFIX, ContentAddressedStorage
+
+
+class Command(BaseCommand):
+    help = "Delete the deduplicated document content no document refers to"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=60 * 60,
+            help=(
+                "Only delete blobs that weren't written or reused for this many "
+                "seconds, to leave the uploads in progress alone"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of unreferenced blobs",
+        )
+
+    def handle(self, min_age, **options):
+        storage = EnkelvoudigInformatieObject._meta.get_field("inhoud").storage
+        # determine the storage from the blobs if deduplication was disabled
+        # again after the blobs were written
+        if not isinstance(storage, ContentAddressedStorage):
+            storage = ContentAddressedStorage()
+
+        # blobs are looked up before the references, so blobs written while
+        # the references are collected are never considered
+        cutoff = timezone.now() - timedelta(seconds=min_age)
+        blobs = [
+            name
+            for name in storage.iter_blobs()
+            if storage.get_modified_time(name) < cutoff
+        ]
+
+        referenced = set(
+            EnkelvoudigInformatieObject.objects.filter(inhoud__startswith=BLOB_PREFIX)
+            .order_by()
+            .values_list("inhoud", flat=True)
+            .distinct()
+            .iterator()
+        )
+        unreferenced = [name for name in blobs if name not in referenced]
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(unreferenced)} unreferenced blob(s)")
+            return
+
+        count = 0
+        for name in unreferenced:
+            # the blob may have been reused in the meantime
+            if storage.get_modified_time(name) >= cutoff:
+                continue
+            storage.delete_blob(name)
+            count += 1
+
+        self.stdout.write(f"Deleted {count} unreferenced blob(s)")
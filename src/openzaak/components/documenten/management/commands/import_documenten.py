@@ -0,0 +1,84 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from ...importer import DocumentImporter, Modes, read_manifest
+
+
+class Command(BaseCommand):
+    help = (
+        "Import documents from a manifest, a CSV or JSONL file with the "
+        "metadata and the path of the file of every document. The errors of "
+        "rows that are not imported are written as JSON lines to stderr. An "
+        "interrupted import is resumed by running the command again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("manifest", help="The CSV or JSONL manifest")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of processes computing the checksums, defaults to the "
+            "number of CPUs",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of documents to insert per transaction",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=Modes.choices,
+            default=Modes.link,
+            help="Hardlink, copy or move the files into the private media root. "
+            "Files on another file system are copied instead of linked.",
+        )
+        parser.add_argument(
+            "--no-notifications",
+            action="store_false",
+            dest="notify",
+            help="Don't send notifications of the imported resources",
+        )
+        parser.add_argument(
+            "--toelichting",
+            default="Import",
+            help="Toelichting of the audit trails of the imported resources",
+        )
+
+    def handle(
+        self, manifest, workers, batch_size, mode, notify, toelichting, **options
+    ):
+        if notify and not settings.NOTIFICATIONS_OUTBOX:
+            raise CommandError(
+                "Notifications of imported documents are sent through the outbox, "
+                "enable NOTIFICATIONS_OUTBOX or use --no-notifications"
+            )
+
+        importer = DocumentImporter(
+            directory=os.path.dirname(os.path.abspath(manifest)),
+            workers=workers,
+            batch_size=batch_size,
+            mode=mode,
+            notify=notify,
+            toelichting=toelichting,
+        )
+        self.failed = 0
+        try:
+            for line, errors in importer.run(read_manifest(manifest)):
+                self.report(line, errors)
+        except ValueError as exc:
+            raise CommandError(f"Invalid manifest: {exc}")
+
+        self.stdout.write(
+            f"Imported {importer.count} documents, skipped {importer.skipped} "
+            f"documents imported before, {self.failed} documents could not be "
+            "imported"
+        )
+
+    def report(self, line: int, errors: dict) -> None:
+        self.failed += 1
+        self.stderr.write(json.dumps({"line": line, "errors": errors}))
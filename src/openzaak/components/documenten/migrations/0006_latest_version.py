@@ -0,0 +1,51 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_latest_version(apps, _):
+    EnkelvoudigInformatieObjectCanonical = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObjectCanonical"
+    )
+    EnkelvoudigInformatieObject = apps.get_model(
+        "documenten", "EnkelvoudigInformatieObject"
+    )
+
+    latest_versions = EnkelvoudigInformatieObject.objects.filter(
+        canonical=models.OuterRef("pk")
+    ).order_by("-versie")
+    EnkelvoudigInformatieObjectCanonical.objects.update(
+        latest_version=models.Subquery(latest_versions.values("pk")[:1]),
+        latest_versie=models.Subquery(latest_versions.values("versie")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("documenten", "0005_enkelvoudiginformatieobject_va_order")]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="latest_version",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De meest recente versie van het INFORMATIEOBJECT.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="documenten.EnkelvoudigInformatieObject",
+            ),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="latest_versie",
+            field=models.PositiveIntegerField(
+                blank=True,
+                editable=False,
+                help_text="Het versienummer van de meest recente versie.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(set_latest_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,148 @@
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import privates.fields
+import privates.storages
+import uuid
+
+import openzaak.components.documenten.models.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("documenten", "0006_latest_version")]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSessie",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        help_text="Unieke resource identifier (UUID4)",
+                        unique=True,
+                    ),
+                ),
+                (
+                    "lock",
+                    models.CharField(
+                        help_text="The lock of the document at the start of the upload",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "bestandsnaam",
+                    models.CharField(
+                        blank=True,
+                        help_text="De naam van het fysieke bestand, inclusief extensie. Indien leeg blijft de bestandsnaam van het INFORMATIEOBJECT ongewijzigd.",
+                        max_length=255,
+                        verbose_name="bestandsnaam",
+                    ),
+                ),
+                (
+                    "bestandsomvang",
+                    models.BigIntegerField(
+                        help_text="Aantal bytes van de volledige inhoud.",
+                        validators=[django.core.validators.MinValueValidator(1)],
+                        verbose_name="bestandsomvang",
+                    ),
+                ),
+                (
+                    "deel_omvang",
+                    models.PositiveIntegerField(
+                        help_text="Aantal bytes van elk deel, behalve het laatste deel.",
+                        verbose_name="deel omvang",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+                (
+                    "verloopt_op",
+                    models.DateTimeField(
+                        default=openzaak.components.documenten.models.models.get_upload_sessie_expiry,
+                        help_text="Datumtijd waarna de upload niet meer afgerond kan worden en de ontvangen delen verwijderd worden.",
+                        verbose_name="verloopt op",
+                    ),
+                ),
+                (
+                    "voltooid",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Geeft aan of alle delen ontvangen en samengevoegd zijn.",
+                        verbose_name="voltooid",
+                    ),
+                ),
+                (
+                    "informatieobject",
+                    models.ForeignKey(
+                        help_text="URL-referentie naar het INFORMATIEOBJECT.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="documenten.EnkelvoudigInformatieObjectCanonical",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "upload sessie",
+                "verbose_name_plural": "upload sessies",
+            },
+        ),
+        migrations.CreateModel(
+            name="BestandsDeel",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "volgnummer",
+                    models.PositiveIntegerField(
+                        help_text="Het volgnummer van het deel, beginnend bij 1.",
+                        verbose_name="volgnummer",
+                    ),
+                ),
+                (
+                    "inhoud",
+                    privates.fields.PrivateMediaFileField(
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to="part_uploads/%Y/%m/",
+                    ),
+                ),
+                (
+                    "omvang",
+                    models.PositiveIntegerField(
+                        help_text="Aantal bytes van het deel.", verbose_name="omvang"
+                    ),
+                ),
+                (
+                    "upload_sessie",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="delen",
+                        to="documenten.UploadSessie",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "bestandsdeel",
+                "verbose_name_plural": "bestandsdelen",
+                "unique_together": {("upload_sessie", "volgnummer")},
+            },
+        ),
+    ]
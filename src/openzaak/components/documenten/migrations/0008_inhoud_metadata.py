@@ -0,0 +1,56 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("documenten", "0007_uploadsessie_bestandsdeel")]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="bestandsomvang",
+            field=models.BigIntegerField(
+                editable=False,
+                help_text="Aantal bytes dat de inhoud van INFORMATIEOBJECT in beslag neemt.",
+                null=True,
+                verbose_name="bestandsomvang",
+            ),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="checksum",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="De door de server berekende checksum van de inhoud.",
+                max_length=128,
+                verbose_name="checksum",
+            ),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="checksum_algoritme",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("crc_16", "CRC-16"),
+                    ("crc_32", "CRC-32"),
+                    ("crc_64", "CRC-64"),
+                    ("fletcher_4", "Fletcher-4"),
+                    ("fletcher_8", "Fletcher-8"),
+                    ("fletcher_16", "Fletcher-16"),
+                    ("fletcher_32", "Fletcher-32"),
+                    ("hmac", "HMAC"),
+                    ("md5", "MD5"),
+                    ("sha_1", "SHA-1"),
+                    ("sha_256", "SHA-256"),
+                    ("sha_512", "SHA-512"),
+                    ("sha_3", "SHA-3"),
+                ],
+                editable=False,
+                help_text="Algoritme van de door de server berekende checksum.",
+                max_length=20,
+                verbose_name="checksum algoritme",
+            ),
+        ),
+    ]
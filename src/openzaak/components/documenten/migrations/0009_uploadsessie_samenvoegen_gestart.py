@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("documenten", "0008_inhoud_metadata")]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsessie",
+            name="samenvoegen_gestart",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Datumtijd waarop het samenvoegen van de delen gestart is.",
+                null=True,
+                verbose_name="samenvoegen gestart",
+            ),
+        )
+    ]
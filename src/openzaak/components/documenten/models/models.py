@@ -1,7 +1,13 @@
 import logging
+import math
 import uuid as _uuid
+from datetime import timedelta
 
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.core.validators import MinValueValidator
 from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
@@ -11,6 +17,10 @@ from vng_api_common.models import APIMixin
 from vng_api_common.utils import generate_unique_identification
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from openzaak.utils.data_filtering import get_va_order
+
+from ..checksums import compute_checksum, get_algoritme, new_checksum
+from ..storage import inhoud_storage
 from .constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
 from .query import InformatieobjectQuerySet, InformatieobjectRelatedQuerySet
 from .validators import validate_status
@@ -22,6 +32,8 @@ __all__ = [
     "EnkelvoudigInformatieObjectCanonical",
     "EnkelvoudigInformatieObject",
     "Gebruiksrechten",
+    "UploadSessie",
+    "BestandsDeel",
 ]
 
 
@@ -55,6 +67,12 @@ class InformatieObject(models.Model):
         help_text="Aanduiding van de mate waarin het INFORMATIEOBJECT voor de "
         "openbaarheid bestemd is.",
     )
+    va_order = models.PositiveSmallIntegerField(
+        null=True,
+        editable=False,
+        help_text="Volgorde van de vertrouwelijkheidaanduiding, om efficiënt op "
+        "autorisaties te filteren.",
+    )
     auteur = models.CharField(
         max_length=200,
         help_text="De persoon of organisatie die in de eerste plaats "
@@ -168,6 +186,7 @@ class InformatieObject(models.Model):
     def save(self, *args, **kwargs):
         if not self.identificatie:
             self.identificatie = generate_unique_identification(self, "creatiedatum")
+        self.va_order = get_va_order(self.vertrouwelijkheidaanduiding)
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -196,13 +215,55 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         help_text=_("Hash string, which represents id of the lock"),
     )
 
+    latest_version = models.ForeignKey(
+        "EnkelvoudigInformatieObject",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text=_("De meest recente versie van het INFORMATIEOBJECT."),
+    )
+    latest_versie = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text=_("Het versienummer van de meest recente versie."),
+    )
+
     def __str__(self):
         return str(self.latest_version)
 
-    @property
-    def latest_version(self):
-        versies = self.enkelvoudiginformatieobject_set.order_by("-versie")
-        return versies.first()
+    def set_latest_version(self, version: "EnkelvoudigInformatieObject") -> bool:
+        """
+        Point to ``version`` if it is at least as recent as the current latest version.
+
+        The check and the update happen in a single ``UPDATE`` statement, so
+        concurrent writes of versions cannot move the pointer backwards.
+        """
+        updated = (
+            EnkelvoudigInformatieObjectCanonical.objects.filter(pk=self.pk)
+            .filter(
+                models.Q(latest_versie__isnull=True)
+                | models.Q(latest_versie__lte=version.versie)
+            )
+            .update(latest_version=version, latest_versie=version.versie)
+        )
+        if updated:
+            self.latest_version = version
+            self.latest_versie = version.versie
+        return bool(updated)
+
+    @classmethod
+    def prefetch_latest_versions(cls, canonicals) -> None:
+        """
+        Resolve the latest version of all ``canonicals`` in one query.
+
+        Canonicals of which the latest version is already loaded, e.g. with
+        ``select_related``, are skipped.
+        """
+        canonicals = [canonical for canonical in canonicals if canonical is not None]
+        models.prefetch_related_objects(canonicals, "latest_version")
 
 
 class EnkelvoudigInformatieObject(APIMixin, InformatieObject):
@@ -249,8 +310,30 @@ class EnkelvoudigInformatieObject(APIMixin, InformatieObject):
             "informatieobject is vastgelegd, inclusief extensie."
         ),
     )
-    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/")
+    inhoud = PrivateMediaFileField(upload_to="uploads/%Y/%m/", storage=inhoud_storage)
     # inhoud = models.FileField(upload_to='uploads/%Y/%m/')
+    # size and checksum of the inhoud, determined when the inhoud is written
+    bestandsomvang = models.BigIntegerField(
+        _("bestandsomvang"),
+        null=True,
+        editable=False,
+        help_text=_("Aantal bytes dat de inhoud van INFORMATIEOBJECT in beslag neemt."),
+    )
+    checksum_algoritme = models.CharField(
+        _("checksum algoritme"),
+        max_length=20,
+        choices=ChecksumAlgoritmes.choices,
+        blank=True,
+        editable=False,
+        help_text=_("Algoritme van de door de server berekende checksum."),
+    )
+    checksum = models.CharField(
+        _("checksum"),
+        max_length=128,
+        blank=True,
+        editable=False,
+        help_text=_("De door de server berekende checksum van de inhoud."),
+    )
     link = models.URLField(
         max_length=200,
         blank=True,
@@ -302,8 +385,48 @@ class EnkelvoudigInformatieObject(APIMixin, InformatieObject):
         ),
     )
 
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        # new content is assigned, it is written to the storage in super().save()
+        if self.inhoud and not self.inhoud._committed:
+            self.set_inhoud_metadata()
+
+        super().save(*args, **kwargs)
+
+        # avoid fetching the canonical only to update its latest version
+        if EnkelvoudigInformatieObject.canonical.is_cached(self):
+            canonical = self.canonical
+        else:
+            canonical = EnkelvoudigInformatieObjectCanonical(pk=self.canonical_id)
+        canonical.set_latest_version(self)
+
+    def set_inhoud_metadata(self) -> None:
+        """
+        Determine the size and the checksum of the inhoud.
+
+        Checksums computed while streaming an upload are used if they were
+        computed with the configured algorithm.
+        """
+        algoritme = get_algoritme()
+        file = self.inhoud.file
+
+        self.bestandsomvang = self.inhoud.size
+        if getattr(file, "checksum_algoritme", None) == algoritme:
+            self.checksum = file.checksum
+        else:
+            self.checksum = compute_checksum(file, algoritme)
+            # the storage may use the checksum as well
+            file.checksum, file.checksum_algoritme = self.checksum, algoritme
+        self.checksum_algoritme = algoritme
+
     class Meta:
         unique_together = ("uuid", "versie")
+        indexes = [
+            models.Index(
+                fields=["informatieobjecttype", "va_order"],
+                name="eio_iotype_va_order_idx",
+            )
+        ]
 
 
 class Gebruiksrechten(models.Model):
@@ -369,3 +492,234 @@ class Gebruiksrechten(models.Model):
     def unique_representation(self):
         informatieobject = self.informatieobject.latest_version
         return f"({informatieobject.unique_representation()}) - {self.omschrijving_voorwaarden}"
+
+
+def get_upload_sessie_expiry():
+    return timezone.now() + timedelta(seconds=settings.UPLOAD_SESSIE_EXPIRY)
+
+
+class UploadSessie(models.Model):
+    """
+    Upload the content of a (locked) document in parts.
+
+    The parts can be uploaded in any order and in parallel. When the last part
+    is received, the parts are assembled into the content of a new version of
+    the document.
+    """
+
+    uuid = models.UUIDField(
+        unique=True, default=_uuid.uuid4, help_text="Unieke resource identifier (UUID4)"
+    )
+    informatieobject = models.ForeignKey(
+        "EnkelvoudigInformatieObjectCanonical",
+        on_delete=models.CASCADE,
+        help_text="URL-referentie naar het INFORMATIEOBJECT.",
+    )
+    lock = models.CharField(
+        max_length=100,
+        help_text=_("The lock of the document at the start of the upload"),
+    )
+    bestandsnaam = models.CharField(
+        _("bestandsnaam"),
+        max_length=255,
+        blank=True,
+        help_text=_(
+            "De naam van het fysieke bestand, inclusief extensie. Indien leeg "
+            "blijft de bestandsnaam van het INFORMATIEOBJECT ongewijzigd."
+        ),
+    )
+    bestandsomvang = models.BigIntegerField(
+        _("bestandsomvang"),
+        validators=[MinValueValidator(1)],
+        help_text=_("Aantal bytes van de volledige inhoud."),
+    )
+    deel_omvang = models.PositiveIntegerField(
+        _("deel omvang"),
+        help_text=_("Aantal bytes van elk deel, behalve het laatste deel."),
+    )
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+    verloopt_op = models.DateTimeField(
+        _("verloopt op"),
+        default=get_upload_sessie_expiry,
+        help_text=_(
+            "Datumtijd waarna de upload niet meer afgerond kan worden en de "
+            "ontvangen delen verwijderd worden."
+        ),
+    )
+    voltooid = models.BooleanField(
+        _("voltooid"),
+        default=False,
+        help_text=_("Geeft aan of alle delen ontvangen en samengevoegd zijn."),
+    )
+    samenvoegen_gestart = models.DateTimeField(
+        _("samenvoegen gestart"),
+        null=True,
+        blank=True,
+        help_text=_("Datumtijd waarop het samenvoegen van de delen gestart is."),
+    )
+
+    class Meta:
+        verbose_name = _("upload sessie")
+        verbose_name_plural = _("upload sessies")
+
+    def __str__(self):
+        return str(self.uuid)
+
+    @property
+    def aantal_delen(self) -> int:
+        return math.ceil(self.bestandsomvang / self.deel_omvang)
+
+    @property
+    def is_verlopen(self) -> bool:
+        return self.verloopt_op <= timezone.now()
+
+    def get_deel_omvang(self, volgnummer: int) -> int:
+        """
+        Return the expected size of the part with number ``volgnummer``.
+        """
+        offset = (volgnummer - 1) * self.deel_omvang
+        return min(self.deel_omvang, self.bestandsomvang - offset)
+
+    def get_delen(self) -> list:
+        ontvangen = set(self.delen.values_list("volgnummer", flat=True))
+        return [
+            {
+                "volgnummer": volgnummer,
+                "omvang": self.get_deel_omvang(volgnummer),
+                "ontvangen": self.voltooid or volgnummer in ontvangen,
+            }
+            for volgnummer in range(1, self.aantal_delen + 1)
+        ]
+
+    def delete_delen(self) -> None:
+        """
+        Delete the received parts, and their files once the transaction commits.
+        """
+        files = [deel.inhoud for deel in self.delen.all()]
+        self.delen.all().delete()
+
+        def delete_files():
+            for file in files:
+                file.delete(save=False)
+
+        transaction.on_commit(delete_files)
+
+    @transaction.atomic
+    def delete(self, *args, **kwargs):
+        self.delete_delen()
+        return super().delete(*args, **kwargs)
+
+    def claim(self) -> bool:
+        """
+        Claim the assembly of the content, if all parts are received.
+
+        The upload is locked while checking, so the content is assembled exactly
+        once when the last parts are uploaded in parallel. The lock is released
+        right away, the assembly itself runs outside of the transaction. A
+        claim older than ``settings.UPLOAD_SAMENVOEGEN_TIMEOUT`` seconds is
+        considered abandoned and can be claimed again.
+
+        :return: whether the caller should assemble the content
+        """
+        with transaction.atomic():
+            upload_sessie = UploadSessie.objects.select_for_update().get(pk=self.pk)
+            if upload_sessie.voltooid:
+                return False
+
+            gestart = upload_sessie.samenvoegen_gestart
+            timeout = timedelta(seconds=settings.UPLOAD_SAMENVOEGEN_TIMEOUT)
+            if gestart is not None and timezone.now() - gestart < timeout:
+                return False
+
+            if upload_sessie.delen.count() < upload_sessie.aantal_delen:
+                return False
+
+            self.samenvoegen_gestart = timezone.now()
+            self.save(update_fields=["samenvoegen_gestart"])
+        return True
+
+    def release(self) -> None:
+        """
+        Give up the claim, e.g. after the assembly failed.
+        """
+        self.samenvoegen_gestart = None
+        self.save(update_fields=["samenvoegen_gestart"])
+
+    def assemble(self) -> TemporaryUploadedFile:
+        """
+        Concatenate the parts into a temporary file.
+
+        This copies the complete content, so it must not run in a transaction
+        holding locks. Call :meth:`claim` first.
+        """
+        inhoud = TemporaryUploadedFile(
+            f"{_uuid.uuid4()}.bin",
+            "application/octet-stream",
+            self.bestandsomvang,
+            None,
+        )
+        inhoud.checksum_algoritme = get_algoritme()
+        checksum = new_checksum(inhoud.checksum_algoritme)
+        for deel in self.delen.order_by("volgnummer"):
+            with deel.inhoud.open("rb") as part:
+                for chunk in part.chunks():
+                    checksum.update(chunk)
+                    inhoud.write(chunk)
+        inhoud.checksum = checksum.hexdigest()
+        inhoud.file.flush()
+        inhoud.seek(0)
+        return inhoud
+
+    @transaction.atomic
+    def create_version(
+        self, inhoud: TemporaryUploadedFile
+    ) -> EnkelvoudigInformatieObject:
+        """
+        Save the assembled content as a new version of the document.
+
+        The temporary file is moved into the private media storage.
+        """
+        canonical = (
+            EnkelvoudigInformatieObjectCanonical.objects.select_for_update().get(
+                pk=self.informatieobject_id
+            )
+        )
+
+        # the new version is a copy of the latest version, with the new content
+        version = canonical.latest_version
+        version.pk = None
+        version.versie = canonical.latest_versie + 1
+        version.inhoud = inhoud
+        version.bestandsnaam = self.bestandsnaam or version.bestandsnaam
+        version.integriteit = None
+        version.save()
+
+        self.voltooid = True
+        self.save(update_fields=["voltooid"])
+        self.delete_delen()
+        return version
+
+
+class BestandsDeel(models.Model):
+    """
+    A received part of the content of an upload.
+    """
+
+    upload_sessie = models.ForeignKey(
+        UploadSessie, on_delete=models.CASCADE, related_name="delen"
+    )
+    volgnummer = models.PositiveIntegerField(
+        _("volgnummer"), help_text=_("Het volgnummer van het deel, beginnend bij 1.")
+    )
+    inhoud = PrivateMediaFileField(upload_to="part_uploads/%Y/%m/")
+    omvang = models.PositiveIntegerField(
+        _("omvang"), help_text=_("Aantal bytes van het deel.")
+    )
+
+    class Meta:
+        verbose_name = _("bestandsdeel")
+        verbose_name_plural = _("bestandsdelen")
+        unique_together = ("upload_sessie", "volgnummer")
+
+    def __str__(self):
+        return f"{self.upload_sessie} - {self.volgnummer}"
@@ -1,19 +1,24 @@
-from urllib.parse import urlparse
-
 from django.apps import apps
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
 
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
+
+from openzaak.utils.data_filtering import (
+    UrlResolver,
+    filter_by_authorized_types,
+    get_authorized_pks,
+    get_resource_pks,
+)
 
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        resolve_urls: UrlResolver = get_resource_pks,
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -35,72 +40,33 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param resolve_urls: callable resolving the ``informatieobjecttype``
+          URLs to primary keys, in bulk
 
         :return: a queryset of filtered results according to the
           authorizations provided
         """
-        # keep a list of allowed informatieobjecttypen
-        informatieobjecttypen = []
-
-        # annotate the queryset so we can map a string value to a logical number
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
+        # the allowed informatieobjecttypen (PKs) and their
+        # max_vertrouwelijkheidaanduiding
+        informatieobjecttypen = get_authorized_pks(
+            scope, authorizations, "informatieobjecttype", resolve_urls
         )
 
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``informatieobjecttype``
-        vertrouwelijkheidaanduiding_whens = []
-        for authorization in authorizations:
-            # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
-                continue
-
-            # this informatieobjecttype is allowed
-            informatieobjecttype_path = urlparse(
-                authorization.informatieobjecttype
-            ).path
-            informatieobjecttype = get_resource_for_path(informatieobjecttype_path)
-            informatieobjecttypen.append(informatieobjecttype)
-
-            # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
-                authorization.max_vertrouwelijkheidaanduiding
-            )
-            vertrouwelijkheidaanduiding_whens.append(
-                When(
-                    **{"informatieobjecttype": informatieobjecttype},
-                    then=Value(choice_item.order),
-                )
-            )
-
-        # apply the order annnotation so we can filter later
-        annotations = {"_va_order": order_case}
-        # filtering:
-        # * only allow the white-listed informatieobjecttypen, explicitly
-        # * apply the filtering to limit cases within case-types to the maximal
-        #   confidentiality level
-        filters = {
-            "informatieobjecttype__in": informatieobjecttypen,
-            "_va_order__lte": Case(
-                *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
-            ),
-        }
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
             # retrieve the canonical IDs of EnkelvoudigInformatieObjects
             # for which the user is authorized and then return the objects
             # related to those EnkelvoudigInformatieObjectCanonicals
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
-            filtered = (
-                model.objects.annotate(**annotations)
-                .filter(**filters)
-                .values("canonical")
-            )
-            queryset = self.filter(informatieobject__in=filtered)
+            filtered = filter_by_authorized_types(
+                model.objects.all(), informatieobjecttypen, "informatieobjecttype"
+            ).values("canonical")
+            return self.filter(informatieobject__in=filtered)
+
         # bring it all together now to build the resulting queryset
-        else:
-            queryset = self.annotate(**annotations).filter(**filters)
-        return queryset
+        return filter_by_authorized_types(
+            self, informatieobjecttypen, "informatieobjecttype"
+        )
 
 
 class InformatieobjectQuerySet(AuthorizationsFilterMixin, models.QuerySet):
@@ -0,0 +1,103 @@
+"""
+Storage of the document content.
+
+With ``settings.INHOUD_DEDUPLICATION`` enabled, the ``inhoud`` of documents is
+stored content-addressed: every distinct content is written once, named after
+its SHA-256 checksum, and shared by all (versions of) documents with that
+content. Blobs are never deleted by the storage itself, as other rows may
+still refer to them - the ``gc_inhoud_blobs`` management command removes the
+blobs that are no longer referenced.
+"""
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import LazyObject, empty
+
+from privates.storages import PrivateMediaFileSystemStorage
+
+from .checksums import compute_checksum
+from .models.constants import ChecksumAlgoritmes
+
+BLOB_PREFIX = "blobs/"
+
+
+def get_blob_name(checksum: str) -> str:
+    return f"{BLOB_PREFIX}{checksum[:2]}/{checksum[2:4]}/{checksum}"
+
+
+class ContentAddressedStorage(PrivateMediaFileSystemStorage):
+    """
+    Store files by the SHA-256 checksum of their content.
+
+    Saving content that is already stored doesn't write anything, the name of
+    the existing blob is returned instead.
+    """
+
+    algoritme = ChecksumAlgoritmes.sha_256
+
+    def save(self, name, content, max_length=None):
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        # reuse the checksum computed while the content was received
+        if getattr(content, "checksum_algoritme", None) == self.algoritme:
+            checksum = content.checksum
+        else:
+            checksum = compute_checksum(content, self.algoritme)
+
+        blob_name = get_blob_name(checksum)
+        if self.exists(blob_name):
+            # mark the blob as in use, so it isn't garbage collected before
+            # the referring row is committed
+            os.utime(self.path(blob_name))
+            return blob_name
+
+        saved_name = self._save(blob_name, content)
+        if saved_name != blob_name:
+            # the same content was stored concurrently
+            super().delete(saved_name)
+        return blob_name
+
+    def delete(self, name):
+        # blobs may be shared, they're removed by gc_inhoud_blobs
+        if name.startswith(BLOB_PREFIX):
+            return
+        super().delete(name)
+
+    def delete_blob(self, name):
+        super().delete(name)
+
+    def deconstruct(self):
+        # the storage class depends on the settings, which must not leak
+        # into the migrations
+        return ("privates.storages.PrivateMediaFileSystemStorage", (), {})
+
+    def iter_blobs(self, path: str = BLOB_PREFIX.rstrip("/")):
+        if not self.exists(path):
+            return
+
+        directories, files = self.listdir(path)
+        for filename in files:
+            yield f"{path}/{filename}"
+        for directory in directories:
+            yield from self.iter_blobs(f"{path}/{directory}")
+
+
+class InhoudStorage(LazyObject):
+    def _setup(self):
+        if settings.INHOUD_DEDUPLICATION:
+            self._wrapped = ContentAddressedStorage()
+        else:
+            self._wrapped = PrivateMediaFileSystemStorage()
+
+
+inhoud_storage = InhoudStorage()
+
+
+@receiver(setting_changed)
+def reset_inhoud_storage(setting, **kwargs):
+    if setting == "INHOUD_DEDUPLICATION":
+        inhoud_storage._wrapped = empty
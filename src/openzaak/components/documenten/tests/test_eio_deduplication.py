@@ -0,0 +1,113 @@
+import hashlib
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.documenten.storage import get_blob_name
+from openzaak.utils.tests import JWTAuthMixin
+
+BLOB_NAME = get_blob_name(hashlib.sha256(b"some data").hexdigest())
+
+
+@temp_private_root()
+class DeduplicationDisabledTests(TestCase):
+    def test_inhoud_stored_per_upload(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create()
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+
+        self.assertTrue(eio1.inhoud.name.startswith("uploads/"))
+        self.assertNotEqual(eio1.inhoud.name, eio2.inhoud.name)
+
+
+@temp_private_root()
+@override_settings(INHOUD_DEDUPLICATION=True)
+class DeduplicationTests(TestCase):
+    def test_identical_content_stored_once(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create()
+        eio2 = EnkelvoudigInformatieObjectFactory.create()
+
+        self.assertEqual(eio1.inhoud.name, BLOB_NAME)
+        self.assertEqual(eio2.inhoud.name, BLOB_NAME)
+        eio2.refresh_from_db()
+        self.assertEqual(eio2.inhoud.read(), b"some data")
+
+    def test_different_content(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create()
+        eio2 = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"other data")
+
+        self.assertNotEqual(eio1.inhoud.name, eio2.inhoud.name)
+
+    def test_delete_keeps_shared_blob(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        eio.inhoud.delete(save=False)
+
+        self.assertTrue(eio.inhoud.storage.exists(BLOB_NAME))
+
+
+@temp_private_root()
+@override_settings(INHOUD_DEDUPLICATION=True)
+class DeduplicationAPITests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_update_without_inhoud_reuses_blob(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(eio_url, {"titel": "changed", "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        new_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(new_version.inhoud.name, BLOB_NAME)
+
+
+@temp_private_root()
+@override_settings(INHOUD_DEDUPLICATION=True)
+class GarbageCollectBlobsTests(TestCase):
+    def test_unreferenced_blobs_deleted(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        unreferenced = EnkelvoudigInformatieObjectFactory.create(
+            inhoud__data=b"other data"
+        )
+        storage = unreferenced.inhoud.storage
+        unreferenced_name = unreferenced.inhoud.name
+        EnkelvoudigInformatieObject.objects.filter(pk=unreferenced.pk).delete()
+
+        out = StringIO()
+        call_command("gc_inhoud_blobs", min_age=0, stdout=out)
+
+        self.assertIn("Deleted 1 unreferenced blob(s)", out.getvalue())
+        self.assertTrue(storage.exists(eio.inhoud.name))
+        self.assertFalse(storage.exists(unreferenced_name))
+
+    def test_recent_blobs_kept(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        EnkelvoudigInformatieObject.objects.filter(pk=eio.pk).delete()
+
+        out = StringIO()
+        call_command("gc_inhoud_blobs", stdout=out)
+
+        self.assertIn("Deleted 0 unreferenced blob(s)", out.getvalue())
+        self.assertTrue(eio.inhoud.storage.exists(eio.inhoud.name))
+
+    def test_dry_run(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        EnkelvoudigInformatieObject.objects.filter(pk=eio.pk).delete()
+
+        out = StringIO()
+        call_command("gc_inhoud_blobs", min_age=0, dry_run=True, stdout=out)
+
+        self.assertIn("1 unreferenced blob(s)", out.getvalue())
+        self.assertTrue(eio.inhoud.storage.exists(eio.inhoud.name))
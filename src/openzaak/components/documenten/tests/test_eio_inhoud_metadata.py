@@ -0,0 +1,130 @@
+import hashlib
+from io import StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+
+@temp_private_root()
+class InhoudMetadataTests(TestCase):
+    def test_metadata_stored_on_create(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        eio.refresh_from_db()
+        self.assertEqual(eio.bestandsomvang, 9)
+        self.assertEqual(eio.checksum_algoritme, "sha_256")
+        self.assertEqual(eio.checksum, hashlib.sha256(b"some data").hexdigest())
+
+    @override_settings(INHOUD_CHECKSUM_ALGORITME="md5")
+    def test_configured_algoritme(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        self.assertEqual(eio.checksum_algoritme, "md5")
+        self.assertEqual(eio.checksum, hashlib.md5(b"some data").hexdigest())
+
+    def test_streamed_checksum_reused(self):
+        inhoud = SimpleUploadedFile("file.bin", b"some data")
+        inhoud.checksum_algoritme = "sha_256"
+        inhoud.checksum = "precomputed"
+
+        eio = EnkelvoudigInformatieObjectFactory.create(inhoud=inhoud)
+
+        self.assertEqual(eio.checksum, "precomputed")
+
+    def test_metadata_not_recomputed_without_new_inhoud(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        EnkelvoudigInformatieObject.objects.filter(pk=eio.pk).update(checksum="kept")
+        eio.refresh_from_db()
+
+        eio.titel = "changed"
+        eio.save()
+
+        eio.refresh_from_db()
+        self.assertEqual(eio.checksum, "kept")
+
+
+@temp_private_root()
+class InhoudMetadataAPITests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def test_update_without_inhoud_copies_metadata(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(eio_url, {"titel": "changed", "lock": lock})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        new_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(new_version.bestandsomvang, 9)
+        self.assertEqual(new_version.checksum, eio.checksum)
+        self.assertEqual(response.data["bestandsomvang"], 9)
+
+    def test_update_with_inhoud_stores_new_metadata(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(eio)
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+
+        response = self.client.patch(
+            eio_url,
+            {
+                "inhoud": SimpleUploadedFile("new.txt", b"new content"),
+                "lock": lock,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        new_version = EnkelvoudigInformatieObject.objects.get(versie=2)
+        self.assertEqual(new_version.bestandsomvang, 11)
+        self.assertEqual(
+            new_version.checksum, hashlib.sha256(b"new content").hexdigest()
+        )
+
+
+@temp_private_root()
+class BackfillInhoudMetadataTests(TestCase):
+    def test_backfill(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        new_version = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2, inhoud=eio.inhoud
+        )
+        other = EnkelvoudigInformatieObjectFactory.create(inhoud__data=b"other data")
+        EnkelvoudigInformatieObject.objects.update(
+            bestandsomvang=None, checksum="", checksum_algoritme=""
+        )
+
+        out = StringIO()
+        call_command("backfill_inhoud_metadata", workers=2, batch_size=1, stdout=out)
+
+        self.assertIn("Updated 3 document version(s)", out.getvalue())
+        for instance in (eio, new_version):
+            instance.refresh_from_db()
+            self.assertEqual(instance.bestandsomvang, 9)
+            self.assertEqual(instance.checksum_algoritme, "sha_256")
+            self.assertEqual(
+                instance.checksum, hashlib.sha256(b"some data").hexdigest()
+            )
+        other.refresh_from_db()
+        self.assertEqual(other.bestandsomvang, 10)
+
+    def test_backfill_skips_complete_rows(self):
+        EnkelvoudigInformatieObjectFactory.create()
+
+        out = StringIO()
+        call_command("backfill_inhoud_metadata", stdout=out)
+
+        self.assertIn("Updated 0 document version(s)", out.getvalue())
@@ -0,0 +1,88 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.api.tests.utils import get_operation_url
+from openzaak.components.documenten.models import EnkelvoudigInformatieObjectCanonical
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.utils.tests import JWTAuthMixin
+
+
+class LatestVersionTests(TestCase):
+    def test_new_version_becomes_latest(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        new_version = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2
+        )
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get()
+        self.assertEqual(canonical.latest_version, new_version)
+        self.assertEqual(canonical.latest_versie, 2)
+
+    def test_saving_older_version_keeps_latest(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        new_version = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2
+        )
+
+        eio.save()
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get()
+        self.assertEqual(canonical.latest_version, new_version)
+        self.assertEqual(canonical.latest_versie, 2)
+
+
+@temp_private_root()
+class LatestVersionAPITests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_update_sets_latest_version(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create()
+        eio_url = reverse(canonical.latest_version)
+        lock = self.client.post(
+            get_operation_url(
+                "enkelvoudiginformatieobject_lock", uuid=canonical.latest_version.uuid
+            )
+        ).data["lock"]
+
+        response = self.client.patch(
+            eio_url, {"beschrijving": "beschrijving2", "lock": lock}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data["versie"], 2)
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.latest_versie, 2)
+        self.assertEqual(canonical.latest_version.beschrijving, "beschrijving2")
+        # the lock is not affected by the new version
+        self.assertEqual(canonical.lock, lock)
+
+    def test_list_num_queries_independent_of_versions(self):
+        EnkelvoudigInformatieObjectFactory.create()
+        url = reverse("enkelvoudiginformatieobject-list")
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        num_queries = len(context.captured_queries)
+
+        eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="versie1")
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2, beschrijving="versie2"
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(context.captured_queries), num_queries)
+        results = response.json()["results"]
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1]["beschrijving"], "versie2")
@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from privates.test import temp_private_root
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import (
+    ZaakInformatieobjectTypeFactory,
+)
+from openzaak.components.zaken.models import ZaakInformatieObject
+from openzaak.components.zaken.models.tests.factories import ZaakFactory
+from openzaak.notifications.models import OutboxNotification
+
+from ..models import EnkelvoudigInformatieObject
+from ..storage import get_blob_name
+
+
+@temp_private_root()
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=True)
+class ImportDocumentenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.filter(pk=settings.SITE_ID).update(domain="testserver")
+        Site.objects.clear_cache()
+
+        relation = ZaakInformatieobjectTypeFactory.create(
+            zaaktype__concept=False, informatieobjecttype__concept=False
+        )
+        cls.informatieobjecttype = relation.informatieobjecttype
+        cls.zaak = ZaakFactory.create(zaaktype=relation.zaaktype)
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _write_file(self, name: str, content: bytes) -> None:
+        with open(os.path.join(self.directory, name), "wb") as file:
+            file.write(content)
+
+    def _get_document(self, **kwargs) -> dict:
+        return {
+            "bronorganisatie": "159351741",
+            "creatiedatum": "2018-06-27",
+            "titel": "detailed summary",
+            "auteur": "test_auteur",
+            "taal": "eng",
+            "informatieobjecttype": f"http://testserver{reverse(self.informatieobjecttype)}",
+            **kwargs,
+        }
+
+    def _import(self, manifest: str, **options) -> list:
+        stderr = StringIO()
+        call_command(
+            "import_documenten",
+            os.path.join(self.directory, manifest),
+            workers=1,
+            stdout=StringIO(),
+            stderr=stderr,
+            **options,
+        )
+        return [json.loads(line) for line in stderr.getvalue().splitlines()]
+
+    def _write_jsonl(self, *documents) -> None:
+        with open(os.path.join(self.directory, "manifest.jsonl"), "w") as manifest:
+            for document in documents:
+                manifest.write(f"{json.dumps(document)}\n")
+
+    def test_import_csv(self):
+        self._write_file("a.txt", b"some data")
+        with open(os.path.join(self.directory, "manifest.csv"), "w") as manifest:
+            manifest.write(
+                "bronorganisatie,creatiedatum,titel,auteur,taal,informatieobjecttype,"
+                "bestand,zaak,integriteit.algoritme,integriteit.waarde,"
+                "integriteit.datum\n"
+                f"159351741,2018-06-27,summary,auteur,eng,"
+                f"http://testserver{reverse(self.informatieobjecttype)},a.txt,"
+                f"http://testserver{reverse(self.zaak)},md5,abc,2018-06-27\n"
+            )
+
+        errors = self._import("manifest.csv")
+
+        self.assertEqual(errors, [])
+        eio = EnkelvoudigInformatieObject.objects.get()
+        self.assertEqual(eio.inhoud.read(), b"some data")
+        self.assertEqual(eio.bestandsnaam, "a.txt")
+        self.assertEqual(eio.bestandsomvang, 9)
+        self.assertEqual(eio.checksum, hashlib.sha256(b"some data").hexdigest())
+        self.assertEqual(eio.integriteit["waarde"], "abc")
+        self.assertNotEqual(eio.identificatie, "")
+        self.assertEqual(eio.canonical.latest_version, eio)
+        # the file is linked, not moved
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "a.txt")))
+
+        zio = ZaakInformatieObject.objects.get()
+        self.assertEqual(zio.zaak, self.zaak)
+        self.assertEqual(zio.informatieobject, eio.canonical)
+
+        self.assertEqual(AuditTrail.objects.count(), 2)
+        self.assertEqual(OutboxNotification.objects.count(), 2)
+        notification = OutboxNotification.objects.get(kanaal="documenten")
+        self.assertEqual(
+            notification.bericht["kenmerken"]["informatieobjecttype"],
+            f"http://testserver{reverse(self.informatieobjecttype)}",
+        )
+
+    def test_errors_per_document(self):
+        self._write_file("a.txt", b"some data")
+        self._write_jsonl(
+            self._get_document(bestand="a.txt"),
+            self._get_document(bestand="missing.txt"),
+            self._get_document(bestand="a.txt", informatieobjecttype="foo"),
+        )
+
+        errors = self._import("manifest.jsonl", notify=False)
+
+        self.assertEqual([error["line"] for error in errors], [2, 3])
+        self.assertIn("bestand", errors[0]["errors"])
+        self.assertIn("informatieobjecttype", errors[1]["errors"])
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 1)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    def test_resume(self):
+        self._write_file("a.txt", b"some data")
+        self._write_file("b.txt", b"other data")
+        self._write_jsonl(self._get_document(bestand="a.txt"))
+        self._import("manifest.jsonl", notify=False)
+        self._write_jsonl(
+            self._get_document(bestand="a.txt"), self._get_document(bestand="b.txt")
+        )
+
+        stdout = StringIO()
+        call_command(
+            "import_documenten",
+            os.path.join(self.directory, "manifest.jsonl"),
+            workers=1,
+            notify=False,
+            stdout=stdout,
+        )
+
+        self.assertIn("Imported 1 documents, skipped 1", stdout.getvalue())
+        self.assertEqual(
+            sorted(
+                EnkelvoudigInformatieObject.objects.values_list(
+                    "bestandsnaam", flat=True
+                )
+            ),
+            ["a.txt", "b.txt"],
+        )
+
+    @override_settings(INHOUD_DEDUPLICATION=True)
+    def test_deduplicated(self):
+        self._write_file("a.txt", b"some data")
+        self._write_file("b.txt", b"some data")
+        self._write_jsonl(
+            self._get_document(bestand="a.txt"), self._get_document(bestand="b.txt")
+        )
+
+        errors = self._import("manifest.jsonl", notify=False, batch_size=1)
+
+        self.assertEqual(errors, [])
+        blob_name = get_blob_name(hashlib.sha256(b"some data").hexdigest())
+        eio1, eio2 = EnkelvoudigInformatieObject.objects.order_by("pk")
+        self.assertEqual(eio1.inhoud.name, blob_name)
+        self.assertEqual(eio2.inhoud.name, blob_name)
+        self.assertEqual(eio2.inhoud.read(), b"some data")
@@ -17,7 +17,7 @@ from openzaak.utils.tests import JWTAuthMixin
 
 
 @freeze_time("2012-01-14")
-@override_settings(NOTIFICATIONS_DISABLED=False)
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=False)
 class SendNotifTestCase(JWTAuthMixin, APITestCase):
 
     heeft_alle_autorisaties = True
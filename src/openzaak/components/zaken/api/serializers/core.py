@@ -1,8 +1,10 @@
 import logging
+from collections import defaultdict
+from typing import List
 
 from django.conf import settings
-from django.db import transaction
-from django.db.models import Max, Subquery
+from django.db import models, transaction
+from django.db.models import Max, Subquery, prefetch_related_objects
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 
@@ -29,12 +31,13 @@ from vng_api_common.serializers import (
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import (
     IsImmutableValidator,
-    ResourceValidator,
     UntilNowValidator,
     URLValidator,
 )
 
 from openzaak.components.besluiten.models import Besluit
+from openzaak.components.catalogi import snapshot
+from openzaak.components.catalogi.api.fields import SnapshotHyperlinkedRelatedField
 from openzaak.components.catalogi.models import (
     Eigenschap,
     ResultaatType,
@@ -44,6 +47,7 @@ from openzaak.components.catalogi.models import (
 )
 from openzaak.components.documenten.api.serializers import (
     EnkelvoudigInformatieObjectHyperlinkedRelatedField,
+    InformatieObjectRelationListSerializer,
 )
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
@@ -67,6 +71,7 @@ from openzaak.components.zaken.models.constants import (
     IndicatieMachtiging,
 )
 from openzaak.components.zaken.models.utils import BrondatumCalculator
+from openzaak.referentielijsten.validators import CachedResourceValidator
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 from openzaak.utils.serializer_fields import LengthHyperlinkedRelatedField
@@ -167,7 +172,7 @@ class ZaakSerializer(
     NestedUpdateMixin,
     serializers.HyperlinkedModelSerializer,
 ):
-    zaaktype = LengthHyperlinkedRelatedField(
+    zaaktype = SnapshotHyperlinkedRelatedField(
         view_name="zaaktype-detail",
         lookup_field="uuid",
         queryset=ZaakType.objects.all(),
@@ -291,7 +296,7 @@ class ZaakSerializer(
             "einddatum": {"read_only": True, "allow_null": True},
             "communicatiekanaal": {
                 "validators": [
-                    ResourceValidator(
+                    CachedResourceValidator(
                         "CommunicatieKanaal", settings.REFERENTIELIJSTEN_API_SPEC
                     )
                 ]
@@ -308,7 +313,7 @@ class ZaakSerializer(
             },
             "selectielijstklasse": {
                 "validators": [
-                    ResourceValidator(
+                    CachedResourceValidator(
                         "Resultaat",
                         settings.REFERENTIELIJSTEN_API_SPEC,
                         get_auth=get_auth,
@@ -454,7 +459,7 @@ class ZaakZoekSerializer(serializers.Serializer):
 
 
 class StatusSerializer(serializers.HyperlinkedModelSerializer):
-    statustype = LengthHyperlinkedRelatedField(
+    statustype = SnapshotHyperlinkedRelatedField(
         view_name="statustype-detail",
         lookup_field="uuid",
         queryset=StatusType.objects.all(),
@@ -485,7 +490,7 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         validated_attrs = super().validate(attrs)
 
         statustype = validated_attrs["statustype"]
-        validated_attrs["__is_eindstatus"] = statustype.is_eindstatus()
+        validated_attrs["__is_eindstatus"] = snapshot.is_eindstatus(statustype)
 
         # validate that all InformationObjects have indicatieGebruiksrecht set
         # and are unlocked
@@ -594,6 +599,12 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
             _zaak_fields_changed += ["archiefnominatie", "archiefactiedatum"]
 
         with transaction.atomic():
+            # lock the ZAAK, so concurrent statuses can't leave a stale
+            # current_status behind
+            Zaak.objects.select_for_update().only("pk").get(pk=zaak.pk)
+
+            # Status.save points the current_status of the ZAAK to the most
+            # recent status
             obj = super().create(validated_data)
 
             # Save updated information on the ZAAK
@@ -602,6 +613,56 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
         return obj
 
 
+def get_prefetch_lookups(
+    serializer: serializers.Serializer, prefix: str = ""
+) -> List[str]:
+    """
+    Return the lookups of the related objects rendered by the nested serializers.
+    """
+    lookups = []
+    for field in serializer.fields.values():
+        if (
+            field.write_only
+            or not isinstance(field, serializers.ModelSerializer)
+            or not field.source_attrs
+        ):
+            continue
+        lookup = prefix + "__".join(field.source_attrs)
+        lookups.append(lookup)
+        lookups += get_prefetch_lookups(field, f"{lookup}__")
+    return lookups
+
+
+class PolymorphicListSerializer(serializers.ListSerializer):
+    """
+    Load the identificatie of the serialized objects in bulk.
+
+    The identificatie of a zaakobject or rol is one of many models (and their
+    nested objects), depending on the discriminator. The objects are grouped by
+    the value of the discriminator, and the related objects of each group are
+    prefetched, so every rendered model is loaded in one query. Use it as
+    ``Meta.list_serializer_class`` of a :class:`PolymorphicSerializer`.
+    """
+
+    def to_representation(self, data):
+        iterable = list(data.all() if isinstance(data, models.Manager) else data)
+
+        discriminator = self.child.discriminator
+        groups = defaultdict(list)
+        for instance in iterable:
+            groups[getattr(instance, discriminator.discriminator_field)].append(
+                instance
+            )
+
+        for value, instances in groups.items():
+            group_serializer = discriminator.mapping.get(value)
+            if group_serializer is None:
+                continue
+            prefetch_related_objects(instances, *get_prefetch_lookups(group_serializer))
+
+        return super().to_representation(iterable)
+
+
 class ZaakObjectSerializer(PolymorphicSerializer):
     discriminator = Discriminator(
         discriminator_field="object_type",
@@ -653,6 +714,7 @@ class ZaakObjectSerializer(PolymorphicSerializer):
             "object_type_overige",
             "relatieomschrijving",
         )
+        list_serializer_class = PolymorphicListSerializer
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "uuid": {"read_only": True},
@@ -732,6 +794,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = ZaakInformatieObject
+        list_serializer_class = InformatieObjectRelationListSerializer
         fields = (
             "url",
             "uuid",
@@ -759,7 +822,7 @@ class ZaakInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
 class ZaakEigenschapSerializer(NestedHyperlinkedModelSerializer):
     parent_lookup_kwargs = {"zaak_uuid": "zaak__uuid"}
 
-    eigenschap = LengthHyperlinkedRelatedField(
+    eigenschap = SnapshotHyperlinkedRelatedField(
         view_name="eigenschap-detail",
         lookup_field="uuid",
         queryset=Eigenschap.objects.all(),
@@ -801,7 +864,7 @@ class KlantContactSerializer(serializers.HyperlinkedModelSerializer):
 
 
 class RolSerializer(PolymorphicSerializer):
-    roltype = LengthHyperlinkedRelatedField(
+    roltype = SnapshotHyperlinkedRelatedField(
         view_name="roltype-detail",
         lookup_field="uuid",
         queryset=RolType.objects.all(),
@@ -838,6 +901,7 @@ class RolSerializer(PolymorphicSerializer):
             "registratiedatum",
             "indicatie_machtiging",
         )
+        list_serializer_class = PolymorphicListSerializer
         validators = [
             RolOccurenceValidator(RolOmschrijving.initiator, max_amount=1),
             RolOccurenceValidator(RolOmschrijving.zaakcoordinator, max_amount=1),
@@ -892,7 +956,7 @@ class RolSerializer(PolymorphicSerializer):
 
 
 class ResultaatSerializer(serializers.HyperlinkedModelSerializer):
-    resultaattype = LengthHyperlinkedRelatedField(
+    resultaattype = SnapshotHyperlinkedRelatedField(
         view_name="resultaattype-detail",
         lookup_field="uuid",
         queryset=ResultaatType.objects.all(),
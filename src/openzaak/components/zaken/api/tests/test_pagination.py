@@ -0,0 +1,115 @@
+from datetime import date
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.models.tests.factories import ZaakFactory
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.utils.pagination import OptionalCursorPagination
+from openzaak.utils.tests import JWTAuthMixin
+
+
+@patch.object(OptionalCursorPagination, "page_size", 2)
+class CursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def _get(self, url, params=None):
+        response = self.client.get(url, params, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.json()
+
+    def _walk(self, params) -> list:
+        urls = []
+        data = self._get(reverse(Zaak), params)
+        while True:
+            urls += [zaak["url"] for zaak in data["results"]]
+            if not data["next"]:
+                return urls
+            data = self._get(data["next"])
+
+    def test_walk_forward(self):
+        zaken = ZaakFactory.create_batch(5)
+
+        urls = self._walk({"cursor": ""})
+
+        self.assertEqual(
+            urls, [f"http://testserver{reverse(zaak)}" for zaak in reversed(zaken)]
+        )
+
+    def test_previous(self):
+        ZaakFactory.create_batch(5)
+        first_page = self._get(reverse(Zaak), {"cursor": ""})
+        self.assertIsNone(first_page["previous"])
+        second_page = self._get(first_page["next"])
+
+        data = self._get(second_page["previous"])
+
+        self.assertEqual(data["results"], first_page["results"])
+        self.assertIsNone(data["previous"])
+        self.assertEqual(data["next"], first_page["next"])
+
+    def test_ordering_with_ties(self):
+        ZaakFactory.create_batch(3, startdatum=date(2019, 1, 1))
+        ZaakFactory.create_batch(2, startdatum=date(2018, 1, 1))
+
+        urls = self._walk({"cursor": "", "ordering": "startdatum"})
+
+        expected = Zaak.objects.order_by("startdatum", "pk")
+        self.assertEqual(
+            urls, [f"http://testserver{reverse(zaak)}" for zaak in expected]
+        )
+
+    def test_stable_under_inserts(self):
+        zaken = ZaakFactory.create_batch(4)
+        first_page = self._get(reverse(Zaak), {"cursor": ""})
+
+        ZaakFactory.create()
+        data = self._get(first_page["next"])
+
+        self.assertEqual(
+            [zaak["url"] for zaak in data["results"]],
+            [f"http://testserver{reverse(zaak)}" for zaak in reversed(zaken[:2])],
+        )
+
+    def test_count_modes(self):
+        ZaakFactory.create_batch(3)
+
+        self.assertEqual(self._get(reverse(Zaak), {"cursor": ""})["count"], 3)
+        self.assertIsNone(
+            self._get(reverse(Zaak), {"cursor": "", "count": "none"})["count"]
+        )
+        self.assertIsInstance(
+            self._get(reverse(Zaak), {"cursor": "", "count": "estimate"})["count"],
+            int,
+        )
+
+    def test_page_number_without_count(self):
+        ZaakFactory.create_batch(3)
+
+        data = self._get(reverse(Zaak), {"count": "none"})
+
+        self.assertIsNone(data["count"])
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNone(data["previous"])
+        data = self._get(data["next"])
+        self.assertEqual(len(data["results"]), 1)
+        self.assertIsNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            reverse(Zaak), {"cursor": "invalid"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_cursor_position(self):
+        cursor = OptionalCursorPagination.encode_cursor(["invalid", "invalid"], False)
+        params = {"cursor": cursor, "ordering": "startdatum"}
+
+        response = self.client.get(reverse(Zaak), params, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,99 @@
+"""
+Query-count benchmarks for the permission field projection.
+
+The permission classes only need ``zaaktype`` and
+``vertrouwelijkheidaanduiding`` of the main object, rendering the full
+``ZaakSerializer`` for that costs a query for every nested/related resource.
+"""
+from unittest.mock import Mock
+
+from rest_framework.test import APITestCase
+
+from openzaak.components.zaken.models import Status, Zaak
+from openzaak.components.zaken.models.tests.factories import (
+    StatusFactory,
+    ZaakEigenschapFactory,
+    ZaakFactory,
+)
+from openzaak.utils.tests import get_versioned_request
+
+from ..permissions import ZaakAuthRequired, ZaakNestedAuthRequired
+from ..serializers import ZaakSerializer
+from ..viewsets import StatusViewSet, ZaakEigenschapViewSet
+
+
+class ZaakAuthRequiredQueryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.request = get_versioned_request()
+
+    def test_format_data_matches_serializer(self):
+        zaak = ZaakFactory.create()
+        zaak = Zaak.objects.get(pk=zaak.pk)
+
+        data = ZaakAuthRequired().format_data(zaak, self.request)
+
+        serializer_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        self.assertEqual(
+            data,
+            {
+                "zaaktype": serializer_data["zaaktype"],
+                "vertrouwelijkheidaanduiding": serializer_data[
+                    "vertrouwelijkheidaanduiding"
+                ],
+            },
+        )
+
+    def test_format_data_num_queries(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create(zaak=zaak)
+        zaak = Zaak.objects.get(pk=zaak.pk)
+
+        # only the zaaktype is fetched
+        with self.assertNumQueries(1):
+            ZaakAuthRequired().format_data(zaak, self.request)
+
+    def test_format_data_zaaktype_cached(self):
+        zaak = ZaakFactory.create()
+        zaak = Zaak.objects.select_related("zaaktype").get(pk=zaak.pk)
+
+        with self.assertNumQueries(0):
+            ZaakAuthRequired().format_data(zaak, self.request)
+
+    def test_object_permission_related_resource_num_queries(self):
+        status = Status.objects.get(pk=StatusFactory.create().pk)
+        self.request.jwt_auth = Mock(**{"has_auth.return_value": True})
+        view = StatusViewSet(action="retrieve", request=self.request)
+
+        # zaak + zaaktype
+        with self.assertNumQueries(2):
+            has_permission = ZaakAuthRequired().has_object_permission(
+                self.request, view, status
+            )
+
+        self.assertTrue(has_permission)
+
+
+class ZaakNestedAuthRequiredQueryTests(APITestCase):
+    def test_has_permission_num_queries(self):
+        zaak_eigenschap = ZaakEigenschapFactory.create()
+        request = get_versioned_request()
+        request.jwt_auth = Mock(**{"has_auth.return_value": True})
+        view = ZaakEigenschapViewSet(
+            action="list",
+            request=request,
+            kwargs={"zaak_uuid": zaak_eigenschap.zaak.uuid},
+        )
+
+        # zaak + zaaktype
+        with self.assertNumQueries(2):
+            has_permission = ZaakNestedAuthRequired().has_permission(request, view)
+
+        self.assertTrue(has_permission)
+        request.jwt_auth.has_auth.assert_called_once()
+        fields = request.jwt_auth.has_auth.call_args[1]
+        self.assertEqual(
+            fields["vertrouwelijkheidaanduiding"],
+            zaak_eigenschap.zaak.vertrouwelijkheidaanduiding,
+        )
+        self.assertTrue(fields["zaaktype"].startswith("http://testserver/"))
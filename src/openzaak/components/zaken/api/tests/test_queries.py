@@ -0,0 +1,229 @@
+"""
+Guard the number of queries of the list endpoints.
+
+The number of queries must not depend on the number of rendered objects.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import RolTypes, ZaakobjectTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.models.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.zaken.models import (
+    Adres,
+    Huishouden,
+    Medewerker,
+    NatuurlijkPersoon,
+    RelevanteZaakRelatie,
+    SubVerblijfBuitenland,
+    TerreinGebouwdObject,
+    ZaakKenmerk,
+)
+from openzaak.components.zaken.models.constants import AardZaakRelatie
+from openzaak.components.zaken.models.tests.factories import (
+    ResultaatFactory,
+    RolFactory,
+    StatusFactory,
+    ZaakFactory,
+    ZaakInformatieObjectFactory,
+    ZaakObjectFactory,
+)
+from openzaak.components.zaken.tests.utils import ZAAK_READ_KWARGS
+from openzaak.utils.tests import JWTAuthMixin
+
+
+def create_zaak():
+    hoofdzaak = ZaakFactory.create()
+    zaak = ZaakFactory.create(hoofdzaak=hoofdzaak)
+    StatusFactory.create(zaak=zaak)
+    StatusFactory.create(zaak=zaak)
+    ResultaatFactory.create(zaak=zaak)
+    ZaakKenmerk.objects.create(zaak=zaak, kenmerk="kenmerk", bron="bron")
+    RelevanteZaakRelatie.objects.create(
+        zaak=zaak, url=hoofdzaak, aard_relatie=AardZaakRelatie.vervolg
+    )
+    ZaakFactory.create(hoofdzaak=zaak)
+    return zaak
+
+
+class ZaakListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_num_queries_independent_of_page_size(self):
+        zaak = create_zaak()
+        num_queries = self.get_num_queries()
+
+        for _ in range(5):
+            create_zaak()
+
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+        current_status = zaak.status_set.order_by("-datum_status_gezet").first()
+
+        response = self.client.get(reverse(zaak), **ZAAK_READ_KWARGS)
+
+        detail = response.json()
+        self.assertEqual(
+            detail["status"], f"http://testserver{reverse(current_status)}"
+        )
+        self.assertEqual(
+            detail["resultaat"], f"http://testserver{reverse(zaak.resultaat)}"
+        )
+        self.assertEqual(detail["kenmerken"], [{"kenmerk": "kenmerk", "bron": "bron"}])
+        self.assertEqual(
+            detail["relevanteAndereZaken"],
+            [
+                {
+                    "url": f"http://testserver{reverse(zaak.hoofdzaak)}",
+                    "aardRelatie": AardZaakRelatie.vervolg,
+                }
+            ],
+        )
+
+
+class ZaakInformatieObjectListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("zaakinformatieobject-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_num_queries_independent_of_number_of_objects(self):
+        ZaakInformatieObjectFactory.create()
+        num_queries = self.get_num_queries()
+
+        for _ in range(5):
+            zio = ZaakInformatieObjectFactory.create()
+            EnkelvoudigInformatieObjectFactory.create(
+                canonical=zio.informatieobject, versie=2
+            )
+
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+        response = self.client.get(reverse("zaakinformatieobject-list"))
+
+        latest_version = zio.informatieobject.latest_version
+        self.assertIn(
+            f"http://testserver{reverse(latest_version)}",
+            [data["informatieobject"] for data in response.json()],
+        )
+
+
+def create_zaakobjecten():
+    zaakobject = ZaakObjectFactory.create(object_type=ZaakobjectTypes.huishouden)
+    huishouden = Huishouden.objects.create(zaakobject=zaakobject, nummer="123456")
+    terreingebouwdobject = TerreinGebouwdObject.objects.create(
+        huishouden=huishouden, identificatie="1"
+    )
+    Adres.objects.create(
+        terreingebouwdobject=terreingebouwdobject,
+        num_identificatie="1",
+        identificatie="a",
+        wpl_woonplaats_naam="test city",
+        gor_openbare_ruimte_naam="test space",
+        huisnummer="11",
+    )
+    zaakobject = ZaakObjectFactory.create(object_type=ZaakobjectTypes.medewerker)
+    Medewerker.objects.create(zaakobject=zaakobject, identificatie="123456")
+    # without identificatie
+    ZaakObjectFactory.create(object_type=ZaakobjectTypes.medewerker)
+
+
+class ZaakObjectListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("zaakobject-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_num_queries_independent_of_number_of_objects(self):
+        create_zaakobjecten()
+        num_queries = self.get_num_queries()
+
+        for _ in range(5):
+            create_zaakobjecten()
+
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+        response = self.client.get(
+            reverse("zaakobject-list"), {"objectType": ZaakobjectTypes.huishouden}
+        )
+
+        data = response.json()
+        self.assertEqual(len(data), 6)
+        self.assertEqual(
+            data[0]["objectIdentificatie"]["isGehuisvestIn"]["adresAanduidingGrp"][
+                "aoaHuisnummer"
+            ],
+            11,
+        )
+
+
+def create_rollen():
+    rol = RolFactory.create(betrokkene_type=RolTypes.natuurlijk_persoon)
+    natuurlijkpersoon = NatuurlijkPersoon.objects.create(
+        rol=rol, anp_identificatie="12345", inp_a_nummer="1234567890"
+    )
+    Adres.objects.create(
+        natuurlijkpersoon=natuurlijkpersoon,
+        identificatie="123",
+        wpl_woonplaats_naam="test city",
+        gor_openbare_ruimte_naam="test",
+        huisnummer=1,
+    )
+    SubVerblijfBuitenland.objects.create(
+        natuurlijkpersoon=natuurlijkpersoon,
+        lnd_landcode="UK",
+        lnd_landnaam="United Kingdom",
+        sub_adres_buitenland_1="some uk adres",
+    )
+    rol = RolFactory.create(betrokkene_type=RolTypes.medewerker)
+    Medewerker.objects.create(rol=rol, identificatie="123456")
+
+
+class RolListQueriesTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get_num_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("rol-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_num_queries_independent_of_number_of_objects(self):
+        create_rollen()
+        num_queries = self.get_num_queries()
+
+        for _ in range(5):
+            create_rollen()
+
+        self.assertEqual(self.get_num_queries(), num_queries)
+
+        response = self.client.get(
+            reverse("rol-list"), {"betrokkeneType": RolTypes.natuurlijk_persoon}
+        )
+
+        data = response.json()
+        self.assertEqual(len(data), 6)
+        identificatie = data[0]["betrokkeneIdentificatie"]
+        self.assertEqual(identificatie["verblijfsadres"]["aoaHuisnummer"], 1)
+        self.assertEqual(identificatie["subVerblijfBuitenland"]["lndLandcode"], "UK")
@@ -1,9 +1,12 @@
+import json
 import uuid
 from unittest import skip
 from unittest.mock import patch
 
+from django.conf import settings
 from django.test import override_settings
 
+import requests_mock
 from freezegun import freeze_time
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -42,6 +45,7 @@ from openzaak.components.zaken.models.tests.factories import (
     ZaakInformatieObjectFactory,
 )
 from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS, isodatetime
+from openzaak.referentielijsten.cache import memory_cache
 from openzaak.utils.tests import JWTAuthMixin
 
 
@@ -322,6 +326,52 @@ class ZaakValidationTests(JWTAuthMixin, APITestCase):
         self.assertEqual(validation_error["code"], "invalid-resource")
 
 
+@override_settings(REFERENTIELIJSTEN_CACHE_TTL=60)
+class CachedReferentielijstenValidationTests(JWTAuthMixin, APITestCase):
+
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+        memory_cache.clear()
+        self.addCleanup(memory_cache.clear)
+
+    @patch("vng_api_common.validators.obj_has_shape", return_value=True)
+    def test_communicatiekanaal_fetched_once(self, mock_shape):
+        zaaktype = ZaakTypeFactory.create()
+        kanaal_url = (
+            "https://referentielijsten.example.com/api/v1/communicatiekanalen/1"
+        )
+        data = {
+            "zaaktype": f"http://testserver{reverse(zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2018-06-11",
+            "startdatum": "2018-06-11",
+            "communicatiekanaal": kanaal_url,
+        }
+
+        with requests_mock.Mocker() as m:
+            m.get(kanaal_url, json={"url": kanaal_url, "naam": "email"})
+            m.get(
+                settings.REFERENTIELIJSTEN_API_SPEC,
+                text=json.dumps({"openapi": "3.0.0", "components": {}}),
+            )
+
+            for _ in range(2):
+                response = self.client.post(
+                    reverse("zaak-list"), data, **ZAAK_WRITE_KWARGS
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_201_CREATED, response.data
+                )
+
+        urls = [request.url for request in m.request_history]
+        self.assertEqual(urls.count(kanaal_url), 1)
+        self.assertEqual(urls.count(settings.REFERENTIELIJSTEN_API_SPEC), 1)
+
+
 class ZaakUpdateValidation(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
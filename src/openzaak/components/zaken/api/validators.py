@@ -9,6 +9,8 @@ from vng_api_common.validators import (
     UniekeIdentificatieValidator as _UniekeIdentificatieValidator,
 )
 
+from openzaak.components.catalogi import snapshot
+
 
 class RolOccurenceValidator:
     """
@@ -116,7 +118,7 @@ class CorrectZaaktypeValidator:
         if not url or not zaak:
             return
 
-        if url.zaaktype != zaak.zaaktype:
+        if url.zaaktype_id != zaak.zaaktype_id:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
@@ -131,9 +133,15 @@ class ZaaktypeInformatieobjecttypeRelationValidator:
             return
 
         io = informatieobject.enkelvoudiginformatieobject_set.first()
-        if not zaak.zaaktype.heeft_relevant_informatieobjecttype.filter(
-            id=io.informatieobjecttype_id, concept=False
-        ).exists():
+        is_relevant = snapshot.is_relevant_informatieobjecttype(
+            zaak.zaaktype_id, io.informatieobjecttype_id
+        )
+        if is_relevant is None:
+            is_relevant = zaak.zaaktype.heeft_relevant_informatieobjecttype.filter(
+                id=io.informatieobjecttype_id, concept=False
+            ).exists()
+
+        if not is_relevant:
             raise serializers.ValidationError(self.message, code=self.code)
 
 
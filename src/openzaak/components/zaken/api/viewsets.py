@@ -1,6 +1,7 @@
 import logging
 
 from django.db import models
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from django.utils.translation import ugettext_lazy as _
 
@@ -8,29 +9,30 @@ from rest_framework import mixins, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.filters import OrderingFilter
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.reverse import reverse
-from vng_api_common.audittrails.viewsets import (
+from vng_api_common.filters import Backend
+from vng_api_common.geo import GeoMixin
+from vng_api_common.search import SearchMixin
+from vng_api_common.utils import lookup_kwargs_to_filters
+from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
+
+from openzaak.audittrails.viewsets import (
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
     AuditTrailViewSet,
     AuditTrailViewsetMixin,
 )
-from vng_api_common.filters import Backend
-from vng_api_common.geo import GeoMixin
-from vng_api_common.notifications.viewsets import (
+from openzaak.components.besluiten.models import Besluit
+from openzaak.notifications.viewsets import (
     NotificationCreateMixin,
     NotificationViewSetMixin,
 )
-from vng_api_common.search import SearchMixin
-from vng_api_common.utils import lookup_kwargs_to_filters
-from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
-
-from openzaak.components.besluiten.models import Besluit
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
+from openzaak.utils.pagination import OptionalCursorPagination
 
 from ..models import (
     KlantContact,
+    RelevanteZaakRelatie,
     Resultaat,
     Rol,
     Status,
@@ -190,14 +192,27 @@ class ZaakViewSet(
     - `klantcontact` - alle klantcontacten bij een zaak
     """
 
-    queryset = Zaak.objects.prefetch_related("deelzaken").order_by("-pk")
+    queryset = (
+        Zaak.objects.select_related(
+            "zaaktype", "hoofdzaak", "resultaat", "current_status"
+        )
+        .prefetch_related(
+            "deelzaken",
+            "zaakkenmerk_set",
+            Prefetch(
+                "relevante_andere_zaken",
+                queryset=RelevanteZaakRelatie.objects.select_related("url"),
+            ),
+        )
+        .order_by("-pk")
+    )
     serializer_class = ZaakSerializer
     search_input_serializer_class = ZaakZoekSerializer
     filter_backends = (Backend, OrderingFilter)
     filterset_class = ZaakFilter
     ordering_fields = ("startdatum",)
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = OptionalCursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
@@ -244,7 +259,7 @@ class ZaakViewSet(
 
         """
         zaak = self.get_object()
-        zaak_data = self.get_serializer(zaak).data
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
 
         if not self.request.jwt_auth.has_auth(
             scopes=SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
@@ -326,7 +341,7 @@ class StatusViewSet(
           insufficient permissions
         """
         zaak = serializer.validated_data["zaak"]
-        zaak_data = ZaakSerializer(zaak, context={"request": self.request}).data
+        zaak_data = ZaakAuthRequired().format_data(zaak, self.request)
         component = self.queryset.model._meta.app_label
 
         if not self.request.jwt_auth.has_auth(
@@ -378,7 +393,7 @@ class ZaakObjectViewSet(
     Een specifiek ZAAKOBJECT opvragen.
     """
 
-    queryset = ZaakObject.objects.all()
+    queryset = ZaakObject.objects.select_related("zaak")
     serializer_class = ZaakObjectSerializer
     filterset_class = ZaakObjectFilter
     lookup_field = "uuid"
@@ -462,7 +477,9 @@ class ZaakInformatieObjectViewSet(
     De gespiegelde relatie in de Documenten API wordt door de Zaken API verwijderd. Consumers kunnen dit niet handmatig doen..
     """
 
-    queryset = ZaakInformatieObject.objects.all()
+    queryset = ZaakInformatieObject.objects.select_related(
+        "zaak", "informatieobject__latest_version"
+    )
     filterset_class = ZaakInformatieObjectFilter
     serializer_class = ZaakInformatieObjectSerializer
     lookup_field = "uuid"
@@ -605,7 +622,7 @@ class RolViewSet(
 
     """
 
-    queryset = Rol.objects.all()
+    queryset = Rol.objects.select_related("zaak", "roltype")
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
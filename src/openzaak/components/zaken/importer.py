@@ -0,0 +1,317 @@
+"""
+Bulk import of zaken, including their statussen, rollen, zaakobjecten and
+eigenschappen.
+
+Every zaak is a JSON object in the representation of the Zaken API, with the
+related resources nested in it, minus their ``zaak`` reference::
+
+    {
+        "zaaktype": "https://example.com/catalogi/api/v1/zaaktypen/...",
+        "bronorganisatie": "517439943",
+        ...
+        "statussen": [{"statustype": "...", "datumStatusGezet": "..."}],
+        "rollen": [{"betrokkeneType": "natuurlijk_persoon", ...}],
+        "zaakobjecten": [{"objectType": "adres", ...}],
+        "eigenschappen": [{"eigenschap": "...", "waarde": "..."}]
+    }
+
+The zaken and the related resources are validated with the serializers of
+the API, and inserted per batch with ``bulk_create``. Audit trails are written
+like the API does, with a bulk insert per batch. The notifications are stored
+in the outbox, to be sent by the ``deliver_notifications`` command.
+
+Closing a zaak requires a resultaat, so zaken are imported without an
+eindstatus - they can be closed through the API.
+"""
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework import serializers
+from vng_api_common.constants import RolOmschrijving
+from vng_api_common.serializers import GegevensGroepType
+
+from openzaak.audittrails.buffer import AuditTrailBuffer
+from openzaak.notifications.models import OutboxNotification
+from openzaak.utils.data_filtering import get_va_order
+from openzaak.utils.imports import IdentificatieGenerator, get_request, record_create
+
+from .api.audits import AUDIT_ZRC
+from .api.kanalen import KANAAL_ZAKEN
+from .api.serializers import (
+    RolSerializer,
+    StatusSerializer,
+    ZaakEigenschapSerializer,
+    ZaakObjectSerializer,
+    ZaakSerializer,
+)
+from .models import (
+    RelevanteZaakRelatie,
+    Rol,
+    Status,
+    Zaak,
+    ZaakEigenschap,
+    ZaakKenmerk,
+    ZaakObject,
+)
+from .models.constants import BetalingsIndicatie
+
+# the key in the import data, with the serializer and model of the resources
+NESTED_RESOURCES = {
+    "statussen": (StatusSerializer, Status),
+    "rollen": (RolSerializer, Rol),
+    "zaakobjecten": (ZaakObjectSerializer, ZaakObject),
+    "eigenschappen": (ZaakEigenschapSerializer, ZaakEigenschap),
+}
+
+# the gegevensgroep with the identification of the betrokkene or object
+GROUP_FIELDS = {
+    "rollen": ("betrokkene_identificatie", "betrokkene_type", "rol"),
+    "zaakobjecten": ("object_identificatie", "object_type", "zaakobject"),
+}
+
+UNIQUE_ROLLEN = (RolOmschrijving.initiator, RolOmschrijving.zaakcoordinator)
+
+
+class ZaakGraph:
+    """
+    A validated zaak with its related resources, ready to be inserted.
+    """
+
+    def __init__(self, line: int, zaak_data: dict, nested_data: Dict[str, list]):
+        self.line = line
+        self.zaak_data = zaak_data
+        self.nested_data = nested_data
+
+    def build_zaak(self) -> Zaak:
+        data = self.zaak_data.copy()
+        kenmerken = data.pop("zaakkenmerk_set", [])
+        relevante_andere_zaken = data.pop("relevante_andere_zaken", [])
+        gegevensgroepen = {
+            name: data.pop(name)
+            for name in list(data)
+            if isinstance(getattr(Zaak, name, None), GegevensGroepType)
+        }
+        data.setdefault(
+            "vertrouwelijkheidaanduiding", data["zaaktype"].vertrouwelijkheidaanduiding
+        )
+
+        zaak = Zaak(**data)
+        for name, value in gegevensgroepen.items():
+            setattr(zaak, name, value)
+
+        # bulk_create doesn't call save()
+        zaak.va_order = get_va_order(zaak.vertrouwelijkheidaanduiding)
+        if zaak.betalingsindicatie == BetalingsIndicatie.nvt:
+            zaak.laatste_betaaldatum = None
+
+        zaak.kenmerken = [ZaakKenmerk(zaak=zaak, **kenmerk) for kenmerk in kenmerken]
+        zaak.relevante_relaties = [
+            RelevanteZaakRelatie(zaak=zaak, **relatie)
+            for relatie in relevante_andere_zaken
+        ]
+        return zaak
+
+
+class ZaakImporter:
+    """
+    Validate and insert zaken in batches.
+
+    :param notify: store the notifications of the created resources in the
+      outbox
+    :param toelichting: the ``toelichting`` of the audit trails
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        notify: bool = True,
+        toelichting: str = "Import",
+    ):
+        self.batch_size = batch_size
+        self.notify = notify and not settings.NOTIFICATIONS_DISABLED
+        self.toelichting = toelichting
+        self.request = get_request()
+        self.context = {"request": self.request}
+        self.identificaties = IdentificatieGenerator("registratiedatum")
+        self.count = 0
+
+    def run(self, rows: Iterable[Tuple[int, dict]]) -> Iterator[Tuple[int, dict]]:
+        """
+        Import the (line number, data) ``rows``.
+
+        Yields the line number and the errors of every zaak that is not
+        imported.
+        """
+        batch: List[ZaakGraph] = []
+        for line, data in rows:
+            try:
+                batch.append(self.validate(line, data))
+            except serializers.ValidationError as exc:
+                yield line, exc.detail
+                continue
+
+            if len(batch) >= self.batch_size:
+                yield from self.save(batch)
+                batch = []
+
+        if batch:
+            yield from self.save(batch)
+
+    def validate(self, line: int, data: dict) -> ZaakGraph:
+        data = underscoreize(data)
+        nested = {name: data.pop(name, []) for name in NESTED_RESOURCES}
+
+        serializer = ZaakSerializer(data=data, context=self.context)
+        serializer.is_valid(raise_exception=True)
+        graph = ZaakGraph(line, serializer.validated_data, {})
+
+        # the nested resources are validated against the (unsaved) zaak
+        zaak = graph.build_zaak()
+        errors = {}
+        for name, (serializer_class, _model) in NESTED_RESOURCES.items():
+            graph.nested_data[name] = []
+            nested_errors = []
+            for item in nested[name]:
+                serializer = serializer_class(data=item, context=self.context)
+                serializer.fields["zaak"] = serializers.HiddenField(default=zaak)
+                if serializer.is_valid():
+                    graph.nested_data[name].append(serializer.validated_data)
+                    nested_errors.append({})
+                else:
+                    nested_errors.append(serializer.errors)
+            if any(nested_errors):
+                errors[name] = nested_errors
+
+        if any(status["__is_eindstatus"] for status in graph.nested_data["statussen"]):
+            errors.setdefault("non_field_errors", []).append(
+                "Zaken can't be imported with an eindstatus"
+            )
+
+        occurences = Counter(
+            rol["omschrijving_generiek"] for rol in graph.nested_data["rollen"]
+        )
+        for omschrijving_generiek in UNIQUE_ROLLEN:
+            if occurences[omschrijving_generiek] > 1:
+                errors.setdefault("non_field_errors", []).append(
+                    f"There are {occurences[omschrijving_generiek]} "
+                    f"`{omschrijving_generiek}` rollen"
+                )
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return graph
+
+    def save(self, batch: List[ZaakGraph]) -> Iterator[Tuple[int, dict]]:
+        try:
+            self._save(batch)
+        except IntegrityError as exc:
+            # the generated identificaties may have been taken in the meantime
+            self.identificaties.reset()
+            if len(batch) == 1:
+                yield batch[0].line, {"non_field_errors": [str(exc)]}
+                return
+            # find out which zaken are the problem, and import the others
+            for graph in batch:
+                yield from self.save([graph])
+
+    @transaction.atomic
+    def _save(self, batch: List[ZaakGraph]) -> None:
+        with AuditTrailBuffer(batch_size=self.batch_size * 10):
+            zaken = [graph.build_zaak() for graph in batch]
+            for zaak in zaken:
+                self.identificaties.set_identificatie(zaak)
+            Zaak.objects.bulk_create(zaken)
+            ZaakKenmerk.objects.bulk_create(
+                kenmerk for zaak in zaken for kenmerk in zaak.kenmerken
+            )
+            RelevanteZaakRelatie.objects.bulk_create(
+                relatie for zaak in zaken for relatie in zaak.relevante_relaties
+            )
+
+            created = {}
+            for name, (_serializer_class, model) in NESTED_RESOURCES.items():
+                instances = [
+                    self.build_instance(name, model, zaak, data)
+                    for zaak, graph in zip(zaken, batch)
+                    for data in graph.nested_data[name]
+                ]
+                model.objects.bulk_create(instances)
+                self.create_groups(name, instances)
+                created[name] = instances
+
+            self.set_current_statussen(zaken, created["statussen"])
+
+            notifications = []
+            zaak_data = {}
+            for zaak in zaken:
+                zaak_data[zaak.pk] = ZaakSerializer(zaak, context=self.context).data
+                notifications.append(self.record(zaak, zaak_data[zaak.pk], zaak_data))
+            for name, (serializer_class, _model) in NESTED_RESOURCES.items():
+                for instance in created[name]:
+                    data = serializer_class(instance, context=self.context).data
+                    notifications.append(self.record(instance, data, zaak_data))
+
+            if self.notify:
+                OutboxNotification.objects.bulk_create(notifications)
+
+        self.count += len(batch)
+
+    @staticmethod
+    def build_instance(name: str, model, zaak: Zaak, data: dict):
+        data = {key: value for key, value in data.items() if key != "__is_eindstatus"}
+        data["zaak"] = zaak
+        group_data = (
+            data.pop(GROUP_FIELDS[name][0], None) if name in GROUP_FIELDS else None
+        )
+        instance = model(**data)
+        instance.group_data = group_data
+        if isinstance(instance, Rol):
+            instance._derive_roltype_attributes()
+        return instance
+
+    @staticmethod
+    def create_groups(name: str, instances: list) -> None:
+        """
+        Create the betrokkene- or objectidentificatie, like the serializers do.
+        """
+        if name not in GROUP_FIELDS:
+            return
+
+        group_field, type_field, relation = GROUP_FIELDS[name]
+        serializer_class = NESTED_RESOURCES[name][0]
+        mapping = serializer_class.discriminator.mapping
+        for instance in instances:
+            if not instance.group_data:
+                continue
+            group_serializer = mapping[getattr(instance, type_field)]
+            serializer = group_serializer.get_fields()[group_field]
+            serializer.create({**instance.group_data, relation: instance})
+
+    @staticmethod
+    def set_current_statussen(zaken: List[Zaak], statussen: List[Status]) -> None:
+        for status in sorted(statussen, key=lambda status: status.datum_status_gezet):
+            status.zaak.current_status = status
+        Zaak.objects.bulk_update(
+            [zaak for zaak in zaken if zaak.current_status_id], ["current_status"]
+        )
+
+    def record(self, instance, data: dict, zaak_data: dict) -> OutboxNotification:
+        """
+        Store the audit trail and return the notification of a created resource.
+
+        :param zaak_data: the representation of the imported zaken, by pk
+        """
+        zaak = instance if isinstance(instance, Zaak) else instance.zaak
+        return record_create(
+            AUDIT_ZRC,
+            KANAAL_ZAKEN,
+            instance,
+            data,
+            zaak,
+            zaak_data[zaak.pk],
+            toelichting=self.toelichting,
+        )
@@ -0,0 +1,74 @@
+import json
+import sys
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from ...importer import ZaakImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Import zaken with their statussen, rollen, zaakobjecten and "
+        "eigenschappen from a file with a JSON object per line. The errors of "
+        "zaken that are not imported are written as JSON lines to stderr."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="The file to import, or - for stdin")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of zaken to insert per transaction",
+        )
+        parser.add_argument(
+            "--no-notifications",
+            action="store_false",
+            dest="notify",
+            help="Don't send notifications of the imported resources",
+        )
+        parser.add_argument(
+            "--toelichting",
+            default="Import",
+            help="Toelichting of the audit trails of the imported resources",
+        )
+
+    def handle(self, file, batch_size, notify, toelichting, **options):
+        if notify and not settings.NOTIFICATIONS_OUTBOX:
+            raise CommandError(
+                "Notifications of imported zaken are sent through the outbox, "
+                "enable NOTIFICATIONS_OUTBOX or use --no-notifications"
+            )
+
+        importer = ZaakImporter(
+            batch_size=batch_size, notify=notify, toelichting=toelichting
+        )
+        self.failed = 0
+        if file == "-":
+            self.import_lines(importer, sys.stdin)
+        else:
+            with open(file) as lines:
+                self.import_lines(importer, lines)
+
+        self.stdout.write(
+            f"Imported {importer.count} zaken, "
+            f"{self.failed} zaken could not be imported"
+        )
+
+    def import_lines(self, importer: ZaakImporter, lines) -> None:
+        for line, errors in importer.run(self.parse(lines)):
+            self.report(line, errors)
+
+    def parse(self, lines):
+        for line, content in enumerate(lines, start=1):
+            if not content.strip():
+                continue
+            try:
+                yield line, json.loads(content)
+            except ValueError as exc:
+                self.report(line, {"non_field_errors": [str(exc)]})
+
+    def report(self, line: int, errors: dict) -> None:
+        self.failed += 1
+        self.stderr.write(json.dumps({"line": line, "errors": errors}))
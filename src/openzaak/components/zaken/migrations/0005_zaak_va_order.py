@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+# frozen copy of openzaak.utils.data_filtering.VA_ORDER
+VA_ORDER = {
+    "openbaar": 1,
+    "beperkt_openbaar": 2,
+    "intern": 3,
+    "zaakvertrouwelijk": 4,
+    "vertrouwelijk": 5,
+    "confidentieel": 6,
+    "geheim": 7,
+    "zeer_geheim": 8,
+}
+
+
+def set_va_order(apps, _):
+    Zaak = apps.get_model("zaken", "Zaak")
+    for value, order in VA_ORDER.items():
+        Zaak.objects.filter(vertrouwelijkheidaanduiding=value).update(va_order=order)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("zaken", "0004_auto_20190820_0945")]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="va_order",
+            field=models.PositiveSmallIntegerField(
+                editable=False,
+                help_text="Volgorde van de vertrouwelijkheidaanduiding, om efficiënt op autorisaties te filteren.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(set_va_order, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["zaaktype", "va_order"], name="zaak_zaaktype_va_order_idx"
+            ),
+        ),
+    ]
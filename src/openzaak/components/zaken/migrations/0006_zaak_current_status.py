@@ -0,0 +1,36 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_current_status(apps, _):
+    Zaak = apps.get_model("zaken", "Zaak")
+    Status = apps.get_model("zaken", "Status")
+
+    current_status = (
+        Status.objects.filter(zaak=models.OuterRef("pk"))
+        .order_by("-datum_status_gezet")
+        .values("pk")[:1]
+    )
+    Zaak.objects.update(current_status=models.Subquery(current_status))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("zaken", "0005_zaak_va_order")]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="current_status",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De huidige STATUS van de ZAAK: de STATUS met de meest recente `datumStatusGezet`.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="zaken.Status",
+            ),
+        ),
+        migrations.RunPython(set_current_status, migrations.RunPython.noop),
+    ]
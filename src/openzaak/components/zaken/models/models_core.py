@@ -6,7 +6,7 @@ from django.conf import settings
 from django.contrib.gis.db.models import GeometryField
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import RegexValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils.crypto import get_random_string
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
@@ -32,6 +32,8 @@ from vng_api_common.utils import (
 )
 from vng_api_common.validators import alphanumeric_excluding_diacritic
 
+from openzaak.utils.data_filtering import get_va_order
+
 from .constants import AardZaakRelatie, BetalingsIndicatie, IndicatieMachtiging
 from .query import ZaakQuerySet, ZaakRelatedQuerySet
 
@@ -177,6 +179,26 @@ class Zaak(APIMixin, models.Model):
             "Aanduiding van de mate waarin het zaakdossier van de ZAAK voor de openbaarheid bestemd is."
         ),
     )
+    va_order = models.PositiveSmallIntegerField(
+        null=True,
+        editable=False,
+        help_text=_(
+            "Volgorde van de vertrouwelijkheidaanduiding, om efficiënt op "
+            "autorisaties te filteren."
+        ),
+    )
+    current_status = models.ForeignKey(
+        "zaken.Status",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text=_(
+            "De huidige STATUS van de ZAAK: de STATUS met de meest recente "
+            "`datumStatusGezet`."
+        ),
+    )
 
     betalingsindicatie = models.CharField(
         _("betalingsindicatie"),
@@ -291,6 +313,11 @@ class Zaak(APIMixin, models.Model):
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
         unique_together = ("bronorganisatie", "identificatie")
+        indexes = [
+            models.Index(
+                fields=["zaaktype", "va_order"], name="zaak_zaaktype_va_order_idx"
+            )
+        ]
 
     def __str__(self):
         return self.identificatie
@@ -307,12 +334,20 @@ class Zaak(APIMixin, models.Model):
         ):
             self.laatste_betaaldatum = None
 
+        self.va_order = get_va_order(self.vertrouwelijkheidaanduiding)
+
         super().save(*args, **kwargs)
 
     @property
     def current_status_uuid(self):
-        status = self.status_set.order_by("-datum_status_gezet").first()
-        return status.uuid if status else None
+        return self.current_status.uuid if self.current_status_id else None
+
+    def update_current_status(self) -> None:
+        """
+        Point ``current_status`` to the most recent status and persist it.
+        """
+        self.current_status = self.status_set.order_by("-datum_status_gezet").first()
+        self.save(update_fields=["current_status"])
 
     def unique_representation(self):
         return f"{self.bronorganisatie} - {self.identificatie}"
@@ -379,6 +414,29 @@ class Status(models.Model):
     def __str__(self):
         return "Status op {}".format(self.datum_status_gezet)
 
+    def save(self, *args, **kwargs):
+        previous_zaak_id = None
+        if self.pk:
+            previous_zaak_id = (
+                Status.objects.filter(pk=self.pk)
+                .values_list("zaak_id", flat=True)
+                .first()
+            )
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # the status is not necessarily the most recent one, and a changed
+            # datum_status_gezet can make another status the most recent one
+            self.zaak.update_current_status()
+            if previous_zaak_id is not None and previous_zaak_id != self.zaak_id:
+                Zaak.objects.get(pk=previous_zaak_id).update_current_status()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            self.zaak.update_current_status()
+        return result
+
     def unique_representation(self):
         return f"({self.zaak.unique_representation()}) - {self.datum_status_gezet}"
 
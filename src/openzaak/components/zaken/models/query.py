@@ -1,18 +1,23 @@
-from urllib.parse import urlparse
-
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
 
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
-from vng_api_common.utils import get_resource_for_path
+
+from openzaak.utils.data_filtering import (
+    UrlResolver,
+    filter_by_authorized_types,
+    get_authorized_pks,
+    get_resource_pks,
+)
 
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        resolve_urls: UrlResolver = get_resource_pks,
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -34,59 +39,20 @@ class AuthorizationsFilterMixin:
           authorizations
         :param authorizations: queryset of
           :class:`vng_api_common.authorizations.Autorisatie` objects
+        :param resolve_urls: callable resolving the ``zaaktype`` URLs to
+          primary keys, in bulk
 
         :return: a queryset of filtered results according to the
           authorizations provided
         """
-        # keep a list of allowed zaaktypen
-        zaaktypen = []
-
         prefix = (
             "" if not self.authorizations_lookup else f"{self.authorizations_lookup}__"
         )
 
-        # annotate the queryset so we can map a string value to a logical number
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            f"{prefix}vertrouwelijkheidaanduiding"
-        )
+        # the allowed zaaktypen (PKs) and their max_vertrouwelijkheidaanduiding
+        zaaktypen = get_authorized_pks(scope, authorizations, "zaaktype", resolve_urls)
 
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``zaaktype``
-        vertrouwelijkheidaanduiding_whens = []
-        for authorization in authorizations:
-            # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
-                continue
-
-            # this zaaktype is allowed
-            zaaktype_path = urlparse(authorization.zaaktype).path
-            zaaktype = get_resource_for_path(zaaktype_path)
-            zaaktypen.append(zaaktype)
-
-            # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
-                authorization.max_vertrouwelijkheidaanduiding
-            )
-            vertrouwelijkheidaanduiding_whens.append(
-                When(**{f"{prefix}zaaktype": zaaktype}, then=Value(choice_item.order))
-            )
-
-        # apply the order annnotation so we can filter later
-        annotations = {f"{prefix}_va_order": order_case}
-        # filtering:
-        # * only allow the white-listed zaaktypen, explicitly
-        # * apply the filtering to limit cases within case-types to the maximal
-        #   confidentiality level
-        filters = {
-            f"{prefix}zaaktype__in": zaaktypen,
-            f"{prefix}_va_order__lte": Case(
-                *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
-            ),
-        }
-
-        # bring it all together now to build the resulting queryset
-        queryset = self.annotate(**annotations).filter(**filters)
-        return queryset
+        return filter_by_authorized_types(self, zaaktypen, "zaaktype", prefix=prefix)
 
 
 class ZaakQuerySet(AuthorizationsFilterMixin, models.QuerySet):
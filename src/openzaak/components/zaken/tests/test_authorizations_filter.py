@@ -0,0 +1,200 @@
+"""
+Benchmark the list filtering for clients with many authorized zaaktypen.
+
+The zaaktype URLs of the authorizations are resolved in bulk, so the number of
+queries doesn't grow with the number of authorizations.
+"""
+import uuid
+
+from django.test import TestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import (
+    CatalogusFactory,
+    ZaakTypeFactory,
+)
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.models.tests.factories import ZaakFactory
+from openzaak.utils.data_filtering import get_resource_pks
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN
+from .utils import ZAAK_READ_KWARGS
+
+NUM_ZAAKTYPEN = 500
+
+
+def get_zaaktype_url(zaaktype) -> str:
+    return f"http://testserver{reverse(zaaktype)}"
+
+
+class BulkResolveTests(TestCase):
+    def test_resolve_urls_one_query(self):
+        zaaktypen = ZaakTypeFactory.create_batch(3, catalogus=CatalogusFactory.create())
+        urls = [get_zaaktype_url(zaaktype) for zaaktype in zaaktypen]
+
+        with self.assertNumQueries(1):
+            pks = get_resource_pks(
+                urls
+                + [
+                    "",
+                    "https://example.com/foo",
+                    urls[0].replace(str(zaaktypen[0].uuid), "invalid"),
+                    urls[0].replace(str(zaaktypen[0].uuid), str(uuid.uuid4())),
+                ]
+            )
+
+        self.assertEqual(
+            pks, {url: zaaktype.pk for url, zaaktype in zip(urls, zaaktypen)}
+        )
+
+    def test_least_strict_vertrouwelijkheidaanduiding_wins(self):
+        zaaktype = ZaakTypeFactory.create()
+        zaak = ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            zaaktype=zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+        authorizations = [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                zaaktype=get_zaaktype_url(zaaktype),
+                max_vertrouwelijkheidaanduiding=va,
+            )
+            for va in (
+                VertrouwelijkheidsAanduiding.openbaar,
+                VertrouwelijkheidsAanduiding.geheim,
+            )
+        ]
+
+        queryset = Zaak.objects.filter_for_authorizations(
+            SCOPE_ZAKEN_ALLES_LEZEN, authorizations
+        )
+
+        self.assertEqual(list(queryset), [zaak])
+
+
+class FilterEngineTests(TestCase):
+    def test_va_order_stored(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        self.assertEqual(zaak.va_order, 1)
+
+        zaak.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.zeer_geheim
+        zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.va_order, 8)
+
+    def test_engines_equivalent(self):
+        zaaktype1, zaaktype2, zaaktype3 = ZaakTypeFactory.create_batch(3)
+        for zaaktype in (zaaktype1, zaaktype2, zaaktype3):
+            for va in VertrouwelijkheidsAanduiding.values:
+                ZaakFactory.create(zaaktype=zaaktype, vertrouwelijkheidaanduiding=va)
+        authorizations = [
+            Autorisatie(
+                component=ComponentTypes.zrc,
+                scopes=[str(SCOPE_ZAKEN_ALLES_LEZEN)],
+                zaaktype=get_zaaktype_url(zaaktype),
+                max_vertrouwelijkheidaanduiding=va,
+            )
+            for zaaktype, va in (
+                (zaaktype1, VertrouwelijkheidsAanduiding.intern),
+                (zaaktype2, VertrouwelijkheidsAanduiding.geheim),
+                (zaaktype3, ""),
+            )
+        ]
+
+        results = {}
+        for engine in ("case", "indexed"):
+            with self.subTest(engine=engine):
+                with override_settings(AUTORISATIES_FILTER_ENGINE=engine):
+                    queryset = Zaak.objects.filter_for_authorizations(
+                        SCOPE_ZAKEN_ALLES_LEZEN, authorizations
+                    )
+                    results[engine] = set(queryset)
+
+                self.assertEqual(len(results[engine]), 3 + 7)
+                self.assertEqual(
+                    {zaak.zaaktype for zaak in results[engine]}, {zaaktype1, zaaktype2}
+                )
+
+        self.assertEqual(results["case"], results["indexed"])
+
+
+class ManyZaaktypenListTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        catalogus = CatalogusFactory.create()
+        cls.zaaktypen = ZaakTypeFactory.create_batch(NUM_ZAAKTYPEN, catalogus=catalogus)
+        cls.zaaktype = cls.zaaktypen[0]
+        super().setUpTestData()
+
+        Autorisatie.objects.bulk_create(
+            [
+                Autorisatie(
+                    applicatie=cls.applicatie,
+                    component=ComponentTypes.zrc,
+                    scopes=[str(scope)],
+                    zaaktype=get_zaaktype_url(zaaktype),
+                    max_vertrouwelijkheidaanduiding=cls.max_vertrouwelijkheidaanduiding,
+                )
+                for zaaktype in cls.zaaktypen[1:]
+                # the scope must be checked for every authorization
+                for scope in (SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_BIJWERKEN)
+            ]
+        )
+
+    def test_filter_num_queries(self):
+        authorizations = list(Autorisatie.objects.filter(applicatie=self.applicatie))
+        self.assertEqual(len(authorizations), 2 * NUM_ZAAKTYPEN - 1)
+
+        # one query to resolve the zaaktypen
+        with self.assertNumQueries(1):
+            queryset = Zaak.objects.filter_for_authorizations(
+                SCOPE_ZAKEN_ALLES_LEZEN, authorizations
+            )
+
+        # the integer PKs are used in the SQL, not the objects
+        self.assertNotIn("http://", str(queryset.query))
+
+    def test_list_only_authorized_zaken(self):
+        zaak1 = ZaakFactory.create(
+            zaaktype=self.zaaktypen[0],
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        zaak2 = ZaakFactory.create(
+            zaaktype=self.zaaktypen[-1],
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        # not authorized - vertrouwelijkheidaanduiding and zaaktype
+        ZaakFactory.create(
+            zaaktype=self.zaaktypen[-1],
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        urls = {result["url"] for result in response.data["results"]}
+        self.assertEqual(
+            urls,
+            {f"http://testserver{reverse(zaak)}" for zaak in (zaak1, zaak2)},
+        )
@@ -0,0 +1,141 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import RolOmschrijving, RolTypes, ZaakobjectTypes
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import (
+    EigenschapFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.notifications.models import OutboxNotification
+
+from ..models import Rol, Status, Zaak, ZaakEigenschap, ZaakObject
+
+
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=True)
+class ImportZakenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.filter(pk=settings.SITE_ID).update(domain="testserver")
+        Site.objects.clear_cache()
+
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        cls.statustype = StatusTypeFactory.create(
+            zaaktype=cls.zaaktype, statustypevolgnummer=1
+        )
+        StatusTypeFactory.create(zaaktype=cls.zaaktype, statustypevolgnummer=2)
+        cls.roltype = RolTypeFactory.create(
+            zaaktype=cls.zaaktype,
+            omschrijving=RolOmschrijving.initiator,
+            omschrijving_generiek=RolOmschrijving.initiator,
+        )
+        cls.eigenschap = EigenschapFactory.create(zaaktype=cls.zaaktype)
+
+    def _get_zaak(self, **kwargs) -> dict:
+        return {
+            "zaaktype": f"http://testserver{reverse(self.zaaktype)}",
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2019-06-11",
+            "startdatum": "2019-06-11",
+            "statussen": [
+                {
+                    "statustype": f"http://testserver{reverse(self.statustype)}",
+                    "datumStatusGezet": "2019-06-11T10:00:00Z",
+                }
+            ],
+            "rollen": [
+                {
+                    "betrokkene": "https://personen.nl/api/v1/personen/1",
+                    "betrokkeneType": RolTypes.natuurlijk_persoon,
+                    "roltype": f"http://testserver{reverse(self.roltype)}",
+                    "roltoelichting": "Melder",
+                }
+            ],
+            "zaakobjecten": [
+                {
+                    "object": "https://objecten.nl/api/v1/adressen/1",
+                    "objectType": ZaakobjectTypes.adres,
+                }
+            ],
+            "eigenschappen": [
+                {
+                    "eigenschap": f"http://testserver{reverse(self.eigenschap)}",
+                    "waarde": "123",
+                }
+            ],
+            **kwargs,
+        }
+
+    def _import(self, *zaken, **options):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl") as file:
+            for zaak in zaken:
+                file.write(f"{json.dumps(zaak)}\n")
+            file.flush()
+
+            stderr = StringIO()
+            call_command(
+                "import_zaken", file.name, stdout=StringIO(), stderr=stderr, **options
+            )
+        return [json.loads(line) for line in stderr.getvalue().splitlines()]
+
+    def test_import(self):
+        errors = self._import(self._get_zaak(), self._get_zaak(), batch_size=1)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(Zaak.objects.count(), 2)
+        zaak1, zaak2 = Zaak.objects.order_by("pk")
+        self.assertNotEqual(zaak1.identificatie, zaak2.identificatie)
+        self.assertEqual(zaak1.current_status, Status.objects.get(zaak=zaak1))
+        self.assertEqual(
+            Rol.objects.get(zaak=zaak1).omschrijving_generiek,
+            RolOmschrijving.initiator,
+        )
+        self.assertEqual(ZaakObject.objects.filter(zaak=zaak1).count(), 1)
+        self.assertEqual(
+            ZaakEigenschap.objects.get(zaak=zaak1)._naam,
+            self.eigenschap.eigenschapnaam,
+        )
+
+        # a zaak, status, rol, zaakobject and zaakeigenschap per zaak
+        self.assertEqual(AuditTrail.objects.count(), 10)
+        self.assertEqual(OutboxNotification.objects.count(), 10)
+        zaak_url = f"http://testserver{reverse(zaak1)}"
+        self.assertEqual(AuditTrail.objects.filter(hoofd_object=zaak_url).count(), 5)
+        notification = OutboxNotification.objects.get(
+            bericht__resource="zaak", hoofd_object=zaak_url
+        )
+        self.assertEqual(notification.bericht["actie"], "create")
+        self.assertEqual(
+            notification.bericht["kenmerken"]["zaaktype"],
+            f"http://testserver{reverse(self.zaaktype)}",
+        )
+
+    def test_errors_per_zaak(self):
+        invalid_rol = self._get_zaak()
+        invalid_rol["rollen"].append(invalid_rol["rollen"][0])
+
+        errors = self._import(
+            self._get_zaak(identificatie="ZAAK-1"),
+            self._get_zaak(zaaktype="http://testserver/foo"),
+            invalid_rol,
+            # unique within the batch, not in the database
+            self._get_zaak(identificatie="ZAAK-1"),
+            notify=False,
+        )
+
+        self.assertEqual([error["line"] for error in errors], [2, 3, 4])
+        self.assertIn("zaaktype", errors[0]["errors"])
+        self.assertIn("non_field_errors", errors[1]["errors"])
+        self.assertEqual(Zaak.objects.get().identificatie, "ZAAK-1")
+        self.assertFalse(OutboxNotification.objects.exists())
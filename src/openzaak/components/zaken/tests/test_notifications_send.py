@@ -22,7 +22,7 @@ VERANTWOORDELIJKE_ORGANISATIE = "517439943"
 
 
 @freeze_time("2012-01-14")
-@override_settings(NOTIFICATIONS_DISABLED=False)
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=False)
 class SendNotifTestCase(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
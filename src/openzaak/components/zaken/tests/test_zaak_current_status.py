@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.models.tests.factories import (
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
+from openzaak.components.zaken.api.tests.utils import get_operation_url
+from openzaak.components.zaken.models import Zaak
+from openzaak.components.zaken.models.tests.factories import StatusFactory, ZaakFactory
+from openzaak.utils.tests import JWTAuthMixin
+
+from .utils import ZAAK_READ_KWARGS
+
+
+class ZaakCurrentStatusTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.zaaktype = ZaakTypeFactory.create()
+        cls.statustype = StatusTypeFactory.create(zaaktype=cls.zaaktype)
+        # the eindstatus
+        StatusTypeFactory.create(zaaktype=cls.zaaktype)
+
+    def create_status(self, zaak, datum_status_gezet: datetime) -> str:
+        response = self.client.post(
+            get_operation_url("status_create"),
+            {
+                "zaak": reverse(zaak),
+                "statustype": reverse(self.statustype),
+                "datumStatusGezet": datum_status_gezet.isoformat(),
+            },
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return response.data["url"]
+
+    def test_create_status_sets_current_status(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        now = timezone.now()
+
+        status_url = self.create_status(zaak, now - timedelta(days=1))
+
+        zaak.refresh_from_db()
+        self.assertEqual(f"http://testserver{reverse(zaak.current_status)}", status_url)
+
+        # a status set in the past doesn't become the current status
+        self.create_status(zaak, now - timedelta(days=2))
+
+        zaak.refresh_from_db()
+        self.assertEqual(f"http://testserver{reverse(zaak.current_status)}", status_url)
+
+    def test_delete_status_updates_current_status(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        now = timezone.now()
+        status1 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=now - timedelta(days=1)
+        )
+        status2 = StatusFactory.create(zaak=zaak, datum_status_gezet=now)
+        zaak.update_current_status()
+        self.assertEqual(zaak.current_status, status2)
+
+        status2.delete()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status1)
+
+        status1.delete()
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.current_status)
+
+    def test_save_status_updates_current_status(self):
+        # statuses written outside of the API, e.g. in the admin
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        now = timezone.now()
+        status1 = StatusFactory.create(zaak=zaak, datum_status_gezet=now)
+        status2 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=now - timedelta(days=1)
+        )
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status1)
+
+        status2.datum_status_gezet = now + timedelta(days=1)
+        status2.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.current_status, status2)
+
+    def test_move_status_updates_both_zaken(self):
+        zaak1 = ZaakFactory.create(zaaktype=self.zaaktype)
+        zaak2 = ZaakFactory.create(zaaktype=self.zaaktype)
+        status = StatusFactory.create(zaak=zaak1)
+
+        status.zaak = zaak2
+        status.save()
+
+        zaak1.refresh_from_db()
+        zaak2.refresh_from_db()
+        self.assertIsNone(zaak1.current_status)
+        self.assertEqual(zaak2.current_status, status)
+
+    def test_render_without_status_queries(self):
+        zaak = ZaakFactory.create(zaaktype=self.zaaktype)
+        status_url = self.create_status(zaak, timezone.now())
+        zaak = Zaak.objects.select_related("current_status").get(pk=zaak.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(zaak.current_status_uuid, zaak.current_status.uuid)
+
+        response = self.client.get(reverse(zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.data["status"], status_url)
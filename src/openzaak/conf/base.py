@@ -75,6 +75,9 @@ INSTALLED_APPS = [
     "openzaak",
     "openzaak.accounts",
     "openzaak.utils",
+    "openzaak.notifications",
+    "openzaak.audittrails",
+    "openzaak.referentielijsten",
     "openzaak.components.authorizations",
     "openzaak.components.zaken",
     "openzaak.components.besluiten",
@@ -361,7 +364,44 @@ if SENTRY_DSN:
 #
 IS_HTTPS = os.getenv("IS_HTTPS", "1").lower() in ["true", "1", "yes"]
 
+# authorizations settings
+# cache the applicaties/autorisaties of a client across requests, the cache is
+# invalidated on writes - the timeout is a safety net. Disabled by default: it
+# requires a cache which is shared by the processes (not locmem or dummy), as
+# do the counters of the autorisaties_cache_stats command.
+AUTORISATIES_CACHE = "default"
+AUTORISATIES_CACHE_TIMEOUT = int(os.getenv("AUTORISATIES_CACHE_TIMEOUT", 0))
+# how list endpoints check the vertrouwelijkheidaanduiding of objects against
+# the authorizations: "indexed" uses the stored va_order columns, "case" maps
+# the vertrouwelijkheidaanduiding with a CASE expression per row
+AUTORISATIES_FILTER_ENGINE = os.getenv("AUTORISATIES_FILTER_ENGINE", "indexed")
+
+# cache the resources of the Referentielijsten API and the API specs used to
+# validate them, see openzaak.referentielijsten.cache. Entries older than the
+# TTL (in seconds) are fetched again, but still used if that fails. Set to 0 to
+# disable the cache.
+REFERENTIELIJSTEN_CACHE_TTL = int(
+    os.getenv("REFERENTIELIJSTEN_CACHE_TTL", 7 * 24 * 60 * 60)
+)
+# number of entries kept in memory per process
+REFERENTIELIJSTEN_CACHE_SIZE = int(os.getenv("REFERENTIELIJSTEN_CACHE_SIZE", 1000))
+# timeout (in seconds) of the requests to the Referentielijsten API
+REFERENTIELIJSTEN_TIMEOUT = int(os.getenv("REFERENTIELIJSTEN_TIMEOUT", 10))
+# number of connections kept open, and of concurrent requests when prefetching
+REFERENTIELIJSTEN_POOL_SIZE = int(os.getenv("REFERENTIELIJSTEN_POOL_SIZE", 10))
+
 # catalogi settings
+# keep the published zaaktypen in memory in each process, a new snapshot is
+# loaded when catalogi objects are published or changed in the admin - the
+# timeout is a safety net. Disabled by default: the processes share the
+# generation of the snapshot through the cache, which must not be locmem or
+# dummy.
+CATALOGI_SNAPSHOT_CACHE = "default"
+CATALOGI_SNAPSHOT_TIMEOUT = int(os.getenv("CATALOGI_SNAPSHOT_TIMEOUT", 0))
+# how long (in seconds) clients may use published catalogi resources without
+# revalidating them - shared caches always revalidate, so the authorization is
+# checked on every request
+CATALOGI_CACHE_MAX_AGE = int(os.getenv("CATALOGI_CACHE_MAX_AGE", 0))
 options.DEFAULT_NAMES = options.DEFAULT_NAMES + (
     "mnemonic",
     "filter_fields",
@@ -380,6 +420,54 @@ SENDFILE_URL = PRIVATE_MEDIA_URL
 # settings for uploading large files
 MIN_UPLOAD_SIZE = int(os.getenv("MIN_UPLOAD_SIZE", 4 * 2 ** 30))
 
+# algorithm of the checksum computed for the content of documents, one of
+# ChecksumAlgoritmes
+INHOUD_CHECKSUM_ALGORITME = os.getenv("INHOUD_CHECKSUM_ALGORITME", "sha_256")
+
+# store identical content of documents only once, see gc_inhoud_blobs
+INHOUD_DEDUPLICATION = os.getenv("INHOUD_DEDUPLICATION", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+
+# settings for uploading the content of documents in parts
+UPLOAD_DEEL_OMVANG = int(os.getenv("UPLOAD_DEEL_OMVANG", 100 * 2 ** 20))
+# number of seconds after which unfinished uploads are discarded
+UPLOAD_SESSIE_EXPIRY = int(os.getenv("UPLOAD_SESSIE_EXPIRY", 24 * 60 * 60))
+# number of seconds after which an unfinished assembly of the parts is
+# considered abandoned, and is started again when a part is uploaded
+UPLOAD_SAMENVOEGEN_TIMEOUT = int(os.getenv("UPLOAD_SAMENVOEGEN_TIMEOUT", 60 * 60))
+
+# store the changes in the audit trail as compact diffs, with full snapshots
+# every AUDITTRAIL_SNAPSHOT_INTERVAL audit trails of a resource
+AUDITTRAIL_COMPACT = os.getenv("AUDITTRAIL_COMPACT", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+AUDITTRAIL_SNAPSHOT_INTERVAL = int(os.getenv("AUDITTRAIL_SNAPSHOT_INTERVAL", 10))
+
+# store notifications in the outbox instead of sending them within the request.
+# The outbox is delivered by a separate process, which must be running when
+# this is enabled: `src/manage.py deliver_notifications --interval 5`
+NOTIFICATIONS_OUTBOX = os.getenv("NOTIFICATIONS_OUTBOX", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+# number of seconds before the first retry of a failed delivery, doubled for
+# every next attempt up to NOTIFICATIONS_OUTBOX_MAX_BACKOFF
+NOTIFICATIONS_OUTBOX_BACKOFF = int(os.getenv("NOTIFICATIONS_OUTBOX_BACKOFF", 10))
+NOTIFICATIONS_OUTBOX_MAX_BACKOFF = int(
+    os.getenv("NOTIFICATIONS_OUTBOX_MAX_BACKOFF", 60 * 60)
+)
+# number of seconds a worker has to deliver the notifications it claimed,
+# after which other workers deliver them
+NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT = int(
+    os.getenv("NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT", 5 * 60)
+)
+
 # urls for OAS3 specifications
 SPEC_URL = {
     "zaken": os.path.join(BASE_DIR, "src/openzaak/components/zaken/openapi.yaml"),
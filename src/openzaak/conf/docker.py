@@ -83,8 +83,11 @@ SESSION_COOKIE_SECURE = getenv("SESSION_COOKIE_SECURE", False)
 SESSION_COOKIE_HTTPONLY = getenv("SESSION_COOKIE_HTTPONLY", False)
 CSRF_COOKIE_SECURE = getenv("CSRF_COOKIE_SECURE", False)
 
-# requires an nginx container running in front
+# requires an nginx container running in front, with an internal location for
+# SENDFILE_URL serving the private media (X-Accel-Redirect). Use
+# sendfile.backends.xsendfile for Apache with mod_xsendfile.
 SENDFILE_BACKEND = getenv("SENDFILE_BACKEND", "sendfile.backends.nginx")
+SENDFILE_URL = getenv("SENDFILE_URL", PRIVATE_MEDIA_URL)
 #
 # Custom settings
 #
@@ -85,6 +85,15 @@ SECURE_BROWSER_XSS_FILTER = True  # Sets X-XSS-Protection: 1; mode=block
 # Library settings
 #
 
+# Sendfile - the private media is sent by Nginx with X-Accel-Redirect, which
+# requires an internal location for SENDFILE_URL serving SENDFILE_ROOT:
+#
+#   location /private-media/ {
+#       internal;
+#       alias /path/to/private-media/;
+#   }
+SENDFILE_BACKEND = "sendfile.backends.nginx"
+
 # Raven
 INSTALLED_APPS = INSTALLED_APPS + ["raven.contrib.django.raven_compat"]
 RAVEN_CONFIG = {"dsn": "https://", "release": raven.fetch_git_sha(BASE_DIR)}
@@ -41,3 +41,8 @@ AXES_CACHE = "axes_cache"
 # Open Zaak specific settings
 #
 NOTIFICATIONS_DISABLED = True
+
+# the locmem and in-process caches outlive the test transactions
+AUTORISATIES_CACHE_TIMEOUT = 0
+REFERENTIELIJSTEN_CACHE_TTL = 0
+CATALOGI_SNAPSHOT_TIMEOUT = 0
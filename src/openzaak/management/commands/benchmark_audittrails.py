@@ -0,0 +1,117 @@
+import statistics
+import time
+import uuid
+from contextlib import ExitStack
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test import override_settings
+
+from vng_api_common.audittrails.models import AuditTrail
+
+from openzaak.audittrails.buffer import AuditTrailBuffer, store_audittrail
+from openzaak.audittrails.compact import expand_audittrails
+
+MODES = {
+    "full": {"AUDITTRAIL_COMPACT": False},
+    "compact": {"AUDITTRAIL_COMPACT": True},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the write latency and storage size of audit trails, stored "
+        "in full or compact, inserted directly or buffered. Nothing is kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1000,
+            help="Number of updates of one resource to record per mode",
+        )
+
+    def handle(self, count, **options):
+        template = self.get_template()
+
+        for mode, mode_settings in MODES.items():
+            for buffered in (False, True):
+                with override_settings(**mode_settings):
+                    durations, size = self.run(template, count, buffered)
+
+                label = f"{mode}, {'buffered' if buffered else 'direct'}"
+                self.stdout.write(
+                    f"=== {label}: {count} audit trails, "
+                    f"{statistics.mean(durations) * 1000:.3f}ms mean, "
+                    f"{self.percentile(durations, 95) * 1000:.3f}ms p95 per write, "
+                    f"{size / count:.0f} bytes of oud/nieuw per audit trail"
+                )
+
+    def get_template(self) -> dict:
+        """
+        Use the latest recorded resource, or a zaak-like resource.
+        """
+        trail = AuditTrail.objects.exclude(nieuw=None).order_by("-pk").first()
+        if trail is not None:
+            return expand_audittrails([trail])[0].nieuw
+
+        data = {f"veld_{i}": f"waarde {i}" * 4 for i in range(40)}
+        data["toelichting"] = ""
+        return data
+
+    @transaction.atomic
+    def run(self, template: dict, count: int, buffered: bool):
+        resource_url = f"https://benchmark.local/{uuid.uuid4()}"
+        durations = []
+
+        with ExitStack() as stack:
+            if buffered:
+                stack.enter_context(AuditTrailBuffer())
+
+            oud = None
+            for i in range(count):
+                nieuw = {
+                    **template,
+                    "url": resource_url,
+                    "toelichting": f"wijziging {i}",
+                }
+                trail = AuditTrail(
+                    bron="ZRC",
+                    actie="partial_update" if oud else "create",
+                    resultaat=200,
+                    hoofd_object=resource_url,
+                    resource="benchmark",
+                    resource_url=resource_url,
+                    resource_weergave="benchmark",
+                    oud=oud,
+                    nieuw=nieuw,
+                )
+                start = time.perf_counter()
+                store_audittrail(trail)
+                durations.append(time.perf_counter() - start)
+                oud = nieuw
+
+            # the buffered inserts happen when the buffer is left, which is
+            # part of the cost of the writes
+            start = time.perf_counter()
+        flush_duration = time.perf_counter() - start
+        if buffered:
+            durations = [duration + flush_duration / count for duration in durations]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT SUM(COALESCE(pg_column_size(oud), 0) "
+                "+ COALESCE(pg_column_size(nieuw), 0)) "
+                f"FROM {AuditTrail._meta.db_table} WHERE resource_url = %s",
+                [resource_url],
+            )
+            (size,) = cursor.fetchone()
+
+        transaction.set_rollback(True)
+        return durations, size
+
+    @staticmethod
+    def percentile(values, percentile: int) -> float:
+        values = sorted(values)
+        return values[min(len(values) - 1, len(values) * percentile // 100)]
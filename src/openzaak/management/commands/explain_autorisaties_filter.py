@@ -0,0 +1,108 @@
+import random
+import time
+import uuid
+from copy import copy
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+from django.utils.module_loading import import_string
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from openzaak.components.authorizations.middleware import COMPONENT_MAPPING
+from openzaak.components.catalogi.models import ZaakType
+from openzaak.components.zaken.models import Zaak
+from openzaak.utils.data_filtering import get_va_order
+
+VIEWSETS = {
+    "zaken": "openzaak.components.zaken.api.viewsets.ZaakViewSet",
+    "documenten": (
+        "openzaak.components.documenten.api.viewsets."
+        "EnkelvoudigInformatieObjectViewSet"
+    ),
+    "besluiten": "openzaak.components.besluiten.api.viewsets.BesluitViewSet",
+}
+
+ENGINES = ("case", "indexed")
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN ANALYZE on the list query of a component, filtered on the "
+        "authorizations of a client, for every AUTORISATIES_FILTER_ENGINE"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("component", choices=list(VIEWSETS))
+        parser.add_argument(
+            "--client-id",
+            required=True,
+            help="Client ID of the applicatie to filter for",
+        )
+        parser.add_argument(
+            "--generate",
+            type=int,
+            default=0,
+            help=(
+                "Generate this many zaken first, as copies of the existing zaken "
+                "with a random zaaktype and vertrouwelijkheidaanduiding"
+            ),
+        )
+
+    def handle(self, component, client_id, generate, **options):
+        if generate:
+            if component != "zaken":
+                raise CommandError("Generating data is only supported for zaken")
+            self.generate_zaken(generate)
+
+        viewset = import_string(VIEWSETS[component])
+        scope = viewset.required_scopes["list"]
+        authorizations = list(
+            Autorisatie.objects.filter(
+                applicatie__client_ids__contains=[client_id],
+                component=COMPONENT_MAPPING[component],
+            )
+        )
+        if not authorizations:
+            raise CommandError(f"No {component} authorizations for {client_id!r}")
+
+        for engine in ENGINES:
+            with override_settings(AUTORISATIES_FILTER_ENGINE=engine):
+                queryset = viewset.queryset.filter_for_authorizations(
+                    scope, authorizations
+                )
+                start = time.monotonic()
+                count = queryset.count()
+                duration = time.monotonic() - start
+                plan = queryset.explain(analyze=True)
+
+            self.stdout.write(f"=== {engine}: {count} results in {duration:.3f}s")
+            self.stdout.write(plan)
+            self.stdout.write("")
+
+    @transaction.atomic
+    def generate_zaken(self, number: int, batch_size: int = 1000) -> None:
+        templates = list(Zaak.objects.all()[:100])
+        zaaktypen = list(ZaakType.objects.values_list("pk", flat=True))
+        if not templates:
+            raise CommandError("At least one zaak is needed to generate zaken")
+
+        for offset in range(0, number, batch_size):
+            zaken = []
+            for _ in range(min(batch_size, number - offset)):
+                zaak = copy(random.choice(templates))
+                zaak.pk = None
+                zaak.uuid = uuid.uuid4()
+                zaak.identificatie = f"BENCHMARK-{zaak.uuid.hex}"[:40]
+                zaak.zaaktype_id = random.choice(zaaktypen)
+                zaak.vertrouwelijkheidaanduiding = random.choice(
+                    list(VertrouwelijkheidsAanduiding.values)
+                )
+                # bulk_create doesn't call save()
+                zaak.va_order = get_va_order(zaak.vertrouwelijkheidaanduiding)
+                zaken.append(zaak)
+            Zaak.objects.bulk_create(zaken)
+
+        self.stdout.write(f"Generated {number} zaken")
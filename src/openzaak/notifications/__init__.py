@@ -0,0 +1 @@
+default_app_config = "openzaak.notifications.apps.NotificationsConfig"
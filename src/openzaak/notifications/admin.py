@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import OutboxNotification
+
+
+@admin.register(OutboxNotification)
+class OutboxNotificationAdmin(admin.ModelAdmin):
+    list_display = (
+        "kanaal",
+        "hoofd_object",
+        "aangemaakt",
+        "pogingen",
+        "volgende_poging",
+    )
+    list_filter = ("kanaal",)
+    search_fields = ("hoofd_object",)
+    readonly_fields = ("aangemaakt",)
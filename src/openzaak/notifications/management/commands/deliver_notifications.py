@@ -0,0 +1,105 @@
+import logging
+import time
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from requests.exceptions import RequestException
+from vng_api_common.notifications.models import NotificationsConfig
+from zds_client import ClientError
+
+from ...models import OutboxNotification
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Deliver the notifications in the outbox to the Notificaties API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of notifications to claim and deliver at once",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0,
+            help=(
+                "Keep running, checking the outbox every this many seconds. "
+                "By default, the command stops when nothing is left to deliver"
+            ),
+        )
+
+    def handle(self, batch_size, interval, **options):
+        while True:
+            delivered = failed = 0
+            while True:
+                batch_delivered, batch_failed = self.deliver_batch(batch_size)
+                delivered += batch_delivered
+                failed += batch_failed
+                if not batch_delivered + batch_failed:
+                    break
+
+            if delivered or failed:
+                self.stdout.write(f"Delivered {delivered}, failed {failed}")
+
+            if not interval:
+                break
+            time.sleep(interval)
+
+    def claim_batch(self, batch_size: int) -> List[OutboxNotification]:
+        """
+        Claim the next deliverable notifications, in a short transaction.
+
+        The claimed notifications are deferred for
+        ``settings.NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT`` seconds, so other
+        workers skip them while they're delivered, without holding row locks
+        during the requests to the Notificaties API. If the worker dies, they
+        are delivered again once the claim expires.
+        """
+        with transaction.atomic():
+            # several workers can run side by side, each delivering other main
+            # objects
+            notifications = list(
+                OutboxNotification.objects.deliverable()
+                .select_for_update(skip_locked=True)
+                .order_by("pk")[:batch_size]
+            )
+            claimed_until = timezone.now() + timedelta(
+                seconds=settings.NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT
+            )
+            OutboxNotification.objects.filter(
+                pk__in=[notification.pk for notification in notifications]
+            ).update(volgende_poging=claimed_until)
+        return notifications
+
+    def deliver_batch(self, batch_size: int):
+        delivered = failed = 0
+        client = None
+        for notification in self.claim_batch(batch_size):
+            if client is None:
+                client = NotificationsConfig.get_client()
+
+            try:
+                client.create("notificaties", notification.bericht)
+            except (ClientError, RequestException) as exc:
+                logger.warning(
+                    "Could not deliver notification %s to %s",
+                    notification.pk,
+                    client.base_url,
+                    exc_info=True,
+                )
+                notification.mark_failed(str(exc))
+                failed += 1
+            else:
+                notification.delete()
+                delivered += 1
+
+        return delivered, failed
@@ -0,0 +1,69 @@
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="kanaal")),
+                (
+                    "hoofd_object",
+                    models.URLField(max_length=1000, verbose_name="hoofd object"),
+                ),
+                (
+                    "bericht",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        help_text="Het te versturen bericht.", verbose_name="bericht"
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+                (
+                    "pogingen",
+                    models.PositiveIntegerField(default=0, verbose_name="pogingen"),
+                ),
+                (
+                    "volgende_poging",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="volgende poging",
+                    ),
+                ),
+                (
+                    "laatste_fout",
+                    models.TextField(blank=True, verbose_name="laatste fout"),
+                ),
+            ],
+            options={
+                "verbose_name": "uitgaande notificatie",
+                "verbose_name_plural": "uitgaande notificaties",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="outboxnotification",
+            index=models.Index(
+                fields=["kanaal", "hoofd_object", "id"],
+                name="outbox_hoofd_object_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+
+class OutboxNotificationQuerySet(models.QuerySet):
+    def deliverable(self):
+        """
+        Select the notifications that are due and not preceded by another
+        notification about the same main object.
+
+        Notifications are delivered in the order they were created, per kanaal
+        and main object, so a notification that can't be delivered holds back
+        the later ones.
+        """
+        preceding = OutboxNotification.objects.filter(
+            kanaal=models.OuterRef("kanaal"),
+            hoofd_object=models.OuterRef("hoofd_object"),
+            pk__lt=models.OuterRef("pk"),
+        )
+        return (
+            self.annotate(is_preceded=models.Exists(preceding))
+            .filter(is_preceded=False, volgende_poging__lte=timezone.now())
+            .order_by("pk")
+        )
+
+
+class OutboxNotification(models.Model):
+    """
+    A notification waiting to be delivered to the Notificaties API.
+
+    Notifications are stored in the same transaction as the change they are
+    about, and delivered by the ``deliver_notifications`` command.
+    """
+
+    kanaal = models.CharField(_("kanaal"), max_length=50)
+    hoofd_object = models.URLField(_("hoofd object"), max_length=1000)
+    bericht = JSONField(_("bericht"), help_text=_("Het te versturen bericht."))
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+    pogingen = models.PositiveIntegerField(_("pogingen"), default=0)
+    volgende_poging = models.DateTimeField(
+        _("volgende poging"), default=timezone.now, db_index=True
+    )
+    laatste_fout = models.TextField(_("laatste fout"), blank=True)
+
+    objects = OutboxNotificationQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("uitgaande notificatie")
+        verbose_name_plural = _("uitgaande notificaties")
+        indexes = [
+            models.Index(
+                fields=["kanaal", "hoofd_object", "id"],
+                name="outbox_hoofd_object_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kanaal}: {self.hoofd_object}"
+
+    def get_backoff(self) -> timedelta:
+        seconds = settings.NOTIFICATIONS_OUTBOX_BACKOFF * 2 ** (self.pogingen - 1)
+        return timedelta(
+            seconds=min(seconds, settings.NOTIFICATIONS_OUTBOX_MAX_BACKOFF)
+        )
+
+    def mark_failed(self, error: str) -> None:
+        self.pogingen += 1
+        self.volgende_poging = timezone.now() + self.get_backoff()
+        self.laatste_fout = error
+        self.save(update_fields=["pogingen", "volgende_poging", "laatste_fout"])
@@ -0,0 +1,185 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+from zds_client import ClientError
+
+from openzaak.components.catalogi.models.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.api.tests.utils import get_operation_url
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS
+from openzaak.utils.tests import JWTAuthMixin
+
+from ..models import OutboxNotification
+
+
+class StubNRC:
+    """
+    Stand-in for the Notificaties API client, recording the notifications.
+    """
+
+    base_url = "https://nrc.example.com/api/v1/"
+
+    def __init__(self, failing=()):
+        self.failing = failing
+        self.received = []
+
+    def create(self, resource, data):
+        assert resource == "notificaties"
+        if data["hoofdObject"] in self.failing:
+            raise ClientError({"detail": "Kanaal bestaat niet"})
+        self.received.append(data)
+        return data
+
+
+def create_notification(hoofd_object: str, **kwargs) -> OutboxNotification:
+    return OutboxNotification.objects.create(
+        kanaal="zaken",
+        hoofd_object=hoofd_object,
+        bericht={"kanaal": "zaken", "hoofdObject": hoofd_object, **kwargs},
+    )
+
+
+@freeze_time("2012-01-14")
+@override_settings(NOTIFICATIONS_DISABLED=False, NOTIFICATIONS_OUTBOX=True)
+class OutboxTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @patch("zds_client.Client.from_url")
+    def test_notification_stored_in_outbox(self, mock_client):
+        zaaktype = ZaakTypeFactory.create()
+        data = {
+            "zaaktype": f"http://testserver{reverse(zaaktype)}",
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            "bronorganisatie": "517439943",
+            "verantwoordelijkeOrganisatie": "517439943",
+            "registratiedatum": "2012-01-13",
+            "startdatum": "2012-01-13",
+        }
+
+        response = self.client.post(
+            get_operation_url("zaak_create"), data, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_client.return_value.create.assert_not_called()
+
+        notification = OutboxNotification.objects.get()
+        zaak_url = response.json()["url"]
+        self.assertEqual(notification.kanaal, "zaken")
+        self.assertEqual(notification.hoofd_object, zaak_url)
+        self.assertEqual(notification.bericht["resourceUrl"], zaak_url)
+        self.assertEqual(notification.bericht["actie"], "create")
+        self.assertEqual(notification.bericht["aanmaakdatum"], "2012-01-14T00:00:00Z")
+
+    def test_no_notification_on_error(self):
+        response = self.client.post(
+            get_operation_url("zaak_create"), {}, **ZAAK_WRITE_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+
+class DeliverNotificationsTests(TestCase):
+    def deliver(self, nrc: StubNRC) -> str:
+        out = StringIO()
+        with patch("zds_client.Client.from_url", return_value=nrc):
+            call_command("deliver_notifications", batch_size=2, stdout=out)
+        return out.getvalue()
+
+    def test_deliver_in_order(self):
+        create_notification("https://zaak/1", actie="create")
+        create_notification("https://zaak/2", actie="create")
+        create_notification("https://zaak/1", actie="update")
+        nrc = StubNRC()
+
+        output = self.deliver(nrc)
+
+        self.assertIn("Delivered 3, failed 0", output)
+        self.assertEqual(
+            [(data["hoofdObject"], data["actie"]) for data in nrc.received],
+            [
+                ("https://zaak/1", "create"),
+                ("https://zaak/2", "create"),
+                ("https://zaak/1", "update"),
+            ],
+        )
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    @freeze_time("2012-01-14 12:00")
+    def test_failed_delivery_holds_back_main_object(self):
+        failing = create_notification("https://zaak/1", actie="create")
+        create_notification("https://zaak/1", actie="update")
+        create_notification("https://zaak/2", actie="create")
+        nrc = StubNRC(failing=["https://zaak/1"])
+
+        output = self.deliver(nrc)
+
+        self.assertIn("Delivered 1, failed 1", output)
+        self.assertEqual(
+            [data["hoofdObject"] for data in nrc.received], ["https://zaak/2"]
+        )
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.pogingen, 1)
+        self.assertEqual(
+            failing.volgende_poging,
+            timezone.make_aware(timezone.datetime(2012, 1, 14, 12, 0, 10)),
+        )
+        self.assertIn("Kanaal bestaat niet", failing.laatste_fout)
+        self.assertEqual(OutboxNotification.objects.count(), 2)
+
+    @freeze_time("2012-01-14 12:00")
+    @override_settings(NOTIFICATIONS_OUTBOX_CLAIM_TIMEOUT=60)
+    def test_claimed_during_delivery(self):
+        notification = create_notification("https://zaak/1")
+        claimed = []
+
+        class ClaimCheckingNRC(StubNRC):
+            def create(self, resource, data):
+                # other workers skip the notification, without a row lock
+                claimed.append(OutboxNotification.objects.deliverable().exists())
+                notification.refresh_from_db()
+                raise ClientError({"detail": "Timeout"})
+
+        self.deliver(ClaimCheckingNRC())
+
+        self.assertEqual(claimed, [False])
+        self.assertEqual(
+            notification.volgende_poging,
+            timezone.make_aware(timezone.datetime(2012, 1, 14, 12, 1)),
+        )
+
+    def test_retry_after_backoff(self):
+        failing = create_notification("https://zaak/1")
+        OutboxNotification.objects.filter(pk=failing.pk).update(
+            pogingen=1, volgende_poging=timezone.now() + timedelta(seconds=10)
+        )
+        nrc = StubNRC()
+
+        self.deliver(nrc)
+        self.assertEqual(nrc.received, [])
+
+        with freeze_time(timezone.now() + timedelta(seconds=11)):
+            self.deliver(nrc)
+        self.assertEqual(len(nrc.received), 1)
+        self.assertFalse(OutboxNotification.objects.exists())
+
+    @override_settings(
+        NOTIFICATIONS_OUTBOX_BACKOFF=10, NOTIFICATIONS_OUTBOX_MAX_BACKOFF=60
+    )
+    def test_backoff(self):
+        notification = OutboxNotification(pogingen=1)
+        for pogingen, seconds in ((1, 10), (2, 20), (3, 40), (4, 60), (10, 60)):
+            with self.subTest(pogingen=pogingen):
+                notification.pogingen = pogingen
+                self.assertEqual(notification.get_backoff(), timedelta(seconds=seconds))
@@ -0,0 +1,78 @@
+"""
+Notification mixins writing to the outbox.
+
+Drop-in replacements for the mixins of
+:mod:`vng_api_common.notifications.viewsets`. With
+``settings.NOTIFICATIONS_OUTBOX`` enabled, notifications are stored in the
+same transaction as the change they are about, instead of being sent to the
+Notificaties API within the request. The ``deliver_notifications`` command
+sends them.
+"""
+from contextlib import nullcontext
+from typing import Dict, List, Union
+
+from django.conf import settings
+from django.db import models, transaction
+
+from vng_api_common.notifications.viewsets import (
+    NotificationCreateMixin as _NotificationCreateMixin,
+    NotificationDestroyMixin as _NotificationDestroyMixin,
+    NotificationMixin,
+    NotificationUpdateMixin as _NotificationUpdateMixin,
+)
+
+from .models import OutboxNotification
+
+
+class OutboxNotificationMixin(NotificationMixin):
+    def notify(
+        self,
+        status_code: int,
+        data: Union[List, Dict],
+        instance: models.Model = None,
+    ) -> None:
+        if not settings.NOTIFICATIONS_OUTBOX:
+            return super().notify(status_code, data, instance=instance)
+
+        if settings.NOTIFICATIONS_DISABLED or not 200 <= status_code < 300:
+            return
+
+        message = self.construct_message(data, instance=instance)
+        OutboxNotification.objects.create(
+            kanaal=message["kanaal"],
+            hoofd_object=message["hoofdObject"],
+            bericht=message,
+        )
+
+
+def outbox_atomic():
+    """
+    Store the notification in the transaction of the change, if the outbox is
+    enabled - otherwise the notification is sent within the request, which
+    should not hold a transaction open.
+    """
+    return transaction.atomic() if settings.NOTIFICATIONS_OUTBOX else nullcontext()
+
+
+class NotificationCreateMixin(OutboxNotificationMixin, _NotificationCreateMixin):
+    def create(self, request, *args, **kwargs):
+        with outbox_atomic():
+            return super().create(request, *args, **kwargs)
+
+
+class NotificationUpdateMixin(OutboxNotificationMixin, _NotificationUpdateMixin):
+    def update(self, request, *args, **kwargs):
+        with outbox_atomic():
+            return super().update(request, *args, **kwargs)
+
+
+class NotificationDestroyMixin(OutboxNotificationMixin, _NotificationDestroyMixin):
+    def destroy(self, request, *args, **kwargs):
+        with outbox_atomic():
+            return super().destroy(request, *args, **kwargs)
+
+
+class NotificationViewSetMixin(
+    NotificationCreateMixin, NotificationUpdateMixin, NotificationDestroyMixin
+):
+    pass
@@ -0,0 +1 @@
+default_app_config = "openzaak.referentielijsten.apps.ReferentielijstenConfig"
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import CachedResource
+
+
+@admin.register(CachedResource)
+class CachedResourceAdmin(admin.ModelAdmin):
+    list_display = ("url", "fetched")
+    search_fields = ("url",)
+    readonly_fields = ("fetched",)
@@ -0,0 +1,152 @@
+"""
+Local cache of the resources of the Referentielijsten API and of API specs.
+
+Validating a zaak or a (zaak/resultaat)type fetches resources of the
+Referentielijsten API - communicatiekanalen, the procestypen and resultaten
+of the selectielijst - and the API spec to check their shape. These rarely
+change, so they're cached in the database and in an in-process LRU cache.
+
+Entries older than ``settings.REFERENTIELIJSTEN_CACHE_TTL`` seconds are fetched
+again, but still used if the remote can't be reached. Together with the
+``load_referentielijsten`` command, which fills the cache from a local dump,
+this lets the validation run without network access. Set the TTL to ``0`` to
+disable the cache.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+import requests
+
+from .models import CachedResource
+
+logger = logging.getLogger(__name__)
+
+# the errors after which a stale entry is used, rather than an error
+FETCH_ERRORS = (requests.RequestException, OSError)
+
+
+class LRUCache:
+    """
+    Thread safe LRU cache of (timestamp, data) per URL.
+    """
+
+    def __init__(self):
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Tuple[float, Any]]:
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is not None:
+                self.entries.move_to_end(url)
+            return entry
+
+    def set(self, url: str, timestamp: float, data: Any) -> None:
+        with self.lock:
+            self.entries[url] = (timestamp, data)
+            self.entries.move_to_end(url)
+            while len(self.entries) > settings.REFERENTIELIJSTEN_CACHE_SIZE:
+                self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+memory_cache = LRUCache()
+
+
+def get(url: str, loader: Callable[[str], Any]) -> Any:
+    """
+    Return the (JSON) data of ``url``, from the cache or else from ``loader``.
+
+    The returned data is shared, it must not be modified.
+    """
+    ttl = settings.REFERENTIELIJSTEN_CACHE_TTL
+    if not ttl:
+        return loader(url)
+
+    now = time.time()
+    entry = memory_cache.get(url)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+
+    cached = CachedResource.objects.filter(url=url).first()
+    if cached is not None and now - cached.fetched.timestamp() < ttl:
+        memory_cache.set(url, cached.fetched.timestamp(), cached.data)
+        return cached.data
+
+    try:
+        data = loader(url)
+    except FETCH_ERRORS:
+        if cached is None:
+            raise
+        logger.warning(
+            "Could not refresh %s, using the version fetched at %s",
+            url,
+            cached.fetched,
+            exc_info=True,
+        )
+        # try again after the TTL, rather than on every validation
+        memory_cache.set(url, now, cached.data)
+        return cached.data
+
+    store(url, data)
+    memory_cache.set(url, now, data)
+    return data
+
+
+def store(url: str, data: Any) -> None:
+    try:
+        with transaction.atomic():
+            CachedResource.objects.update_or_create(
+                url=url, defaults={"data": data, "fetched": timezone.now()}
+            )
+    except IntegrityError:
+        # stored concurrently
+        pass
+
+
+def prefetch(
+    urls: Iterable[str], loader: Callable[[str], Any], workers: Optional[int] = None
+) -> Dict[str, Exception]:
+    """
+    Fetch the ``urls`` that are not in the cache (or expired) concurrently.
+
+    Only ``loader`` runs in the worker threads, the cache is read and filled in
+    the calling thread. Returns the errors by URL of the resources that could
+    not be fetched.
+    """
+    ttl = settings.REFERENTIELIJSTEN_CACHE_TTL
+    urls = set(urls)
+    if not ttl or not urls:
+        return {}
+
+    fresh = CachedResource.objects.filter(
+        url__in=urls, fetched__gt=timezone.now() - timedelta(seconds=ttl)
+    ).values_list("url", flat=True)
+    missing = sorted(urls - set(fresh))
+    if not missing:
+        return {}
+
+    errors = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(url, executor.submit(loader, url)) for url in missing]
+        for url, future in futures:
+            try:
+                data = future.result()
+            except Exception as exc:
+                errors[url] = exc
+                continue
+            store(url, data)
+            memory_cache.set(url, time.time(), data)
+    return errors
@@ -0,0 +1,60 @@
+"""
+HTTP client for the resources of the Referentielijsten API.
+
+Deriving the fields of a resultaattype needs the resultaattypeomschrijving
+and the selectielijstklasse. These are fetched through a shared session, which
+keeps the connections to the Referentielijsten API open, with a timeout, and
+cached - see :mod:`openzaak.referentielijsten.cache`.
+"""
+import threading
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import cache
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=settings.REFERENTIELIJSTEN_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def load(url: str) -> dict:
+    response = get_session().get(url, timeout=settings.REFERENTIELIJSTEN_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch(url: str) -> dict:
+    """
+    Return the (JSON) data of the resource ``url``.
+
+    Raises :class:`requests.RequestException` if it can't be fetched, or
+    :class:`ValueError` if it's not JSON. The returned data is shared, it must
+    not be modified.
+    """
+    return cache.get(url, load)
+
+
+def prefetch(
+    urls: Iterable[str], workers: Optional[int] = None
+) -> Dict[str, Exception]:
+    """
+    Fill the cache with the resources ``urls``, fetched concurrently.
+    """
+    return cache.prefetch(
+        urls, load, workers=workers or settings.REFERENTIELIJSTEN_POOL_SIZE
+    )
@@ -0,0 +1,27 @@
+import json
+
+from django.core.management import BaseCommand
+
+from ...models import CachedResource
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the cached resources of the Referentielijsten API and the API "
+        "specs to a JSON file, to load with load_referentielijsten"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("dump", help="The JSON file to write")
+
+    def handle(self, dump, **options):
+        resources = {
+            url: data
+            for url, data in CachedResource.objects.order_by("url").values_list(
+                "url", "data"
+            )
+        }
+        with open(dump, "w") as file:
+            json.dump(resources, file, indent=2)
+
+        self.stdout.write(f"Dumped {len(resources)} resource(s)")
@@ -0,0 +1,34 @@
+import json
+
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
+
+from ...cache import memory_cache, store
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the cache of the Referentielijsten API and the API specs from a "
+        "dump, a JSON object of the (JSON) data by URL - see "
+        "dump_referentielijsten"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("dump", help="The JSON file to load")
+
+    def handle(self, dump, **options):
+        try:
+            with open(dump) as file:
+                resources = json.load(file)
+        except ValueError as exc:
+            raise CommandError(f"Invalid dump: {exc}")
+
+        if not isinstance(resources, dict):
+            raise CommandError("Invalid dump: expected an object of data by URL")
+
+        with transaction.atomic():
+            for url, data in resources.items():
+                store(url, data)
+        memory_cache.clear()
+
+        self.stdout.write(f"Loaded {len(resources)} resource(s)")
@@ -0,0 +1,49 @@
+import django.contrib.postgres.fields.jsonb
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedResource",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "url",
+                    models.URLField(max_length=1000, unique=True, verbose_name="URL"),
+                ),
+                (
+                    "data",
+                    django.contrib.postgres.fields.jsonb.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="data",
+                    ),
+                ),
+                (
+                    "fetched",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="opgehaald"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "gecachte resource",
+                "verbose_name_plural": "gecachte resources",
+            },
+        ),
+    ]
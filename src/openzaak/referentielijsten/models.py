@@ -0,0 +1,23 @@
+from django.contrib.postgres.fields import JSONField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+
+class CachedResource(models.Model):
+    """
+    A resource of the Referentielijsten API, or an API spec, as it was fetched.
+    """
+
+    url = models.URLField(_("URL"), max_length=1000, unique=True)
+    # API specs are YAML, which may contain dates
+    data = JSONField(_("data"), encoder=DjangoJSONEncoder)
+    fetched = models.DateTimeField(_("opgehaald"), default=timezone.now)
+
+    class Meta:
+        verbose_name = _("gecachte resource")
+        verbose_name_plural = _("gecachte resources")
+
+    def __str__(self):
+        return self.url
@@ -0,0 +1,94 @@
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests_mock
+from rest_framework.exceptions import ValidationError
+
+from ..cache import memory_cache
+from ..models import CachedResource
+from ..validators import CachedResourceValidator
+
+SPEC_URL = "https://referentielijsten.example.com/api/v1/schema/openapi.yaml"
+KANAAL_URL = "https://referentielijsten.example.com/api/v1/communicatiekanalen/1"
+KANAAL = {"url": KANAAL_URL, "naam": "email", "omschrijving": "Email"}
+SPEC = {"openapi": "3.0.0", "components": {"schemas": {}}}
+
+
+@override_settings(REFERENTIELIJSTEN_CACHE_TTL=60)
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+class CachedResourceValidatorTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        memory_cache.clear()
+        self.addCleanup(memory_cache.clear)
+        self.validator = CachedResourceValidator("CommunicatieKanaal", SPEC_URL)
+
+    def test_resource_fetched_once(self, m_shape):
+        with requests_mock.Mocker() as m:
+            m.get(KANAAL_URL, json=KANAAL)
+            m.get(SPEC_URL, text=json.dumps(SPEC))
+
+            self.validator(KANAAL_URL)
+            memory_cache.clear()
+            self.validator(KANAAL_URL)
+
+        self.assertEqual(
+            [request.url for request in m.request_history].count(KANAAL_URL), 1
+        )
+        self.assertEqual(CachedResource.objects.get(url=KANAAL_URL).data, KANAAL)
+
+    def test_expired_refreshed(self, m_shape):
+        CachedResource.objects.create(
+            url=KANAAL_URL,
+            data={"old": True},
+            fetched=timezone.now() - timedelta(minutes=5),
+        )
+        CachedResource.objects.create(url=SPEC_URL, data=SPEC)
+
+        with requests_mock.Mocker() as m:
+            m.get(KANAAL_URL, json=KANAAL)
+            self.validator(KANAAL_URL)
+
+        self.assertEqual(CachedResource.objects.get(url=KANAAL_URL).data, KANAAL)
+
+    def test_expired_used_when_unreachable(self, m_shape):
+        CachedResource.objects.create(
+            url=KANAAL_URL, data=KANAAL, fetched=timezone.now() - timedelta(days=1)
+        )
+        CachedResource.objects.create(url=SPEC_URL, data=SPEC)
+
+        # requests_mock fails the unregistered URLs with a connection error
+        with requests_mock.Mocker():
+            self.validator(KANAAL_URL)
+
+        m_shape.assert_called_once_with(KANAAL, SPEC, "CommunicatieKanaal")
+
+    def test_error_not_cached(self, m_shape):
+        with requests_mock.Mocker() as m:
+            m.get(KANAAL_URL, status_code=404)
+
+            with self.assertRaises(ValidationError) as cm:
+                self.validator(KANAAL_URL)
+
+        self.assertEqual(cm.exception.detail[0].code, "bad-url")
+        self.assertFalse(CachedResource.objects.exists())
+
+    def test_load_dump(self, m_shape):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as dump:
+            json.dump({KANAAL_URL: KANAAL, SPEC_URL: SPEC}, dump)
+            dump.flush()
+
+            call_command("load_referentielijsten", dump.name, stdout=StringIO())
+
+        with requests_mock.Mocker() as m:
+            self.validator(KANAAL_URL)
+
+        self.assertFalse(m.called)
+        m_shape.assert_called_once_with(KANAAL, SPEC, "CommunicatieKanaal")
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.utils.module_loading import import_string
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from vng_api_common import validators
+
+from . import cache
+
+
+def get_schema(url: str) -> dict:
+    """
+    Return the (YAML) OAS 3.0.x spec at ``url``, from the cache if possible.
+    """
+    return cache.get(url, lambda url: validators.fetcher.fetch(url))
+
+
+class CachedResourceValidator(validators.ResourceValidator):
+    """
+    Validate that the URL resolves to an instance of the external resource.
+
+    Like :class:`vng_api_common.validators.ResourceValidator`, but the
+    resource and the API spec are read from the local cache of the
+    Referentielijsten API if possible.
+    """
+
+    resource_message = _(
+        "The URL {url} resource did not look like a(n) `{resource}`. Please provide a valid URL."
+    )
+    resource_code = "invalid-resource"
+
+    def __call__(self, url: str):
+        try:
+            obj = cache.get(url, self.fetch)
+        except serializers.ValidationError:
+            raise
+        except Exception as exc:
+            raise serializers.ValidationError(
+                _("The URL {url} could not be fetched. Exception: {exc}").format(
+                    url=url, exc=exc
+                ),
+                code=self.code,
+            )
+
+        schema = get_schema(self.oas_schema)
+        if not validators.obj_has_shape(obj, schema, self.resource):
+            raise serializers.ValidationError(
+                self.resource_message.format(url=url, resource=self.resource),
+                code=self.resource_code,
+            )
+
+    def fetch(self, url: str) -> dict:
+        link_fetcher = import_string(settings.LINK_FETCHER)
+
+        extra = self.extra.copy()
+        if self.get_auth:
+            extra["headers"] = {**extra.get("headers", {}), **self.get_auth(url)}
+
+        response = link_fetcher(url, **extra)
+        if response.status_code != 200:
+            raise serializers.ValidationError(
+                self.message.format(status_code=response.status_code, url=url),
+                code=self.code,
+            )
+
+        try:
+            return response.json()
+        except ValueError:
+            raise serializers.ValidationError(
+                self.resource_message.format(url=url, resource=self.resource),
+                code=self.resource_code,
+            )
@@ -0,0 +1,18 @@
+from django.conf import settings
+
+# backends of which the entries are not shared by the processes (or not stored
+# at all)
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def is_shared_cache(alias: str) -> bool:
+    """
+    Return whether the cache ``alias`` is shared by all processes.
+
+    Caches which are explicitly invalidated (or versioned) on writes must be
+    shared, otherwise the other processes keep using stale entries.
+    """
+    return settings.CACHES[alias]["BACKEND"] not in LOCAL_CACHE_BACKENDS
@@ -76,3 +76,80 @@ def check_missing_init_files(app_configs, **kwargs):
         )
 
     return errors
+
+
+@register
+def check_autorisaties_filter_engine(app_configs, **kwargs):
+    """
+    Check that a known engine is configured to filter on authorizations.
+    """
+    engines = ("indexed", "case")
+    if settings.AUTORISATIES_FILTER_ENGINE in engines:
+        return []
+
+    return [
+        Error(
+            "Unknown AUTORISATIES_FILTER_ENGINE %r"
+            % settings.AUTORISATIES_FILTER_ENGINE,
+            hint="Use one of: %s" % ", ".join(engines),
+            id="utils.E002",
+        )
+    ]
+
+
+@register
+def check_inhoud_checksum_algoritme(app_configs, **kwargs):
+    """
+    Check that the checksum of the document content can be computed.
+    """
+    from openzaak.components.documenten.checksums import HASHLIB_ALGORITHMS
+
+    if settings.INHOUD_CHECKSUM_ALGORITME in HASHLIB_ALGORITHMS:
+        return []
+
+    return [
+        Error(
+            "Unsupported INHOUD_CHECKSUM_ALGORITME %r"
+            % settings.INHOUD_CHECKSUM_ALGORITME,
+            hint="Use one of: %s" % ", ".join(HASHLIB_ALGORITHMS),
+            id="utils.E003",
+        )
+    ]
+
+
+@register
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Check that the caches which are invalidated on writes are shared.
+    """
+    from .cache import is_shared_cache
+
+    errors = []
+
+    if settings.AUTORISATIES_CACHE_TIMEOUT and not is_shared_cache(
+        settings.AUTORISATIES_CACHE
+    ):
+        errors.append(
+            Error(
+                "AUTORISATIES_CACHE %r is not shared by the processes"
+                % settings.AUTORISATIES_CACHE,
+                hint="Configure a shared cache backend, or set "
+                "AUTORISATIES_CACHE_TIMEOUT to 0",
+                id="utils.E004",
+            )
+        )
+
+    if settings.CATALOGI_SNAPSHOT_TIMEOUT and not is_shared_cache(
+        settings.CATALOGI_SNAPSHOT_CACHE
+    ):
+        errors.append(
+            Error(
+                "CATALOGI_SNAPSHOT_CACHE %r is not shared by the processes"
+                % settings.CATALOGI_SNAPSHOT_CACHE,
+                hint="Configure a shared cache backend, or set "
+                "CATALOGI_SNAPSHOT_TIMEOUT to 0",
+                id="utils.E005",
+            )
+        )
+
+    return errors
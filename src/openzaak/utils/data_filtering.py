@@ -1,3 +1,198 @@
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.scopes import Scope
+from vng_api_common.utils import get_viewset_for_path
+
+UrlResolver = Callable[[Iterable[str]], Dict[str, int]]
+
+# stable, numeric ordering of the vertrouwelijkheidaanduiding values, from
+# least to most confidential. This is stored in the database, so it must not
+# depend on the (process dependent) ``ChoiceItem.order`` counter.
+VA_ORDER = {
+    value: order
+    for order, (value, _label) in enumerate(VertrouwelijkheidsAanduiding.choices, 1)
+}
+
+
+def get_va_order(vertrouwelijkheidaanduiding: str) -> Optional[int]:
+    return VA_ORDER.get(vertrouwelijkheidaanduiding)
+
+
+def get_va_order_expression(field_name: str) -> Case:
+    """
+    Map the vertrouwelijkheidaanduiding in ``field_name`` to its order in SQL.
+    """
+    whens = [
+        When(**{field_name: value}, then=Value(order))
+        for value, order in VA_ORDER.items()
+    ]
+    return Case(*whens, output_field=IntegerField())
+
+
+def get_resource_pks(urls: Iterable[str]) -> Dict[str, int]:
+    """
+    Resolve API resource URLs to the primary keys of the local objects.
+
+    All URLs are matched against the URL patterns first, and the objects are
+    then looked up with one query per viewset, rather than one query per URL.
+    URLs that don't resolve to an existing object are left out.
+    """
+    lookups = defaultdict(lambda: defaultdict(list))
+    viewsets = {}
+    for url in set(urls):
+        if not url:
+            continue
+
+        path = urlparse(url).path
+        if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+            path = path[len(settings.FORCE_SCRIPT_NAME) :]
+
+        try:
+            viewset = get_viewset_for_path(path)
+        except ObjectDoesNotExist:
+            continue
+
+        viewset_class = type(viewset)
+        viewsets.setdefault(viewset_class, viewset)
+
+        lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+        model_field = viewset.queryset.model._meta.get_field(viewset.lookup_field)
+        try:
+            value = model_field.to_python(viewset.kwargs[lookup_url_kwarg])
+        except (KeyError, ValidationError):
+            continue
+
+        lookups[viewset_class][value].append(url)
+
+    pks = {}
+    for viewset_class, urls_by_value in lookups.items():
+        viewset = viewsets[viewset_class]
+        lookup_field = viewset.lookup_field
+        objects = (
+            viewset.get_queryset()
+            .filter(**{f"{lookup_field}__in": list(urls_by_value)})
+            .values_list(lookup_field, "pk")
+        )
+        for value, pk in objects:
+            pks.update({url: pk for url in urls_by_value[value]})
+    return pks
+
+
+def get_authorized_pks(
+    scope: Scope,
+    authorizations: List[Autorisatie],
+    field_name: str,
+    resolve_urls: UrlResolver = get_resource_pks,
+) -> Dict[int, Optional[int]]:
+    """
+    Map the PKs of the authorized ``field_name`` objects to the maximum
+    ``vertrouwelijkheidaanduiding`` order that applies.
+
+    Only the authorizations that grant ``scope`` are taken into account. If
+    several authorizations apply to the same object, the least strict
+    confidentiality level wins. The order is ``None`` for authorizations
+    without ``max_vertrouwelijkheidaanduiding``.
+    """
+    authorizations = [
+        authorization
+        for authorization in authorizations
+        if scope.is_contained_in(authorization.scopes)
+    ]
+    pks = resolve_urls(
+        [getattr(authorization, field_name) for authorization in authorizations]
+    )
+
+    authorized = {}
+    for authorization in authorizations:
+        pk = pks.get(getattr(authorization, field_name))
+        if pk is None:
+            continue
+
+        order = get_va_order(authorization.max_vertrouwelijkheidaanduiding)
+        if pk not in authorized or (order or 0) > (authorized[pk] or 0):
+            authorized[pk] = order
+    return authorized
+
+
+def filter_by_authorized_types(
+    queryset: models.QuerySet,
+    authorized: Dict[int, Optional[int]],
+    type_field: str,
+    prefix: str = "",
+    with_vertrouwelijkheidaanduiding: bool = True,
+) -> models.QuerySet:
+    """
+    Limit ``queryset`` to the authorized types and confidentiality levels.
+
+    :param authorized: the PKs of the authorized types mapped to the maximum
+      vertrouwelijkheidaanduiding order, see :func:`get_authorized_pks`
+    :param type_field: name of the type foreign key, e.g. ``zaaktype``
+    :param prefix: lookup prefix to reach ``type_field`` and the confidentiality
+      fields, e.g. ``zaak__``
+    :param with_vertrouwelijkheidaanduiding: whether the
+      vertrouwelijkheidaanduiding of the objects must be checked
+
+    Depending on ``settings.AUTORISATIES_FILTER_ENGINE``, the confidentiality
+    level is checked with:
+
+    * ``"indexed"``: the stored ``va_order`` column, with one
+      ``(type IN (...) AND va_order <= n)`` condition per distinct maximum
+      level. This can use the (type, va_order) index.
+    * ``"case"``: a ``CASE`` expression mapping the vertrouwelijkheidaanduiding
+      to its order, compared with a ``CASE`` over the types. This is evaluated
+      for every row.
+    """
+    type_lookup = f"{prefix}{type_field}"
+
+    if not with_vertrouwelijkheidaanduiding:
+        return queryset.filter(**{f"{type_lookup}__in": list(authorized)})
+
+    pks_by_order = defaultdict(list)
+    for pk, order in authorized.items():
+        # without max_vertrouwelijkheidaanduiding, nothing is allowed
+        if order is not None:
+            pks_by_order[order].append(pk)
+
+    if not pks_by_order:
+        return queryset.none()
+
+    if settings.AUTORISATIES_FILTER_ENGINE == "indexed":
+        condition = Q()
+        for order, pks in pks_by_order.items():
+            condition |= Q(
+                **{f"{type_lookup}__in": pks, f"{prefix}va_order__lte": order}
+            )
+        return queryset.filter(condition)
+
+    # annotate the queryset so we can map a string value to a logical number
+    order_case = get_va_order_expression(f"{prefix}vertrouwelijkheidaanduiding")
+    # build the case/when to map the max_vertrouwelijkheidaanduiding based
+    # on the type
+    whens = [
+        When(**{f"{type_lookup}__in": pks}, then=Value(order))
+        for order, pks in pks_by_order.items()
+    ]
+    # filtering:
+    # * only allow the white-listed types, explicitly
+    # * apply the filtering to limit objects within types to the maximal
+    #   confidentiality level
+    return queryset.annotate(_va_order=order_case).filter(
+        **{
+            f"{type_lookup}__in": [pk for pks in pks_by_order.values() for pk in pks],
+            "_va_order__lte": Case(*whens, output_field=IntegerField()),
+        }
+    )
+
+
 class ListFilterByAuthorizationsMixin:
     """
     Filter list-action data by the authorizations configured.
@@ -37,4 +232,8 @@ class ListFilterByAuthorizationsMixin:
         component = base.model._meta.app_label
         authorizations = self.request.jwt_auth.get_autorisaties(component)
 
-        return base.filter_for_authorizations(scope_needed, authorizations)
+        return base.filter_for_authorizations(
+            scope_needed,
+            authorizations,
+            resolve_urls=self.request.jwt_auth.get_resource_pks,
+        )
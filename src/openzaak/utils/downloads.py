@@ -0,0 +1,170 @@
+"""
+Serve (private) files with support for conditional and range requests.
+
+With an offloading ``SENDFILE_BACKEND`` (nginx ``X-Accel-Redirect``, Apache
+``X-Sendfile``), the web server sends the bytes and handles the ``Range``
+header itself. With the in-process backends, the file is streamed from Python
+and single byte ranges are answered with ``206 Partial Content``.
+
+Conditional requests (``If-None-Match``, ``If-Modified-Since``, ``If-Match``)
+are evaluated in Django for all backends, so the web server is not even
+involved for ``304 Not Modified`` responses.
+"""
+import os
+import re
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from sendfile import sendfile
+
+# backends that send the file from the Python process
+IN_PROCESS_BACKENDS = ("sendfile.backends.simple", "sendfile.backends.development")
+
+RANGE_RE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+CHUNK_SIZE = 64 * 2 ** 10
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a ``Range`` header into the (inclusive) first and last byte.
+
+    Only single byte ranges are supported, ``None`` is returned for other
+    (or invalid) ranges, which means the complete file must be sent.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    start, end = match.group("start"), match.group("end")
+    if not start:
+        # suffix range, the last ``end`` bytes
+        if not end:
+            return None
+        if int(end) == 0:
+            raise RangeNotSatisfiable
+        return max(size - int(end), 0), size - 1
+
+    start = int(start)
+    if end and int(end) < start:
+        # syntactically invalid, which means the header must be ignored
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    end = min(int(end), size - 1) if end else size - 1
+    return start, end
+
+
+def iter_range(filename: str, start: int, length: int):
+    with open(filename, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def is_range_current(request, etag: str, last_modified: Optional[int]) -> bool:
+    """
+    Evaluate the ``If-Range`` header - the range only applies if the file
+    wasn't changed.
+    """
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+
+    if if_range.startswith('"') or if_range.startswith("W/"):
+        # only strong validators match
+        return if_range == etag
+
+    return last_modified is not None and parse_http_date_safe(if_range) == (
+        last_modified
+    )
+
+
+def stream_file(
+    request, filename: str, etag: str, last_modified: Optional[int], **kwargs
+) -> HttpResponse:
+    size = os.path.getsize(filename)
+
+    byte_range = None
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and is_range_current(request, etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        return FileResponse(open(filename, "rb"), **kwargs)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(
+        iter_range(filename, start, length),
+        status=206,
+        content_type=kwargs.get("content_type"),
+    )
+    response["Content-Length"] = length
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    if kwargs.get("as_attachment"):
+        response["Content-Disposition"] = 'attachment; filename="{}"'.format(
+            kwargs.get("filename") or os.path.basename(filename)
+        )
+    return response
+
+
+def serve_file(
+    request,
+    filename: str,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    content_type: str = "application/octet-stream",
+) -> HttpResponse:
+    """
+    Send the file ``filename`` as an attachment.
+
+    :param etag: a strong validator of the file content, unquoted
+    :param last_modified: the moment the file was last changed
+    """
+    if not os.path.exists(filename):
+        raise Http404(f"{filename} does not exist")
+
+    etag = quote_etag(etag)
+    last_modified = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if settings.SENDFILE_BACKEND in IN_PROCESS_BACKENDS:
+            response = stream_file(
+                request,
+                filename,
+                etag,
+                last_modified,
+                as_attachment=True,
+                content_type=content_type,
+            )
+        else:
+            response = sendfile(
+                request, filename, attachment=True, mimetype=content_type
+            )
+
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    if response.status_code in (200, 206):
+        response["Accept-Ranges"] = "bytes"
+    return response
@@ -0,0 +1,125 @@
+"""
+Helpers for the bulk import commands.
+
+Resources created by an import get an audit trail and a notification like
+they do when they're created through the API. The audit trails are stored
+with :func:`openzaak.audittrails.buffer.store_audittrail` (use an
+``AuditTrailBuffer`` to insert them in bulk) and the notifications are
+returned as unsaved outbox notifications, to be inserted in bulk as well.
+"""
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import models
+from django.test import RequestFactory
+from django.utils import timezone
+
+from djangorestframework_camel_case.util import camelize
+from rest_framework.request import Request
+from rest_framework.versioning import URLPathVersioning
+from vng_api_common.audittrails.audits import Audit
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.notifications.api.serializers import NotificatieSerializer
+from vng_api_common.notifications.kanalen import Kanaal
+from vng_api_common.utils import generate_unique_identification
+
+from openzaak.audittrails.buffer import store_audittrail
+from openzaak.notifications.models import OutboxNotification
+
+
+def get_request() -> Request:
+    """
+    Return a request to build the absolute URLs of the resources with.
+    """
+    domain = Site.objects.get_current().domain
+    request = Request(
+        RequestFactory().get("/", HTTP_HOST=domain, secure=settings.IS_HTTPS)
+    )
+    request.versioning_scheme = URLPathVersioning()
+    request.version = settings.REST_FRAMEWORK["DEFAULT_VERSION"]
+    return request
+
+
+def record_create(
+    audit: Audit,
+    kanaal: Kanaal,
+    instance: models.Model,
+    data: dict,
+    main_object: models.Model,
+    main_object_data: dict,
+    toelichting: str = "",
+) -> OutboxNotification:
+    """
+    Store the audit trail and return the notification of a created resource.
+
+    :param data: the representation of the created resource
+    :param main_object_data: the representation of the main resource of the
+      ``kanaal`` - the same as ``data`` for a main resource
+    """
+    resource = instance._meta.model_name
+    main_object_url = main_object_data["url"]
+
+    store_audittrail(
+        AuditTrail(
+            bron=audit.component_name,
+            actie=CommonResourceAction.create,
+            actie_weergave=CommonResourceAction.labels[CommonResourceAction.create],
+            resultaat=201,
+            hoofd_object=main_object_url,
+            resource=resource,
+            resource_url=data["url"],
+            toelichting=toelichting,
+            resource_weergave=instance.unique_representation(),
+            oud=None,
+            nieuw=data,
+        )
+    )
+
+    message = NotificatieSerializer(
+        instance={
+            "kanaal": kanaal.label,
+            "hoofd_object": main_object_url,
+            "resource": resource,
+            "resource_url": data["url"],
+            "actie": CommonResourceAction.create,
+            "aanmaakdatum": timezone.now(),
+            "kenmerken": kanaal.get_kenmerken(main_object, main_object_data),
+        }
+    )
+    message = camelize(message.data)
+    return OutboxNotification(
+        kanaal=kanaal.label, hoofd_object=main_object_url, bericht=message
+    )
+
+
+class IdentificatieGenerator:
+    """
+    Generate the missing identificaties of objects that are inserted in bulk.
+
+    Like ``generate_unique_identification``, but the generated numbers are
+    tracked per year, since none of the objects of a batch is in the
+    database yet. Call :meth:`reset` when a batch is rolled back.
+    """
+
+    def __init__(self, date_field_name: str):
+        self.date_field_name = date_field_name
+        self.reset()
+
+    def reset(self) -> None:
+        self.issued: Dict[int, Tuple[str, int]] = {}
+
+    def set_identificatie(self, instance: models.Model) -> None:
+        if instance.identificatie:
+            return
+
+        year = getattr(instance, self.date_field_name).year
+        if year not in self.issued:
+            first = generate_unique_identification(instance, self.date_field_name)
+            prefix, number = first.rsplit("-", 1)
+            self.issued[year] = (prefix, int(number) - 1)
+
+        prefix, number = self.issued[year]
+        self.issued[year] = (prefix, number + 1)
+        instance.identificatie = f"{prefix}-{number + 1:010d}"
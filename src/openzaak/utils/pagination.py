@@ -0,0 +1,300 @@
+"""
+Pagination of the list endpoints.
+
+Lists are paginated by page number, like the standards describe. Clients that
+walk through large lists can opt in to keyset ("cursor") pagination with the
+``cursor`` query parameter - empty for the first page. The next and previous
+links then contain a cursor with the position in the ordering of the list,
+instead of an offset: deep pages are as fast as the first one, and rows that
+are inserted or deleted in the meantime don't shift the pages.
+
+With the ``count`` query parameter, the ``count`` of the response is
+``exact`` (the default), an ``estimate`` of the query planner or ``none``
+(``null``). Counting all rows of large lists is expensive, in both modes.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import connections, models
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CountModes:
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+    choices = (exact, estimate, none)
+
+
+def estimate_count(queryset: models.QuerySet) -> int:
+    """
+    Return the number of rows the query planner expects the queryset to return.
+    """
+    # QuerySet.explain joins the rows of the output with str(), which doesn't
+    # produce JSON - psycopg2 decodes the plan to a list already
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+def get_ordering(queryset: models.QuerySet) -> Optional[List[Tuple[str, bool]]]:
+    """
+    Return the (field, descending) pairs the queryset is ordered by.
+
+    The primary key is added, so every row has a unique position. Returns
+    ``None`` if the ordering is not supported: random, or by expressions.
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    if not all(isinstance(field, str) for field in ordering) or "?" in ordering:
+        return None
+
+    fields = [
+        (get_column(queryset.model, field.lstrip("-")), field.startswith("-"))
+        for field in ordering
+    ]
+    if not any(name == "pk" for name, _descending in fields):
+        fields.append(("pk", fields[-1][1] if fields else False))
+    return fields
+
+
+def get_column(model, name: str) -> str:
+    """
+    Return the name to order by the column of ``name`` rather than the
+    ordering of a related model.
+    """
+    if name in ("pk", model._meta.pk.name):
+        return "pk"
+    if "__" in name:
+        return name
+    field = model._meta.get_field(name)
+    return field.attname if field.is_relation else name
+
+
+def get_after_filter(fields: List[Tuple[str, bool]], position: list) -> models.Q:
+    """
+    Return the filter on the rows after ``position`` in the ordering ``fields``.
+
+    PostgreSQL sorts ``NULL`` after all values in ascending order and before
+    all values in descending order.
+    """
+    after = models.Q(pk__in=[])
+    equal = models.Q()
+    for (name, descending), value in zip(fields, position):
+        if value is None:
+            field_after = (
+                models.Q(**{f"{name}__isnull": False})
+                if descending
+                else models.Q(pk__in=[])
+            )
+            field_equal = models.Q(**{f"{name}__isnull": True})
+        else:
+            field_after = (
+                models.Q(**{f"{name}__lt": value})
+                if descending
+                else models.Q(**{f"{name}__gt": value})
+                | models.Q(**{f"{name}__isnull": True})
+            )
+            field_equal = models.Q(**{name: value})
+
+        after |= equal & field_after
+        equal &= field_equal
+    return after
+
+
+class OptionalCursorPagination(pagination.PageNumberPagination):
+    """
+    Paginate by page number, or by cursor if the client asks.
+    """
+
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.count_mode = request.query_params.get(self.count_query_param)
+        if self.count_mode not in CountModes.choices:
+            self.count_mode = CountModes.exact
+
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        self.ordering = get_ordering(queryset) if self.cursor_mode else None
+        if self.cursor_mode and self.ordering is None:
+            self.cursor_mode = False
+
+        if self.cursor_mode:
+            return self.paginate_by_cursor(queryset, request)
+        if self.count_mode == CountModes.exact:
+            return super().paginate_queryset(queryset, request, view=view)
+        return self.paginate_without_count(queryset, request)
+
+    def paginate_by_cursor(self, queryset, request) -> list:
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(
+            request.query_params[self.cursor_query_param]
+        )
+        self.position = position
+        self.reverse = reverse
+        self.count = self.get_count(queryset)
+
+        ordering = [(name, descending != reverse) for name, descending in self.ordering]
+        if position is not None:
+            # the values of the cursor are only validated by the fields
+            try:
+                queryset = queryset.filter(get_after_filter(ordering, position))
+            except (ValueError, TypeError, ValidationError):
+                raise NotFound(self.invalid_cursor_message)
+        queryset = queryset.order_by(
+            *[f"-{name}" if descending else name for name, descending in ordering]
+        )
+        # the values of the ordering fields, to build the cursors with
+        queryset = queryset.annotate(
+            **{
+                f"_cursor_{index}": models.F(name)
+                for index, (name, _descending) in enumerate(ordering)
+            }
+        )
+
+        rows = list(queryset[: page_size + 1])
+        self.has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+        self.rows = rows
+        return rows
+
+    def paginate_without_count(self, queryset, request) -> list:
+        page_size = self.get_page_size(request)
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.page_number = 0
+        if self.page_number < 1:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=self.page_number, message=""
+                )
+            )
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if self.page_number > 1 and not rows:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=self.page_number,
+                    message=_("That page contains no results"),
+                )
+            )
+        self.count = self.get_count(queryset)
+        self.has_more = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_count(self, queryset) -> Optional[int]:
+        if self.count_mode == CountModes.exact:
+            return queryset.count()
+        if self.count_mode == CountModes.estimate:
+            return estimate_count(queryset)
+        return None
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode and self.count_mode == CountModes.exact:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.count),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if self.cursor_mode:
+            if self.reverse:
+                # the page before the position the client came from
+                position = (
+                    self.get_position(self.rows[-1]) if self.rows else self.position
+                )
+                return self.get_cursor_link(position, reverse=False)
+            if not self.has_more:
+                return None
+            return self.get_cursor_link(self.get_position(self.rows[-1]), reverse=False)
+
+        if self.count_mode == CountModes.exact:
+            return super().get_next_link()
+        if not self.has_more:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.cursor_mode:
+            if self.reverse:
+                if not self.has_more:
+                    return None
+                return self.get_cursor_link(
+                    self.get_position(self.rows[0]), reverse=True
+                )
+            if self.position is None:
+                return None
+            position = self.get_position(self.rows[0]) if self.rows else self.position
+            return self.get_cursor_link(position, reverse=True)
+
+        if self.count_mode == CountModes.exact:
+            return super().get_previous_link()
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_position(self, instance) -> list:
+        return [
+            getattr(instance, f"_cursor_{index}") for index in range(len(self.ordering))
+        ]
+
+    def get_cursor_link(self, position: list, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position, reverse)
+        )
+
+    @staticmethod
+    def encode_cursor(position: list, reverse: bool) -> str:
+        # str() keeps the microseconds of datetimes, unlike DjangoJSONEncoder
+        data = json.dumps({"p": position, "r": reverse}, default=str)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple[Optional[list], bool]:
+        """
+        Return the position and the direction of the cursor.
+
+        An empty cursor is the start of the list.
+        """
+        if not cursor:
+            return None, False
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            position, reverse = data["p"], bool(data["r"])
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
@@ -1,14 +1,60 @@
+from typing import Union
 from urllib.parse import urlparse
 
 from django.core.exceptions import ImproperlyConfigured
+from django.db import models
 from django.utils.module_loading import import_string
 
 from rest_framework import permissions
 from rest_framework.request import Request
+from rest_framework.reverse import reverse
 from vng_api_common.permissions import bypass_permissions, get_required_scopes
 from vng_api_common.utils import get_resource_for_path
 
 
+def get_permission_fields_data(
+    obj: Union[models.Model, models.QuerySet], field_names, request: Request
+) -> dict:
+    """
+    Resolve the values of ``field_names`` as the main resource serializer would.
+
+    Relations to catalogi resources (``zaaktype``, ``besluittype``...) are
+    represented as their absolute detail URL, other fields as their plain value.
+
+    :param obj: a model instance, or a queryset of which the first row is used.
+      Relations not cached on a model instance are fetched (and cached) on
+      access. For a queryset, everything is resolved in a single ``.values()``
+      query.
+    :param field_names: the names of the model fields to resolve
+    :param request: the current request, used to build absolute URLs
+    """
+    if isinstance(obj, models.QuerySet):
+        model = obj.model
+        lookups = {
+            name: f"{name}__uuid" if model._meta.get_field(name).is_relation else name
+            for name in field_names
+        }
+        values = obj.values(*lookups.values()).first() or {}
+        raw = {name: values.get(lookup) for name, lookup in lookups.items()}
+    else:
+        model = type(obj)
+        raw = {}
+        for name in field_names:
+            value = getattr(obj, name)
+            if model._meta.get_field(name).is_relation and value is not None:
+                value = value.uuid
+            raw[name] = value
+
+    data = {}
+    for name, value in raw.items():
+        field = model._meta.get_field(name)
+        if field.is_relation and value is not None:
+            view_name = f"{field.related_model._meta.model_name}-detail"
+            value = reverse(view_name, kwargs={"uuid": value}, request=request)
+        data[name] = value
+    return data
+
+
 class AuthRequired(permissions.BasePermission):
     """
     Look at the scopes required for the current action
@@ -25,10 +71,14 @@ class AuthRequired(permissions.BasePermission):
         return {field: data.get(field) for field in self.permission_fields}
 
     def format_data(self, obj, request) -> dict:
-        main_resource = self.get_main_resource()
-        serializer_class = main_resource.serializer_class
-        serializer = serializer_class(obj, context={"request": request})
-        return serializer.data
+        """
+        Project the ``permission_fields`` of the main object.
+
+        Only the fields needed for the permission check are resolved, rather
+        than rendering the full main resource serializer with all its nested
+        and related resources.
+        """
+        return get_permission_fields_data(obj, self.permission_fields, request)
 
     def get_main_resource(self):
         if not self.main_resource:
@@ -1,5 +1,9 @@
+from django.conf import settings
 from django.db.models import Model
 
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.versioning import URLPathVersioning
 from vng_api_common.authorizations.models import Applicatie, Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.models import JWTSecret
@@ -74,3 +78,16 @@ class JWTAuthMixin:
             user_representation=self.user_representation,
         )
         self.client.credentials(HTTP_AUTHORIZATION=token)
+
+
+def get_versioned_request(path: str = "/") -> Request:
+    """
+    Build a DRF request that can reverse (versioned) API URLs.
+
+    Useful to call serializers and permission classes directly, outside of the
+    request-response cycle.
+    """
+    request = Request(APIRequestFactory().get(path))
+    request.versioning_scheme = URLPathVersioning()
+    request.version = settings.REST_FRAMEWORK["DEFAULT_VERSION"]
+    return request